@@ -27,6 +27,7 @@ from .entities import (
     get_last_versions,
     get_last_version_by_subset_id,
     get_last_version_by_subset_name,
+    get_newest_version_id,
     get_output_link_versions,
 
     version_is_latest,
@@ -45,6 +46,11 @@ from .entities import (
     get_workfile_info,
 )
 
+from .entity_cache import (
+    entity_cache,
+    get_entity_change_counter,
+)
+
 from .entity_links import (
     get_linked_asset_ids,
     get_linked_assets,
@@ -83,6 +89,7 @@ __all__ = (
     "get_last_versions",
     "get_last_version_by_subset_id",
     "get_last_version_by_subset_name",
+    "get_newest_version_id",
     "get_output_link_versions",
 
     "version_is_latest",
@@ -100,6 +107,9 @@ __all__ = (
 
     "get_workfile_info",
 
+    "entity_cache",
+    "get_entity_change_counter",
+
     "get_linked_asset_ids",
     "get_linked_assets",
     "get_linked_representation_id",
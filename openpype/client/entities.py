@@ -13,6 +13,11 @@ import six
 from bson.objectid import ObjectId
 
 from .mongo import get_project_database, get_project_connection
+from .entity_cache import (
+    ProjectEntityCache,
+    get_entity_cache,
+    project_document_fields,
+)
 
 PatternType = type(re.compile(""))
 
@@ -34,6 +39,76 @@ def _prepare_fields(fields, required_fields=None):
     return output
 
 
+def _find_one(project_name, query_filter, fields, cache_lookup=None):
+    """Find one document using entity cache if is enabled.
+
+    Full document is queried and stored to cache if cache of the project is
+    enabled and 'cache_lookup' did not find the document.
+
+    Args:
+        project_name (str): Name of project where to look for queried entity.
+        query_filter (dict[str, Any]): Mongo query filter.
+        fields (Optional[Iterable[str]]): Fields that should be returned.
+        cache_lookup (Optional[Callable[[ProjectEntityCache], dict]]): Lookup
+            of document in entity cache.
+
+    Returns:
+        Union[dict[str, Any], None]: Found document.
+    """
+
+    conn = get_project_connection(project_name)
+    cache = None
+    if cache_lookup is not None:
+        cache = get_entity_cache(project_name)
+
+    if cache is None:
+        return conn.find_one(query_filter, _prepare_fields(fields))
+
+    doc = cache_lookup(cache)
+    if doc is None:
+        doc = conn.find_one(query_filter)
+        if doc is None:
+            return None
+        cache.add_doc(doc)
+    return project_document_fields(doc, fields)
+
+
+def _find_by_ids(project_name, query_filter, entity_ids, entity_types, fields):
+    """Find documents by ids using entity cache if is enabled.
+
+    Only documents which are not cached are queried from database.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        query_filter (dict[str, Any]): Mongo query filter which contains
+            the filter by ids.
+        entity_ids (list[ObjectId]): Converted ids of queried entities.
+        entity_types (Iterable[str]): Allowed entity types.
+        fields (Optional[Iterable[str]]): Fields that should be returned.
+
+    Returns:
+        Union[Cursor, list[dict[str, Any]]]: Found documents.
+    """
+
+    conn = get_project_connection(project_name)
+    cache = get_entity_cache(project_name)
+    if cache is None:
+        return conn.find(query_filter, _prepare_fields(fields))
+
+    docs, missing_ids = cache.get_by_ids(entity_ids, entity_types)
+    if missing_ids:
+        query_filter = dict(query_filter)
+        query_filter["_id"] = {"$in": missing_ids}
+        queried_docs = list(conn.find(query_filter))
+        cache.add_docs(queried_docs)
+        docs.extend(queried_docs)
+
+    return [
+        project_document_fields(doc, fields)
+        for doc in docs
+    ]
+
+
 def convert_id(in_id):
     """Helper function for conversion of id from string to ObjectId.
 
@@ -131,8 +206,12 @@ def get_project(project_name, active=True, inactive=True, fields=None):
             {"data.active": False},
         ]
 
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    cache_lookup = None
+    # Use cache only if query is not filtered by active state
+    if active and inactive:
+        cache_lookup = ProjectEntityCache.get_project
+
+    return _find_one(project_name, query_filter, fields, cache_lookup)
 
 
 def get_whole_project(project_name):
@@ -170,8 +249,12 @@ def get_asset_by_id(project_name, asset_id, fields=None):
         return None
 
     query_filter = {"type": "asset", "_id": asset_id}
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        lambda cache: cache.get_by_id(asset_id, ("asset", ))
+    )
 
 
 def get_asset_by_name(project_name, asset_name, fields=None):
@@ -193,8 +276,12 @@ def get_asset_by_name(project_name, asset_name, fields=None):
         return None
 
     query_filter = {"type": "asset", "name": asset_name}
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        lambda cache: cache.get_by_name("asset", asset_name, None)
+    )
 
 
 # NOTE this could be just public function?
@@ -263,6 +350,11 @@ def _get_assets(
             return []
         query_filter["data.visualParent"] = {"$in": parent_ids}
 
+    if asset_ids is not None and asset_names is None and parent_ids is None:
+        return _find_by_ids(
+            project_name, query_filter, asset_ids, asset_types, fields
+        )
+
     conn = get_project_connection(project_name)
 
     return conn.find(query_filter, _prepare_fields(fields))
@@ -404,8 +496,12 @@ def get_subset_by_id(project_name, subset_id, fields=None):
         return None
 
     query_filters = {"type": "subset", "_id": subset_id}
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filters, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filters,
+        fields,
+        lambda cache: cache.get_by_id(subset_id, ("subset", ))
+    )
 
 
 def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
@@ -435,8 +531,12 @@ def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
         "name": subset_name,
         "parent": asset_id
     }
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filters, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filters,
+        fields,
+        lambda cache: cache.get_by_name("subset", subset_name, asset_id)
+    )
 
 
 def get_subsets(
@@ -508,6 +608,16 @@ def get_subsets(
             return []
         query_filter["$or"] = or_query
 
+    if (
+        subset_ids is not None
+        and asset_ids is None
+        and subset_names is None
+        and names_by_asset_ids is None
+    ):
+        return _find_by_ids(
+            project_name, query_filter, subset_ids, subset_types, fields
+        )
+
     conn = get_project_connection(project_name)
     return conn.find(query_filter, _prepare_fields(fields))
 
@@ -571,8 +681,14 @@ def get_version_by_id(project_name, version_id, fields=None):
         "type": {"$in": ["version", "hero_version"]},
         "_id": version_id
     }
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        lambda cache: cache.get_by_id(
+            version_id, ("version", "hero_version")
+        )
+    )
 
 
 def get_version_by_name(project_name, version, subset_id, fields=None):
@@ -595,13 +711,17 @@ def get_version_by_name(project_name, version, subset_id, fields=None):
     if not subset_id:
         return None
 
-    conn = get_project_connection(project_name)
     query_filter = {
         "type": "version",
         "parent": subset_id,
         "name": version
     }
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        lambda cache: cache.get_by_name("version", version, subset_id)
+    )
 
 
 def version_is_latest(project_name, version_id):
@@ -685,6 +805,11 @@ def _get_versions(
         else:
             query_filter["name"] = {"$in": versions}
 
+    if version_ids is not None and subset_ids is None and versions is None:
+        return _find_by_ids(
+            project_name, query_filter, version_ids, version_types, fields
+        )
+
     conn = get_project_connection(project_name)
 
     return conn.find(query_filter, _prepare_fields(fields))
@@ -878,6 +1003,45 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
         if not fields:
             return {}
 
+    cache = get_entity_cache(project_name)
+    if cache is not None:
+        return _get_cached_last_versions(
+            cache, project_name, subset_ids, active, fields
+        )
+    return _get_last_versions(project_name, subset_ids, active, fields)
+
+
+def _get_cached_last_versions(
+    cache, project_name, subset_ids, active, fields
+):
+    output = {}
+    missing_subset_ids = []
+    for subset_id in subset_ids:
+        version_doc = cache.get_last_version(subset_id, active)
+        if version_doc is None:
+            missing_subset_ids.append(subset_id)
+        else:
+            output[subset_id] = version_doc
+
+    if missing_subset_ids:
+        last_versions = _get_last_versions(
+            project_name, missing_subset_ids, active, None
+        )
+        for subset_id, version_doc in last_versions.items():
+            cache.set_last_version(subset_id, active, version_doc)
+            output[subset_id] = version_doc
+
+    if fields is not None:
+        fields = set(fields)
+        fields.add("parent")
+
+    return {
+        subset_id: project_document_fields(version_doc, fields)
+        for subset_id, version_doc in output.items()
+    }
+
+
+def _get_last_versions(project_name, subset_ids, active, fields):
     # Avoid double query if only name and _id are requested
     name_needed = False
     limit_query = False
@@ -1016,6 +1180,37 @@ def get_last_version_by_subset_name(
     )
 
 
+def get_newest_version_id(project_name, subset_ids):
+    """Id of version which was created as last for any of passed subsets.
+
+    Ids of versions are created in time order, so a new version of any of
+    the subsets is discovered by single query of one field. Entity cache is
+    not used, versions published by other processes are also found.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        subset_ids (Iterable[Union[str, ObjectId]]): Subset ids.
+
+    Returns:
+        Union[ObjectId, None]: Id of newest version or None if subsets don't
+            have any version.
+    """
+
+    subset_ids = convert_ids(subset_ids)
+    if not subset_ids:
+        return None
+
+    conn = get_project_connection(project_name)
+    version_doc = conn.find_one(
+        {"type": "version", "parent": {"$in": subset_ids}},
+        {"_id": True},
+        sort=[("_id", -1)]
+    )
+    if version_doc is None:
+        return None
+    return version_doc["_id"]
+
+
 def get_representation_by_id(project_name, representation_id, fields=None):
     """Representation entity data by its id.
 
@@ -1034,16 +1229,19 @@ def get_representation_by_id(project_name, representation_id, fields=None):
     if not representation_id:
         return None
 
+    representation_id = convert_id(representation_id)
     repre_types = ["representation", "archived_representation"]
     query_filter = {
-        "type": {"$in": repre_types}
+        "type": {"$in": repre_types},
+        "_id": representation_id
     }
-    if representation_id is not None:
-        query_filter["_id"] = convert_id(representation_id)
 
-    conn = get_project_connection(project_name)
-
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        lambda cache: cache.get_by_id(representation_id, repre_types)
+    )
 
 
 def get_representation_by_name(
@@ -1074,8 +1272,14 @@ def get_representation_by_name(
         "parent": version_id
     }
 
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(
+        project_name,
+        query_filter,
+        fields,
+        lambda cache: cache.get_by_name(
+            "representation", representation_name, version_id, repre_types
+        )
+    )
 
 
 def _flatten_dict(data):
@@ -1214,6 +1418,21 @@ def _get_representations(
             and_query.append(or_query)
         query_filter["$and"] = and_query
 
+    if (
+        representation_ids is not None
+        and representation_names is None
+        and version_ids is None
+        and names_by_version_ids is None
+        and context_filters is None
+    ):
+        return _find_by_ids(
+            project_name,
+            query_filter,
+            representation_ids,
+            repre_types,
+            fields
+        )
+
     conn = get_project_connection(project_name)
 
     return conn.find(query_filter, _prepare_fields(fields))
@@ -0,0 +1,373 @@
+"""Request scoped cache of project entity documents.
+
+Cache is opt-in and is active only inside 'entity_cache' context. Query
+functions in 'entities.py' use the cache of a project if is active, otherwise
+they query database directly.
+
+Cache always stores full documents. Documents returned from cache are copies
+reduced to requested fields so changes made by caller don't affect cache.
+
+Cached documents of entities changed by 'OperationsSession.commit' are
+invalidated. Changes made using direct mongo calls are not tracked.
+
+Example:
+    ```python
+    with entity_cache(project_name):
+        # Database is queried only once
+        for _ in range(10):
+            asset_doc = get_asset_by_name(project_name, "sh010")
+    ```
+"""
+
+import copy
+import threading
+import contextlib
+
+# Entity types grouped under one name index
+_NAME_GROUPS = {
+    "asset": "asset",
+    "subset": "subset",
+    "version": "version",
+    "representation": "representation",
+    "archived_representation": "representation",
+}
+
+_caches_lock = threading.Lock()
+_caches_by_project = {}
+# Counter of invalidations by project, changes on each committed change
+_change_counters = {}
+
+
+def _set_nested(output, keys, value):
+    for key in keys[:-1]:
+        output = output.setdefault(key, {})
+    output[keys[-1]] = value
+
+
+def project_document_fields(doc, fields):
+    """Reduce document to passed fields like mongo projection does.
+
+    Nested fields can be defined with dot separator (e.g. 'data.fps').
+    Document id is always part of output.
+
+    Args:
+        doc (dict[str, Any]): Full entity document.
+        fields (Optional[Iterable[str]]): Fields that should be returned. Copy
+            of whole document is returned if 'None' is passed.
+
+    Returns:
+        dict[str, Any]: Copy of document with requested fields.
+    """
+
+    if not fields:
+        return copy.deepcopy(doc)
+
+    output = {}
+    added_fields = set()
+    # Shorter paths first so nested fields of added parents can be skipped
+    for field in sorted(set(fields) | {"_id"}, key=len):
+        keys = field.split(".")
+        parent_added = False
+        for idx in range(1, len(keys)):
+            if ".".join(keys[:idx]) in added_fields:
+                parent_added = True
+                break
+
+        if parent_added:
+            continue
+
+        value = doc
+        found = True
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                found = False
+                break
+            value = value[key]
+
+        if found:
+            added_fields.add(field)
+            _set_nested(output, keys, copy.deepcopy(value))
+    return output
+
+
+class ProjectEntityCache(object):
+    """Cache of entity documents of one project.
+
+    Documents are indexed by their id and by name under their parent.
+    Cache also remember last version ids of subsets.
+
+    Args:
+        project_name (str): Name of project.
+    """
+
+    def __init__(self, project_name):
+        self._project_name = project_name
+        self._lock = threading.RLock()
+        self._project_doc = None
+        self._docs_by_id = {}
+        self._ids_by_name_key = {}
+        self._last_version_ids = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def _name_key(self, doc):
+        group = _NAME_GROUPS.get(doc.get("type"))
+        if group is None or "name" not in doc:
+            return None
+        parent_id = None
+        if group != "asset":
+            parent_id = doc.get("parent")
+        return (group, parent_id, doc["name"])
+
+    def _count(self, found):
+        if found:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+    def add_doc(self, doc):
+        """Store full entity document to cache.
+
+        Args:
+            doc (dict[str, Any]): Full entity document.
+        """
+
+        if not doc:
+            return
+
+        with self._lock:
+            if doc.get("type") == "project":
+                self._project_doc = doc
+                return
+
+            self._docs_by_id[doc["_id"]] = doc
+            name_key = self._name_key(doc)
+            if name_key is not None:
+                self._ids_by_name_key[name_key] = doc["_id"]
+
+    def add_docs(self, docs):
+        for doc in docs:
+            self.add_doc(doc)
+
+    def get_project(self):
+        with self._lock:
+            self._count(self._project_doc is not None)
+            return self._project_doc
+
+    def get_by_id(self, entity_id, entity_types):
+        """Cached document by entity id.
+
+        Args:
+            entity_id (ObjectId): Entity id.
+            entity_types (Iterable[str]): Allowed entity types.
+
+        Returns:
+            Union[dict[str, Any], None]: Full entity document or 'None' if
+                is not cached.
+        """
+
+        with self._lock:
+            doc = self._docs_by_id.get(entity_id)
+            if doc is not None and doc["type"] not in entity_types:
+                doc = None
+            self._count(doc is not None)
+            return doc
+
+    def get_by_name(self, entity_type, name, parent_id, entity_types=None):
+        """Cached document by name under parent.
+
+        Args:
+            entity_type (str): Entity type used for name index.
+            name (Union[str, int]): Name of entity.
+            parent_id (Union[ObjectId, None]): Parent id. Ignored for assets.
+            entity_types (Optional[Iterable[str]]): Allowed entity types.
+                Only 'entity_type' is allowed if not passed.
+
+        Returns:
+            Union[dict[str, Any], None]: Full entity document or 'None' if
+                is not cached.
+        """
+
+        if entity_types is None:
+            entity_types = (entity_type, )
+
+        group = _NAME_GROUPS[entity_type]
+        if group == "asset":
+            parent_id = None
+
+        with self._lock:
+            entity_id = self._ids_by_name_key.get((group, parent_id, name))
+            doc = None
+            if entity_id is not None:
+                doc = self._docs_by_id.get(entity_id)
+            if doc is not None and doc["type"] not in entity_types:
+                doc = None
+            self._count(doc is not None)
+            return doc
+
+    def get_by_ids(self, entity_ids, entity_types):
+        """Cached documents by ids.
+
+        Args:
+            entity_ids (Iterable[ObjectId]): Entity ids.
+            entity_types (Iterable[str]): Allowed entity types.
+
+        Returns:
+            tuple[list[dict[str, Any]], list[ObjectId]]: Cached documents
+                and ids which are not cached.
+        """
+
+        docs = []
+        missing_ids = []
+        for entity_id in entity_ids:
+            doc = self.get_by_id(entity_id, entity_types)
+            if doc is None:
+                missing_ids.append(entity_id)
+            else:
+                docs.append(doc)
+        return docs, missing_ids
+
+    def set_last_version(self, subset_id, active, version_doc):
+        with self._lock:
+            self.add_doc(version_doc)
+            self._last_version_ids[(subset_id, active)] = version_doc["_id"]
+
+    def get_last_version(self, subset_id, active):
+        with self._lock:
+            version_id = self._last_version_ids.get((subset_id, active))
+            doc = None
+            if version_id is not None:
+                doc = self._docs_by_id.get(version_id)
+            self._count(doc is not None)
+            return doc
+
+    def invalidate(self, entity_ids=None):
+        """Remove documents from cache.
+
+        Last versions are always invalidated as any change can affect them.
+
+        Args:
+            entity_ids (Optional[Iterable[ObjectId]]): Ids of entities that
+                should be removed. All documents are removed if 'None'
+                is passed.
+        """
+
+        with self._lock:
+            self._last_version_ids = {}
+            if entity_ids is None:
+                self._project_doc = None
+                self._docs_by_id = {}
+                self._ids_by_name_key = {}
+                return
+
+            entity_ids = set(entity_ids)
+            if (
+                self._project_doc is not None
+                and self._project_doc["_id"] in entity_ids
+            ):
+                self._project_doc = None
+
+            for entity_id in entity_ids:
+                self._docs_by_id.pop(entity_id, None)
+
+            self._ids_by_name_key = {
+                name_key: entity_id
+                for name_key, entity_id in self._ids_by_name_key.items()
+                if entity_id not in entity_ids
+            }
+
+
+def get_entity_cache(project_name):
+    """Active entity cache of a project.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        Union[ProjectEntityCache, None]: Cache object if cache is enabled
+            for the project.
+    """
+
+    item = _caches_by_project.get(project_name)
+    if item is None:
+        return None
+    return item[0]
+
+
+def get_entity_change_counter(project_name):
+    """Counter of changes of project entities made in this process.
+
+    Counter is increased on each invalidation of entity cache, even if the
+    cache is not active. Can be used to validate caches based on entity
+    documents. Changes made by other processes are not counted.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        int: Counter value.
+    """
+
+    return _change_counters.get(project_name, 0)
+
+
+def invalidate_entity_cache(project_name, entity_ids=None):
+    """Invalidate entity cache of a project if is active.
+
+    Args:
+        project_name (str): Name of project.
+        entity_ids (Optional[Iterable[ObjectId]]): Ids of changed entities.
+            Whole cache is invalidated if 'None' is passed.
+    """
+
+    with _caches_lock:
+        _change_counters[project_name] = (
+            _change_counters.get(project_name, 0) + 1
+        )
+
+    cache = get_entity_cache(project_name)
+    if cache is not None:
+        cache.invalidate(entity_ids)
+
+
+@contextlib.contextmanager
+def entity_cache(project_name):
+    """Enable caching of entity documents of a project.
+
+    Cache is shared by all threads and nested contexts of the same project
+    use the same cache. Cache is removed when the outermost context ends.
+
+    Args:
+        project_name (str): Name of project.
+
+    Yields:
+        ProjectEntityCache: Cache object.
+    """
+
+    with _caches_lock:
+        item = _caches_by_project.get(project_name)
+        if item is None:
+            item = [ProjectEntityCache(project_name), 0]
+            _caches_by_project[project_name] = item
+        item[1] += 1
+
+    try:
+        yield item[0]
+
+    finally:
+        with _caches_lock:
+            item[1] -= 1
+            if item[1] == 0:
+                _caches_by_project.pop(project_name, None)
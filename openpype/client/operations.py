@@ -1,6 +1,8 @@
 import re
+import time
 import uuid
 import copy
+import datetime
 import collections
 from abc import ABCMeta, abstractmethod, abstractproperty
 
@@ -10,6 +12,7 @@ from pymongo import DeleteOne, InsertOne, UpdateOne
 
 from .mongo import get_project_connection
 from .entities import get_project
+from .entity_cache import invalidate_entity_cache
 
 REMOVED_VALUE = object()
 
@@ -28,6 +31,13 @@ CURRENT_REPRESENTATION_SCHEMA = "openpype:representation-2.0"
 CURRENT_WORKFILE_INFO_SCHEMA = "openpype:workfile-1.0"
 CURRENT_THUMBNAIL_SCHEMA = "openpype:thumbnail-1.0"
 
+# Key of project document where is stored time of last modification
+#   - used to find out if cached project document is outdated
+PROJECT_LAST_MODIFIED_KEY = "last_modified"
+# Key of representation document where is stored time of last modification
+#   - used by sync server to find representations changed by other processes
+REPRESENTATION_LAST_MODIFIED_KEY = "last_modified"
+
 
 def _create_or_convert_to_mongo_id(mongo_id):
     if mongo_id is None:
@@ -476,7 +486,12 @@ class CreateOperation(AbstractOperation):
         return self._data
 
     def to_mongo_operation(self):
-        return InsertOne(copy.deepcopy(self._data))
+        data = copy.deepcopy(self._data)
+        if self.entity_type == "representation":
+            data[REPRESENTATION_LAST_MODIFIED_KEY] = (
+                datetime.datetime.utcnow()
+            )
+        return InsertOne(data)
 
     def to_data(self):
         output = super(CreateOperation, self).to_data()
@@ -531,6 +546,17 @@ class UpdateOperation(AbstractOperation):
         if not op_data:
             return None
 
+        last_modified_key = None
+        if self.entity_type == "project":
+            last_modified_key = PROJECT_LAST_MODIFIED_KEY
+        elif self.entity_type == "representation":
+            last_modified_key = REPRESENTATION_LAST_MODIFIED_KEY
+
+        if last_modified_key:
+            op_data.setdefault("$set", {})[last_modified_key] = (
+                datetime.datetime.utcnow()
+            )
+
         return UpdateOne(
             {"_id": self.entity_id},
             op_data
@@ -581,6 +607,40 @@ class DeleteOperation(AbstractOperation):
         return output
 
 
+class OperationResult(object):
+    """Result of committed operation.
+
+    Operations are committed in bulk writes so timing information is
+    available only for whole batch in which the operation was committed.
+
+    Args:
+        operation (AbstractOperation): Committed operation.
+        batch_index (int): Index of bulk write batch of project.
+        batch_size (int): Amount of operations in the batch.
+        batch_duration (float): Duration of bulk write in seconds.
+    """
+
+    def __init__(self, operation, batch_index, batch_size, batch_duration):
+        self.operation = operation
+        self.batch_index = batch_index
+        self.batch_size = batch_size
+        self.batch_duration = batch_duration
+
+    @property
+    def duration(self):
+        """Approximated duration of the operation in seconds."""
+
+        return self.batch_duration / self.batch_size
+
+    def to_data(self):
+        return {
+            "operation": self.operation.to_data(),
+            "batch_index": self.batch_index,
+            "batch_size": self.batch_size,
+            "batch_duration": self.batch_duration,
+        }
+
+
 class OperationsSession(object):
     """Session storing operations that should happen in an order.
 
@@ -589,14 +649,30 @@ class OperationsSession(object):
     of same entity is there multiple times it's handled in any way and document
     values are not validated.
 
-    All operations must be related to single project.
+    Operations are committed in bulk writes per project collection. Amount of
+    operations in one bulk write can be limited with 'batch_size'.
+
+    Operations can be committed unordered which lets database process them
+    in parallel. Unordered mode is used only if no entity is affected by more
+    than one operation of the project and no operation references parent
+    affected in the session, otherwise ordered mode is used.
 
     Args:
-        project_name (str): Project name to which are operations related.
+        batch_size (Optional[int]): Maximum amount of operations in one bulk
+            write. All operations of project are sent in one bulk write
+            if 'None' is passed.
+        ordered (Optional[bool]): Operations must be processed in order
+            they were added. Defaults to True.
     """
 
-    def __init__(self):
+    def __init__(self, batch_size=None, ordered=True):
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(
+                "Batch size must be higher than 0. Got {}".format(batch_size)
+            )
         self._operations = []
+        self._batch_size = batch_size
+        self._ordered = ordered
 
     def add(self, operation):
         """Add operation to be processed.
@@ -651,26 +727,101 @@ class OperationsSession(object):
         ]
 
     def commit(self):
-        """Commit session operations."""
+        """Commit session operations.
+
+        Returns:
+            list[OperationResult]: Result of each committed operation in order
+                they were committed.
+        """
 
         operations, self._operations = self._operations, []
         if not operations:
-            return
+            return []
 
         operations_by_project = collections.defaultdict(list)
         for operation in operations:
             operations_by_project[operation.project_name].append(operation)
 
+        results = []
         for project_name, operations in operations_by_project.items():
-            bulk_writes = []
-            for operation in operations:
-                mongo_op = operation.to_mongo_operation()
-                if mongo_op is not None:
-                    bulk_writes.append(mongo_op)
-
-            if bulk_writes:
-                collection = get_project_connection(project_name)
-                collection.bulk_write(bulk_writes)
+            try:
+                results.extend(
+                    self._commit_project_operations(project_name, operations)
+                )
+            finally:
+                invalidate_entity_cache(
+                    project_name,
+                    [operation.entity_id for operation in operations]
+                )
+        return results
+
+    def _can_commit_unordered(self, operations):
+        """Operations can be committed in any order.
+
+        Failed operation does not stop following operations in unordered
+        mode. Children created together with their parent (e.g. version
+        and its representations) would stay orphaned if creation of the
+        parent failed, so operations which reference parent affected in the
+        same session must be ordered.
+
+        Args:
+            operations (list[AbstractOperation]): Operations of one project.
+
+        Returns:
+            bool: No entity is affected by more than one operation and no
+                entity is parent of other entity in the operations.
+        """
+
+        entity_ids = set()
+        for operation in operations:
+            if operation.entity_id in entity_ids:
+                return False
+            entity_ids.add(operation.entity_id)
+
+        for operation in operations:
+            if isinstance(operation, CreateOperation):
+                parent_id = operation.data.get("parent")
+            elif isinstance(operation, UpdateOperation):
+                parent_id = operation.update_data.get("parent")
+            else:
+                continue
+
+            if parent_id is not None and parent_id in entity_ids:
+                return False
+        return True
+
+    def _commit_project_operations(self, project_name, operations):
+        mongo_ops = []
+        for operation in operations:
+            mongo_op = operation.to_mongo_operation()
+            if mongo_op is not None:
+                mongo_ops.append((operation, mongo_op))
+
+        if not mongo_ops:
+            return []
+
+        ordered = self._ordered
+        if not ordered and not self._can_commit_unordered(operations):
+            ordered = True
+
+        batch_size = self._batch_size or len(mongo_ops)
+        collection = get_project_connection(project_name)
+        results = []
+        for batch_idx, start_idx in enumerate(
+            range(0, len(mongo_ops), batch_size)
+        ):
+            batch = mongo_ops[start_idx:start_idx + batch_size]
+            start_time = time.time()
+            collection.bulk_write(
+                [mongo_op for _, mongo_op in batch],
+                ordered=ordered
+            )
+            duration = time.time() - start_time
+            for operation, _ in batch:
+                results.append(OperationResult(
+                    operation, batch_idx, len(batch), duration
+                ))
+        return results
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'CreateOperation'.
@@ -68,7 +68,39 @@ function main(websocket_url){
 
     log.warn("connected");
 
-    RPC.addRoute('AfterEffects.open', function (data) {
+    var routes = {};
+    function addRoute(route, callback){
+        // keeps callbacks of routes to be callable from batch
+        routes[route] = callback;
+        RPC.addRoute(route, callback);
+    }
+
+    addRoute('AfterEffects.batch', function (data) {
+        // executes calls in order, returns list of results
+        log.warn('Server called client route "batch":', data.calls.length);
+        var results = [];
+        var chain = Promise.resolve();
+        data.calls.forEach(function(call){
+            chain = chain.then(function(){
+                if (!routes.hasOwnProperty(call.method)){
+                    return {error: 'Route not found: ' + call.method};
+                }
+                return Promise.resolve(routes[call.method](call.params))
+                    .then(function(result){
+                        return {result: result};
+                    }, function(error){
+                        return {error: String(error)};
+                    });
+            }).then(function(item){
+                results.push(item);
+            });
+        });
+        return chain.then(function(){
+            return results;
+        });
+    });
+
+    addRoute('AfterEffects.open', function (data) {
         log.warn('Server called client route "open":', data);
         var escapedPath = EscapeStringForJSX(data.path);
         return runEvalScript("fileOpen('" + escapedPath +"')")
@@ -78,7 +110,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_metadata', function (data) {
+    addRoute('AfterEffects.get_metadata', function (data) {
         log.warn('Server called client route "get_metadata":', data);
         return runEvalScript("getMetadata()")
             .then(function(result){
@@ -87,7 +119,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_active_document_name', function (data) {
+    addRoute('AfterEffects.get_active_document_name', function (data) {
         log.warn('Server called client route ' +
             '"get_active_document_name":', data);
         return runEvalScript("getActiveDocumentName()")
@@ -97,7 +129,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_active_document_full_name', function (data){
+    addRoute('AfterEffects.get_active_document_full_name', function (data){
         log.warn('Server called client route ' +
             '"get_active_document_full_name":', data);
         return runEvalScript("getActiveDocumentFullName()")
@@ -107,7 +139,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_items', function (data) {
+    addRoute('AfterEffects.get_items', function (data) {
         log.warn('Server called client route "get_items":', data);
         return runEvalScript("getItems("  + data.comps + "," +
                                             data.folders + "," +
@@ -119,7 +151,7 @@ function main(websocket_url){
     });
 
 
-    RPC.addRoute('AfterEffects.get_selected_items', function (data) {
+    addRoute('AfterEffects.get_selected_items', function (data) {
         log.warn('Server called client route "get_selected_items":', data);
         return runEvalScript("getSelectedItems(" + data.comps + "," +
                                                    data.folders + "," +
@@ -130,7 +162,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.import_file', function (data) {
+    addRoute('AfterEffects.import_file', function (data) {
         log.warn('Server called client route "import_file":', data);
         var escapedPath = EscapeStringForJSX(data.path);
         return runEvalScript("importFile('" + escapedPath +"', " +
@@ -143,7 +175,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.replace_item', function (data) {
+    addRoute('AfterEffects.replace_item', function (data) {
         log.warn('Server called client route "replace_item":', data);
         var escapedPath = EscapeStringForJSX(data.path);
         return runEvalScript("replaceItem(" + data.item_id + ", " +
@@ -155,7 +187,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.rename_item', function (data) {
+    addRoute('AfterEffects.rename_item', function (data) {
         log.warn('Server called client route "rename_item":', data);
         return runEvalScript("renameItem(" + data.item_id + ", " +
                                          "'" + data.item_name + "')")
@@ -165,7 +197,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.delete_item', function (data) {
+    addRoute('AfterEffects.delete_item', function (data) {
         log.warn('Server called client route "delete_item":', data);
         return runEvalScript("deleteItem(" + data.item_id + ")")
             .then(function(result){
@@ -174,7 +206,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.imprint', function (data) {
+    addRoute('AfterEffects.imprint', function (data) {
         log.warn('Server called client route "imprint":', data);
         var escaped = data.payload.replace(/\n/g, "\\n");
         return runEvalScript("imprint('" + escaped +"')")
@@ -184,7 +216,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.set_label_color', function (data) {
+    addRoute('AfterEffects.set_label_color', function (data) {
         log.warn('Server called client route "set_label_color":', data);
         return runEvalScript("setLabelColor(" + data.item_id + "," +
                                                 data.color_idx + ")")
@@ -194,7 +226,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_comp_properties', function (data) {
+    addRoute('AfterEffects.get_comp_properties', function (data) {
         log.warn('Server called client route "get_comp_properties":', data);
         return runEvalScript("getCompProperties(" + data.item_id + ")")
             .then(function(result){
@@ -203,7 +235,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.set_comp_properties', function (data) {
+    addRoute('AfterEffects.set_comp_properties', function (data) {
         log.warn('Server called client route "set_work_area":', data);
         return runEvalScript("setCompProperties(" + data.item_id + ',' +
                                               data.start + ',' +
@@ -217,7 +249,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.saveAs', function (data) {
+    addRoute('AfterEffects.saveAs', function (data) {
         log.warn('Server called client route "saveAs":', data);
         var escapedPath = EscapeStringForJSX(data.image_path);
         return runEvalScript("saveAs('" + escapedPath + "', " +
@@ -228,7 +260,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.save', function (data) {
+    addRoute('AfterEffects.save', function (data) {
         log.warn('Server called client route "save":', data);
         return runEvalScript("save()")
             .then(function(result){
@@ -237,7 +269,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_render_info', function (data) {
+    addRoute('AfterEffects.get_render_info', function (data) {
         log.warn('Server called client route "get_render_info":', data);
         return runEvalScript("getRenderInfo(" + data.comp_id +")")
             .then(function(result){
@@ -246,7 +278,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.get_audio_url', function (data) {
+    addRoute('AfterEffects.get_audio_url', function (data) {
         log.warn('Server called client route "get_audio_url":', data);
         return runEvalScript("getAudioUrlForComp(" + data.item_id + ")")
             .then(function(result){
@@ -255,7 +287,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.import_background', function (data) {
+    addRoute('AfterEffects.import_background', function (data) {
         log.warn('Server called client route "import_background":', data);
         return runEvalScript("importBackground(" + data.comp_id + ", " +
                                                "'" + data.comp_name + "', " +
@@ -266,7 +298,7 @@ function main(websocket_url){
             });
     });
 
-    RPC.addRoute('AfterEffects.reload_background', function (data) {
+    addRoute('AfterEffects.reload_background', function (data) {
         log.warn('Server called client route "reload_background":', data);
         return runEvalScript("reloadBackground(" + data.comp_id + ", " +
                                                "'" + data.comp_name + "', " +
@@ -277,7 +309,7 @@ function main(websocket_url){
             });
     });
 
-   RPC.addRoute('AfterEffects.add_item_as_layer', function (data) {
+   addRoute('AfterEffects.add_item_as_layer', function (data) {
        log.warn('Server called client route "add_item_as_layer":', data);
        return runEvalScript("addItemAsLayerToComp(" + data.comp_id + ", " +
                                                   data.item_id + "," +
@@ -288,7 +320,7 @@ function main(websocket_url){
            });
    });
 
-   RPC.addRoute('AfterEffects.render', function (data) {
+   addRoute('AfterEffects.render', function (data) {
     log.warn('Server called client route "render":', data);
     var escapedPath = EscapeStringForJSX(data.folder_url);
     return runEvalScript("render('" + escapedPath +"', " + data.comp_id + ")")
@@ -298,12 +330,12 @@ function main(websocket_url){
         });
     });
 
-    RPC.addRoute('AfterEffects.get_extension_version', function (data) {
+    addRoute('AfterEffects.get_extension_version', function (data) {
       log.warn('Server called client route "get_extension_version":', data);
       return get_extension_version();
     });
 
-    RPC.addRoute('AfterEffects.get_app_version', function (data) {
+    addRoute('AfterEffects.get_app_version', function (data) {
         log.warn('Server called client route "get_app_version":', data);
         return runEvalScript("getAppVersion()")
             .then(function(result){
@@ -312,12 +344,12 @@ function main(websocket_url){
             });
     });
 
-     RPC.addRoute('AfterEffects.close', function (data) {
+     addRoute('AfterEffects.close', function (data) {
         log.warn('Server called client route "close":', data);
         return runEvalScript("close()");
     });
 
-    RPC.addRoute('AfterEffects.print_msg', function (data) {
+    addRoute('AfterEffects.print_msg', function (data) {
         log.warn('Server called client route "print_msg":', data);
         var escaped_msg = EscapeStringForJSX(data.msg);
         return runEvalScript("printMsg('" + escaped_msg +"')")
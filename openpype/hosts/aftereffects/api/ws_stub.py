@@ -4,11 +4,13 @@
 """
 import json
 import logging
+import contextlib
 
 import attr
 
 from wsrpc_aiohttp import WebSocketAsync
 from openpype.tools.adobe_webserver.app import WebServerTool
+from openpype.tools.adobe_webserver.batch import StubBatch
 
 
 class ConnectionNotEstablishedYet(Exception):
@@ -51,6 +53,7 @@ class AfterEffectsServerStub():
         self.websocketserver = WebServerTool.get_instance()
         self.client = self.get_client()
         self.log = logging.getLogger(self.__class__.__name__)
+        self._batch = None
 
     @staticmethod
     def get_client():
@@ -67,6 +70,61 @@ class AfterEffectsServerStub():
 
         return client
 
+    @contextlib.contextmanager
+    def batch(self):
+        """Send calls without return value in single message to AfterEffects.
+
+        Calls like 'rename_item', 'set_label_color' or 'imprint' made inside
+        the context are collected, return None and are sent together
+        on exit. Methods returning values from AfterEffects send collected
+        calls first, so order of calls is kept.
+
+        Yields:
+            StubBatch: Collected calls, results are available after exit.
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        batch = StubBatch(
+            self.websocketserver,
+            self.client,
+            "AfterEffects.batch",
+            self._handle_return
+        )
+        self._batch = batch
+        try:
+            yield batch
+        except BaseException:
+            # Send calls made before the error but don't replace the error
+            self._batch = None
+            try:
+                batch.flush()
+            except Exception:
+                self.log.warning(
+                    "Failed to send collected calls to AfterEffects.",
+                    exc_info=True
+                )
+            raise
+        self._batch = None
+        batch.flush()
+
+    def _call(self, method, **params):
+        """Call 'method' in AfterEffects, result is not returned in batch."""
+        if self._batch is not None:
+            self._batch.add(method, **params)
+            return None
+        return self.websocketserver.call(self.client.call(method, **params))
+
+    def _query(self, method, **params):
+        """Call 'method' in AfterEffects and return its result.
+
+        Calls collected in batch are sent first.
+        """
+        if self._batch is not None:
+            self._batch.flush()
+        return self.websocketserver.call(self.client.call(method, **params))
+
     def open(self, path):
         """
             Open file located at 'path' (local).
@@ -74,8 +132,7 @@ class AfterEffectsServerStub():
             path(string): file path locally
         Returns: None
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.open', path=path))
+        res = self._call('AfterEffects.open', path=path)
 
         return self._handle_return(res)
 
@@ -90,8 +147,7 @@ class AfterEffectsServerStub():
         Returns:
             (list)
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_metadata'))
+        res = self._query('AfterEffects.get_metadata')
         metadata = self._handle_return(res)
 
         return metadata or []
@@ -170,9 +226,7 @@ class AfterEffectsServerStub():
 
         payload = json.dumps(cleaned_data, indent=4)
 
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.imprint',
-                                         payload=payload))
+        res = self._call('AfterEffects.imprint', payload=payload)
         return self._handle_return(res)
 
     def get_active_document_full_name(self):
@@ -180,8 +234,7 @@ class AfterEffectsServerStub():
             Returns absolute path of active document via ws call
         Returns(string): file name
         """
-        res = self.websocketserver.call(self.client.call(
-            'AfterEffects.get_active_document_full_name'))
+        res = self._query('AfterEffects.get_active_document_full_name')
 
         return self._handle_return(res)
 
@@ -190,8 +243,7 @@ class AfterEffectsServerStub():
             Returns just a name of active document via ws call
         Returns(string): file name
         """
-        res = self.websocketserver.call(self.client.call(
-            'AfterEffects.get_active_document_name'))
+        res = self._query('AfterEffects.get_active_document_name')
 
         return self._handle_return(res)
 
@@ -212,12 +264,12 @@ class AfterEffectsServerStub():
         Returns:
             (list) of namedtuples
         """
-        res = self.websocketserver.call(
-            self.client.call('AfterEffects.get_items',
-                             comps=comps,
-                             folders=folders,
-                             footages=footages)
-              )
+        res = self._query(
+            'AfterEffects.get_items',
+            comps=comps,
+            folders=folders,
+            footages=footages
+        )
         return self._to_records(self._handle_return(res))
 
     def get_selected_items(self, comps, folders=False, footages=False):
@@ -232,12 +284,12 @@ class AfterEffectsServerStub():
             (list) of namedtuples
 
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_selected_items',
-                                         comps=comps,
-                                         folders=folders,
-                                         footages=footages)
-                                        )
+        res = self._query(
+            'AfterEffects.get_selected_items',
+            comps=comps,
+            folders=folders,
+            footages=footages
+        )
         return self._to_records(self._handle_return(res))
 
     def get_item(self, item_id):
@@ -263,12 +315,12 @@ class AfterEffectsServerStub():
                 config
 
         """
-        res = self.websocketserver.call(
-            self.client.call('AfterEffects.import_file',
-                             path=path,
-                             item_name=item_name,
-                             import_options=import_options)
-            )
+        res = self._query(
+            'AfterEffects.import_file',
+            path=path,
+            item_name=item_name,
+            import_options=import_options
+        )
         records = self._to_records(self._handle_return(res))
         if records:
             return records.pop()
@@ -282,10 +334,12 @@ class AfterEffectsServerStub():
                 item_name (string): label on item in Project list
 
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.replace_item',
-                                         item_id=item_id,
-                                         path=path, item_name=item_name))
+        res = self._query(
+            'AfterEffects.replace_item',
+            item_id=item_id,
+            path=path,
+            item_name=item_name
+        )
 
         return self._handle_return(res)
 
@@ -297,10 +351,11 @@ class AfterEffectsServerStub():
                 item_name (string): label on item in Project list
 
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.rename_item',
-                                         item_id=item_id,
-                                         item_name=item_name))
+        res = self._call(
+            'AfterEffects.rename_item',
+            item_id=item_id,
+            item_name=item_name
+        )
 
         return self._handle_return(res)
 
@@ -310,9 +365,7 @@ class AfterEffectsServerStub():
                 item_id (int):
 
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.delete_item',
-                                         item_id=item_id))
+        res = self._call('AfterEffects.delete_item', item_id=item_id)
 
         return self._handle_return(res)
 
@@ -334,9 +387,7 @@ class AfterEffectsServerStub():
                 cleaned_data.append(instance)
 
         payload = json.dumps(cleaned_data, indent=4)
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.imprint',
-                                         payload=payload))
+        res = self._call('AfterEffects.imprint', payload=payload)
 
         return self._handle_return(res)
 
@@ -352,10 +403,11 @@ class AfterEffectsServerStub():
             item_id (int):
             color_idx (int): 0-16 Label colors from AE Project view
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.set_label_color',
-                                         item_id=item_id,
-                                         color_idx=color_idx))
+        res = self._call(
+            'AfterEffects.set_label_color',
+            item_id=item_id,
+            color_idx=color_idx
+        )
 
         return self._handle_return(res)
 
@@ -371,10 +423,7 @@ class AfterEffectsServerStub():
                 (AEItem)
 
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_comp_properties',
-                                         item_id=comp_id
-                                         ))
+        res = self._query('AfterEffects.get_comp_properties', item_id=comp_id)
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -395,14 +444,15 @@ class AfterEffectsServerStub():
             width (int): resolution width
             height (int): resolution height
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.set_comp_properties',
-                                         item_id=comp_id,
-                                         start=start,
-                                         duration=duration,
-                                         frame_rate=frame_rate,
-                                         width=width,
-                                         height=height))
+        res = self._call(
+            'AfterEffects.set_comp_properties',
+            item_id=comp_id,
+            start=start,
+            duration=duration,
+            frame_rate=frame_rate,
+            width=width,
+            height=height
+        )
         return self._handle_return(res)
 
     def save(self):
@@ -410,8 +460,7 @@ class AfterEffectsServerStub():
             Saves active document
         Returns: None
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.save'))
+        res = self._call('AfterEffects.save')
 
         return self._handle_return(res)
 
@@ -423,10 +472,11 @@ class AfterEffectsServerStub():
             as_copy: <boolean>
         Returns: None
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.saveAs',
-                                         image_path=project_path,
-                                         as_copy=as_copy))
+        res = self._call(
+            'AfterEffects.saveAs',
+            image_path=project_path,
+            as_copy=as_copy
+        )
 
         return self._handle_return(res)
 
@@ -436,9 +486,7 @@ class AfterEffectsServerStub():
             Returns:
                (list) of (AEItem): with 'file_name' field
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_render_info',
-                                         comp_id=comp_id))
+        res = self._query('AfterEffects.get_render_info', comp_id=comp_id)
 
         records = self._to_records(self._handle_return(res))
         return records
@@ -451,9 +499,7 @@ class AfterEffectsServerStub():
             Returns:
                 (str): absolute path url
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.get_audio_url',
-                                         item_id=item_id))
+        res = self._query('AfterEffects.get_audio_url', item_id=item_id)
 
         return self._handle_return(res)
 
@@ -479,11 +525,12 @@ class AfterEffectsServerStub():
             Returns:
                 (AEItem): object with id of created folder, all imported images
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.import_background',
-                                         comp_id=comp_id,
-                                         comp_name=comp_name,
-                                         files=files))
+        res = self._query(
+            'AfterEffects.import_background',
+            comp_id=comp_id,
+            comp_name=comp_name,
+            files=files
+        )
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -505,11 +552,12 @@ class AfterEffectsServerStub():
             Returns:
                 (AEItem): object with id of created folder, all imported images
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.reload_background',
-                                         comp_id=comp_id,
-                                         comp_name=comp_name,
-                                         files=files))
+        res = self._query(
+            'AfterEffects.reload_background',
+            comp_id=comp_id,
+            comp_name=comp_name,
+            files=files
+        )
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -525,10 +573,11 @@ class AfterEffectsServerStub():
                 item_id (int): FootageItem.id
                 comp already found previously
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.add_item_as_layer',
-                                         comp_id=comp_id,
-                                         item_id=item_id))
+        res = self._query(
+            'AfterEffects.add_item_as_layer',
+            comp_id=comp_id,
+            item_id=item_id
+        )
 
         records = self._to_records(self._handle_return(res))
         if records:
@@ -541,36 +590,33 @@ class AfterEffectsServerStub():
             folder_url(string): local folder path for collecting
         Returns: None
         """
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.render',
-                                         folder_url=folder_url,
-                                         comp_id=comp_id))
+        res = self._query(
+            'AfterEffects.render',
+            folder_url=folder_url,
+            comp_id=comp_id
+        )
         return self._handle_return(res)
 
     def get_extension_version(self):
         """Returns version number of installed extension."""
-        res = self.websocketserver.call(self.client.call(
-            'AfterEffects.get_extension_version'))
+        res = self._query('AfterEffects.get_extension_version')
 
         return self._handle_return(res)
 
     def get_app_version(self):
         """Returns version number of installed application (17.5...)."""
-        res = self.websocketserver.call(self.client.call(
-            'AfterEffects.get_app_version'))
+        res = self._query('AfterEffects.get_app_version')
 
         return self._handle_return(res)
 
     def close(self):
-        res = self.websocketserver.call(self.client.call('AfterEffects.close'))
+        res = self._call('AfterEffects.close')
 
         return self._handle_return(res)
 
     def print_msg(self, msg):
         """Triggers Javascript alert dialog."""
-        self.websocketserver.call(self.client.call
-                                  ('AfterEffects.print_msg',
-                                   msg=msg))
+        self._call('AfterEffects.print_msg', msg=msg)
 
     def _handle_return(self, res):
         """Wraps return, throws ValueError if 'error' key is present."""
@@ -6,34 +6,58 @@ import json
 import traceback
 import importlib
 import functools
-import time
+import itertools
 import struct
+from concurrent.futures import Future, TimeoutError
 from datetime import datetime
 import threading
 from . import lib
 
+# Incoming messages are prefixed with 'AH' and content length sent as
+#   8 characters long hex string.
+HEADER_PREFIX = b"AH"
+INCOMING_HEADER_SIZE = 10
+
 
 class Server(threading.Thread):
     """Class for communication with Toon Boon Harmony.
 
+    Each request sent to Harmony gets unique message id and future which is
+    resolved by receiving thread when reply with the same message id
+    arrives. That allows to have multiple requests in flight from multiple
+    threads without polling.
+
     Attributes:
         connection (Socket): connection holding object.
-        received (str): received data buffer.any(iterable)
         port (int): port number.
         message_id (int): index of last message going out.
-        queue (dict): dictionary holding queue of incoming messages.
+        reply_timeout (float): Seconds after which is logged that reply
+            did not arrive yet.
+        reply_retries (int): How many times is waited for 'reply_timeout'
+            before waiting for reply is stopped.
 
     """
 
+    reply_timeout = 30
+    reply_retries = 30
+    recv_chunk_size = 65536
+
     def __init__(self, port):
         """Constructor."""
         super(Server, self).__init__()
         self.daemon = True
         self.connection = None
-        self.received = ""
         self.port = port
         self.message_id = 1
 
+        self._buffer = bytearray()
+        self._message_ids = itertools.count(1)
+        self._futures = {}
+        self._futures_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._connected = threading.Event()
+        self._closed = False
+
         # Setup logging.
         self.log = logging.getLogger(__name__)
         self.log.setLevel(logging.DEBUG)
@@ -51,7 +75,6 @@ class Server(threading.Thread):
 
         # Listen for incoming connections
         self.socket.listen(1)
-        self.queue = {}
 
     def process_request(self, request):
         """Process incoming request.
@@ -81,87 +104,115 @@ class Server(threading.Thread):
         except Exception:
             self.log.error(traceback.format_exc())
 
+    def _pop_message(self):
+        """Pop content of first complete message from receive buffer.
+
+        Returns:
+            Union[bytes, None]: Message content or None if buffer does not
+                contain whole message yet.
+        """
+        while len(self._buffer) >= INCOMING_HEADER_SIZE:
+            if self._buffer[0:2] != HEADER_PREFIX:
+                self.log.error("INVALID HEADER")
+                # Skip to next possible header
+                idx = self._buffer.find(HEADER_PREFIX, 1)
+                if idx < 0:
+                    del self._buffer[:-1]
+                    return None
+                del self._buffer[:idx]
+                continue
+
+            try:
+                length = int(
+                    self._buffer[2:INCOMING_HEADER_SIZE].decode(), 16)
+            except ValueError:
+                self.log.error("INVALID HEADER")
+                del self._buffer[:2]
+                continue
+
+            end = INCOMING_HEADER_SIZE + length
+            if len(self._buffer) < end:
+                return None
+
+            data = bytes(self._buffer[INCOMING_HEADER_SIZE:end])
+            del self._buffer[:end]
+            return data
+        return None
+
     def receive(self):
         """Receives data from `self.connection`.
 
-        When the data is a json serializable string, a reply is sent then
-        processing of the request.
+        Received data are buffered and split to messages by their headers.
+        Replies resolve futures of sent requests, requests from Harmony are
+        acknowledged and processed.
         """
-        current_time = time.time()
         while True:
-            self.log.info("wait ttt")
-            # Receive the data in small chunks and retransmit it
-            request = None
             try:
-                header = self.connection.recv(10)
-            except OSError:
-                # could happen on MacOS
-                self.log.info("")
+                chunk = self.connection.recv(self.recv_chunk_size)
+            except (OSError, AttributeError):
+                # could happen on MacOS or when connection was closed
+                self.log.info(f"[{self.timestamp()}] Connection broken.")
                 break
 
-            if len(header) == 0:
+            if len(chunk) == 0:
                 # null data received, socket is closing.
                 self.log.info(f"[{self.timestamp()}] Connection closing.")
                 break
 
-            if header[0:2] != b"AH":
-                self.log.error("INVALID HEADER")
-            content_length_str = header[2:].decode()
-
-            length = int(content_length_str, 16)
-            data = self.connection.recv(length)
-            while (len(data) < length):
-                # we didn't received everything in first try, lets wait for
-                # all data.
-                self.log.info("loop")
-                time.sleep(0.1)
-                if self.connection is None:
-                    self.log.error(f"[{self.timestamp()}] "
-                                   "Connection is broken")
-                    break
-                if time.time() > current_time + 30:
-                    self.log.error(f"[{self.timestamp()}] Connection timeout.")
+            self._buffer.extend(chunk)
+            while True:
+                data = self._pop_message()
+                if data is None:
                     break
+                self._process_message(data)
 
-                data += self.connection.recv(length - len(data))
-            self.log.debug("data:: {} {}".format(data, type(data)))
-            self.received += data.decode("utf-8")
-            pretty = self._pretty(self.received)
-            self.log.debug(
-                f"[{self.timestamp()}] Received:\n{pretty}")
+        self._cancel_futures()
 
-            try:
-                request = json.loads(self.received)
-            except json.decoder.JSONDecodeError as e:
-                self.log.error(f"[{self.timestamp()}] "
-                               f"Invalid message received.\n{e}",
-                               exc_info=True)
-
-            self.received = ""
-            if request is None:
-                continue
+    def _process_message(self, data):
+        """Process content of one received message.
 
-            if "message_id" in request.keys():
-                message_id = request["message_id"]
-                self.message_id = message_id + 1
-                self.log.debug(f"--- storing request as {message_id}")
-                self.queue[message_id] = request
-            if "reply" not in request.keys():
-                request["reply"] = True
-                self.send(request)
-                self.process_request(request)
-
-                if "message_id" in request.keys():
-                    try:
-                        self.log.debug(f"[{self.timestamp()}] "
-                                       f"Removing from the queue {message_id}")
-                        del self.queue[message_id]
-                    except IndexError:
-                        self.log.debug(f"[{self.timestamp()}] "
-                                       f"{message_id} is no longer in queue")
-            else:
+        Args:
+            data (bytes): Message content.
+        """
+        received = data.decode("utf-8")
+        pretty = self._pretty(received)
+        self.log.debug(
+            f"[{self.timestamp()}] Received:\n{pretty}")
+
+        try:
+            request = json.loads(received)
+        except json.decoder.JSONDecodeError as e:
+            self.log.error(f"[{self.timestamp()}] "
+                           f"Invalid message received.\n{e}",
+                           exc_info=True)
+            return
+
+        message_id = request.get("message_id")
+        if "reply" in request:
+            with self._futures_lock:
+                future = self._futures.pop(message_id, None)
+
+            if future is None:
                 self.log.debug(f"[{self.timestamp()}] "
                                "received data was just a reply.")
+            else:
+                future.set_result(request)
+            return
+
+        request["reply"] = True
+        self.send(request)
+        self.process_request(request)
+
+    def _cancel_futures(self):
+        """Fail all requests waiting for reply."""
+        with self._futures_lock:
+            self._closed = True
+            futures = list(self._futures.values())
+            self._futures.clear()
+
+        for future in futures:
+            future.set_exception(
+                ConnectionError("Connection to Harmony was closed."))
 
     def run(self):
         """Entry method for server.
@@ -172,6 +223,7 @@ class Server(threading.Thread):
         timestamp = datetime.now().strftime("%H:%M:%S.%f")
         self.log.debug(f"[{timestamp}] Waiting for a connection.")
         self.connection, client_address = self.socket.accept()
+        self._connected.set()
 
         timestamp = datetime.now().strftime("%H:%M:%S.%f")
         self.log.debug(f"[{timestamp}] Connection from: {client_address}")
@@ -187,31 +239,74 @@ class Server(threading.Thread):
             socket.socket(
                 socket.AF_INET, socket.SOCK_STREAM
             ).connect(("localhost", self.port))
+            self._connected.wait(self.reply_timeout)
 
-        self.connection.close()
+        if self.connection is not None:
+            try:
+                self.connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.connection.close()
         self.connection = None
+        self._connected.clear()
 
         self.socket.close()
+        self._cancel_futures()
 
-    def _send(self, message):
+    def _send(self, message, message_id=None):
         """Send a message to Harmony.
 
         Args:
             message (str): Data to send to Harmony.
+            message_id (int): Id of the message used for logging.
         """
         # Wait for a connection.
-        while not self.connection:
-            pass
+        self._connected.wait()
 
         timestamp = datetime.now().strftime("%H:%M:%S.%f")
         encoded = message.encode("utf-8")
-        coded_message = b"AH" + struct.pack('>I', len(encoded)) + encoded
-        pretty = self._pretty(coded_message)
+        coded_message = HEADER_PREFIX + struct.pack(">I", len(encoded))
+        pretty = self._pretty(message)
         self.log.debug(
-            f"[{timestamp}] Sending [{self.message_id}]:\n{pretty}")
+            f"[{timestamp}] Sending [{message_id}]:\n{pretty}")
         self.log.debug(f"--- Message length: {len(encoded)}")
-        self.connection.sendall(coded_message)
-        self.message_id += 1
+        with self._send_lock:
+            self.connection.sendall(coded_message + encoded)
+
+    def send_async(self, request):
+        """Send a request in dictionary to Harmony without waiting.
+
+        Args:
+            request (dict): Data to send to Harmony.
+
+        Returns:
+            Union[Future, None]: Future resolved with reply from Harmony.
+                None is returned if request is a reply.
+        """
+        future = None
+        if request.get("reply"):
+            # Replies keep message id of request from Harmony
+            message_id = request.get("message_id")
+        else:
+            message_id = next(self._message_ids)
+            request["message_id"] = message_id
+            future = Future()
+            with self._futures_lock:
+                if self._closed:
+                    future.set_exception(
+                        ConnectionError("Connection to Harmony was closed."))
+                    return future
+                self._futures[message_id] = future
+            self.message_id = message_id
+
+        try:
+            self._send(json.dumps(request), message_id)
+        except Exception:
+            if future is not None:
+                with self._futures_lock:
+                    self._futures.pop(message_id, None)
+            raise
+        return future
 
     def send(self, request):
         """Send a request in dictionary to Harmony.
@@ -220,48 +315,46 @@ class Server(threading.Thread):
 
         Args:
             request (dict): Data to send to Harmony.
+
+        Returns:
+            Union[dict, None]: Reply from Harmony. None if request was
+                a reply or Harmony did not reply.
         """
-        request["message_id"] = self.message_id
-        self._send(json.dumps(request))
-        if request.get("reply"):
+        future = self.send_async(request)
+        if future is None:
             timestamp = datetime.now().strftime("%H:%M:%S.%f")
             self.log.debug(
                 f"[{timestamp}] sent reply, not waiting for anything.")
             return None
-        result = None
-        current_time = time.time()
-        try_index = 1
-        while True:
-            time.sleep(0.1)
-            if time.time() > current_time + 30:
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")
-                self.log.error((f"[{timestamp}][{self.message_id}] "
-                                "No reply from Harmony in 30s. "
-                                f"Retrying {try_index}"))
-                try_index += 1
-                current_time = time.time()
-            if try_index > 30:
-                break
-            try:
-                result = self.queue[request["message_id"]]
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")
-                self.log.debug((f"[{timestamp}] Got request "
-                                f"id {self.message_id}, "
-                                "removing from queue"))
-                del self.queue[request["message_id"]]
-                break
-            except KeyError:
-                # response not in received queue yey
-                pass
-            try:
-                result = json.loads(self.received)
-                break
-            except json.decoder.JSONDecodeError:
-                pass
+        return self.wait_for_reply(future, request["message_id"])
 
-        self.received = ""
+    def wait_for_reply(self, future, message_id=None):
+        """Wait for reply of request sent with 'send_async'.
+
+        Args:
+            future (Future): Future returned by 'send_async'.
+            message_id (int): Id of the message used for logging.
 
-        return result
+        Returns:
+            Union[dict, None]: Reply from Harmony. None if Harmony did
+                not reply.
+        """
+        for try_index in range(1, self.reply_retries + 1):
+            try:
+                return future.result(self.reply_timeout)
+            except TimeoutError:
+                self.log.error((f"[{self.timestamp()}][{message_id}] "
+                                "No reply from Harmony in "
+                                f"{self.reply_timeout}s. "
+                                f"Retrying {try_index}"))
+            except ConnectionError:
+                self.log.error((f"[{self.timestamp()}][{message_id}] "
+                                "Connection closed before reply."))
+                return None
+
+        with self._futures_lock:
+            self._futures.pop(message_id, None)
+        return None
 
     def _pretty(self, message) -> str:
         # result = pformat(message, indent=2)
@@ -81,6 +81,7 @@ def maintained_visibility(layers=None):
     try:
         yield
     finally:
-        for layer in layers:
-            stub().set_visible(layer.id, visibility[layer.id])
-            pass
+        ps_stub = stub()
+        with ps_stub.batch():
+            for layer in layers:
+                ps_stub.set_visible(layer.id, visibility[layer.id])
@@ -215,9 +215,8 @@ def ls():
     if not stub.get_active_document_name():
         return
 
-    layers_meta = stub.get_layers_metadata()  # minimalize calls to PS
     for layer in stub.get_layers():
-        data = stub.read(layer, layers_meta)
+        data = stub.read(layer)
 
         # Skip non-tagged layers.
         if not data:
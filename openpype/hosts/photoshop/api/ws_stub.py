@@ -2,11 +2,18 @@
     Stub handling connection from server to client.
     Used anywhere solution is calling client methods.
 """
+import copy
 import json
+import time
+import logging
+import contextlib
+import collections
+
 import attr
 from wsrpc_aiohttp import WebSocketAsync
 
 from openpype.tools.adobe_webserver.app import WebServerTool
+from openpype.tools.adobe_webserver.batch import StubBatch
 
 
 @attr.s
@@ -40,19 +47,138 @@ class PSItem(object):
                          .replace(PhotoshopServerStub.LOADED_ICON, ''))
 
 
+class PSLayersMetadata(object):
+    """Metadata from Headline of a document indexed by layer and item ids.
+
+    Args:
+        document_full_name (str): Full path of document the metadata
+            belong to.
+        saved (bool): Document had no unsaved changes when metadata
+            were read.
+        items (list[dict]): Metadata items stored in Headline.
+    """
+
+    def __init__(self, document_full_name, saved, items):
+        self.document_full_name = document_full_name
+        self.saved = saved
+        self.items = items
+        self.dirty = False
+        self.validated = time.time()
+        self._by_layer_id = {}
+        self._by_item_id = collections.defaultdict(list)
+        self.reindex()
+
+    def reindex(self):
+        self._by_layer_id = {}
+        self._by_item_id = collections.defaultdict(list)
+        for item in self.items:
+            self._index_item(item)
+
+    def _index_item(self, item):
+        members = item.get("members")
+        layer_id = item.get("uuid")  # legacy
+        if members:
+            layer_id = members[0]
+            self._by_item_id[str(members[0])].append(item)
+
+        if layer_id is not None:
+            self._by_layer_id.setdefault(str(layer_id), item)
+
+        instance_id = item.get("instance_id")
+        if instance_id is not None:
+            items = self._by_item_id[instance_id]
+            if not items or items[-1] is not item:
+                items.append(item)
+
+    def get_by_layer_id(self, layer_id):
+        """Metadata of layer (from 'members' or legacy 'uuid')."""
+        return self._by_layer_id.get(str(layer_id))
+
+    def set_items(self, items):
+        self.items = copy.deepcopy(items)
+        self.dirty = True
+        self.reindex()
+
+    def update(self, item_id, data):
+        """Update, add or remove (if 'data' are empty) metadata of item.
+
+        Args:
+            item_id (str): Id of layer in 'members' or 'instance_id'.
+            data (dict): Data to update matching items with.
+        """
+        # json.dumps writes integer values in a dictionary to string, so
+        # anticipating it here.
+        matching = self._by_item_id.get(str(item_id))
+        data = copy.deepcopy(data)
+        self.dirty = True
+        if not matching:
+            if data:
+                self.items.append(data)
+                self._index_item(data)
+            return
+
+        if not data:
+            self._remove_items(matching)
+            return
+
+        for item in matching:
+            item.update(data)
+
+        if any(key in data for key in ("members", "uuid", "instance_id")):
+            self.reindex()
+
+    def remove_instance(self, instance_id):
+        self._remove_items([
+            item
+            for item in self.items
+            if (item.get("instance_id") or item.get("uuid")) == instance_id
+        ])
+        self.dirty = True
+
+    def remove_missing_layers(self, layer_ids):
+        """Remove metadata of layers which are not in 'layer_ids'."""
+        layer_ids = set(layer_ids)
+        self._remove_items([
+            item
+            for item in self.items
+            if item.get("members")
+            and int(item["members"][0]) not in layer_ids
+        ])
+
+    def _remove_items(self, items):
+        if not items:
+            return
+        item_ids = {id(item) for item in items}
+        self.items = [
+            item
+            for item in self.items
+            if id(item) not in item_ids
+        ]
+        self.reindex()
+
+
 class PhotoshopServerStub:
     """
         Stub for calling function on client (Photoshop js) side.
         Expects that client is already connected (started when avalon menu
         is opened).
         'self.websocketserver.call' is used as async wrapper
+
+        Metadata from Headline are cached for all stubs and validated by full
+        name and saved state of active document after
+        'metadata_validation_interval' seconds.
     """
     PUBLISH_ICON = '\u2117 '
     LOADED_ICON = '\u25bc'
 
+    metadata_validation_interval = 1.0
+    _metadata_cache = None
+
     def __init__(self):
         self.websocketserver = WebServerTool.get_instance()
         self.client = self.get_client()
+        self.log = logging.getLogger(self.__class__.__name__)
+        self._batch = None
 
     @staticmethod
     def get_client():
@@ -69,6 +195,153 @@ class PhotoshopServerStub:
 
         return client
 
+    @classmethod
+    def clear_metadata_cache(cls):
+        """Clear cached metadata from Headline of document."""
+        PhotoshopServerStub._metadata_cache = None
+
+    def _get_metadata_cache(self):
+        """Cached metadata of active document.
+
+        Returns:
+            PSLayersMetadata: Metadata of active document.
+        """
+        cache = PhotoshopServerStub._metadata_cache
+        # Modified metadata are not written yet, document can't change
+        if cache is not None and not cache.dirty:
+            now = time.time()
+            if now - cache.validated > self.metadata_validation_interval:
+                full_name, saved = self._get_document_state()
+                # Document which became saved without 'save' of this stub
+                #   was saved, reverted or reopened in Photoshop, Headline
+                #   may not match the cache anymore.
+                if (
+                    full_name != cache.document_full_name
+                    or (saved and not cache.saved)
+                ):
+                    cache = None
+                else:
+                    cache.saved = saved
+                    cache.validated = now
+
+        if cache is None:
+            full_name, saved = self._get_document_state()
+            cache = PSLayersMetadata(
+                full_name, saved, self._read_layers_metadata()
+            )
+            PhotoshopServerStub._metadata_cache = cache
+        return cache
+
+    def _get_document_state(self):
+        """Full name and saved state of active document in one message.
+
+        Returns:
+            tuple[str, bool]: Full name with path and saved state.
+        """
+        if self._batch is not None:
+            self._batch.flush()
+        batch = StubBatch(self.websocketserver, self.client, "Photoshop.batch")
+        full_name = batch.add('Photoshop.get_active_document_full_name')
+        saved = batch.add('Photoshop.is_saved')
+        batch.flush()
+        # evalScript returns boolean as string
+        return full_name.result, str(saved.result).lower() == "true"
+
+    def _write_metadata(self, cache):
+        payload = json.dumps(cache.items, indent=4)
+        try:
+            self._call('Photoshop.imprint', payload=payload)
+        except Exception:
+            self.clear_metadata_cache()
+            raise
+        cache.dirty = False
+        cache.saved = False
+
+    def flush_metadata(self, all_layers=None):
+        """Write modified metadata to Headline of active document.
+
+        Metadata of layers which don't exist anymore are removed.
+
+        Args:
+            all_layers (list of PSItem): for performance, could be
+                injected, if not, single call will be triggered
+        """
+        cache = PhotoshopServerStub._metadata_cache
+        if cache is None or not cache.dirty:
+            return
+
+        # Ensure only valid ids are stored.
+        if not all_layers:
+            all_layers = self.get_layers()
+        cache.remove_missing_layers([layer.id for layer in all_layers])
+        self._write_metadata(cache)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Send calls without return value in single message to Photoshop.
+
+        Calls like 'set_visible', 'rename_layer' or 'imprint' made inside
+        the context are collected and sent together on exit. Methods
+        returning values from Photoshop send collected calls first, so
+        order of calls is kept. Metadata modified by 'imprint' are written
+        to Headline only once on exit.
+
+        Example:
+            >>> with stub.batch() as batch:
+            ...     for layer in layers:
+            ...         stub.set_visible(layer.id, False)
+            >>> batch.results
+
+        Yields:
+            StubBatch: Collected calls, results are available after exit.
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        batch = StubBatch(self.websocketserver, self.client, "Photoshop.batch")
+        self._batch = batch
+        try:
+            yield batch
+        except BaseException:
+            # Send calls made before the error but don't replace the error
+            try:
+                self._finish_batch(batch)
+            except Exception:
+                self.log.warning(
+                    "Failed to send collected calls to Photoshop.",
+                    exc_info=True
+                )
+            raise
+        self._finish_batch(batch)
+
+    def _finish_batch(self, batch):
+        try:
+            self.flush_metadata()
+        finally:
+            self._batch = None
+            try:
+                batch.flush()
+            except Exception:
+                self.clear_metadata_cache()
+                raise
+
+    def _call(self, method, **params):
+        """Call 'method' in Photoshop, result is not returned in batch."""
+        if self._batch is not None:
+            self._batch.add(method, **params)
+            return None
+        return self.websocketserver.call(self.client.call(method, **params))
+
+    def _query(self, method, **params):
+        """Call 'method' in Photoshop and return its result.
+
+        Calls collected in batch are sent first.
+        """
+        if self._batch is not None:
+            self._batch.flush()
+        return self.websocketserver.call(self.client.call(method, **params))
+
     def open(self, path):
         """Open file located at 'path' (local).
 
@@ -76,16 +349,17 @@ class PhotoshopServerStub:
             path(string): file path locally
         Returns: None
         """
-        self.websocketserver.call(
-            self.client.call('Photoshop.open', path=path)
-        )
+        self.flush_metadata()
+        self._call('Photoshop.open', path=path)
+        self.clear_metadata_cache()
 
     def read(self, layer, layers_meta=None):
         """Parses layer metadata from Headline field of active document.
 
         Args:
             layer: (PSItem)
-            layers_meta: full list from Headline (for performance in loops)
+            layers_meta: full list from Headline, cached metadata are used
+                if not passed
         Returns:
             (dict) of layer metadata stored in PS file
 
@@ -101,7 +375,10 @@ class PhotoshopServerStub:
             }
         """
         if layers_meta is None:
-            layers_meta = self.get_layers_metadata()
+            layer_meta = self._get_metadata_cache().get_by_layer_id(layer.id)
+            if layer_meta is not None:
+                return copy.deepcopy(layer_meta)
+            layers_meta = []
 
         for layer_meta in layers_meta:
             layer_id = layer_meta.get("uuid")  # legacy
@@ -136,56 +413,26 @@ class PhotoshopServerStub:
             ]
         }] - for loaded instances
 
+        Inside 'batch' context metadata are written to Headline only once
+        on exit.
+
         Args:
             item_id (str):
             data(string): json representation for single layer
             all_layers (list of PSItem): for performance, could be
                 injected for usage in loop, if not, single call will be
                 triggered
-            items_meta(string): json representation from Headline
-                           (for performance - provide only if imprint is in
-                           loop - value should be same)
+            items_meta(string): json representation from Headline, cached
+                metadata are used if not passed
         Returns: None
         """
-        if not items_meta:
-            items_meta = self.get_layers_metadata()
+        cache = self._get_metadata_cache()
+        if items_meta:
+            cache.set_items(items_meta)
 
-        # json.dumps writes integer values in a dictionary to string, so
-        # anticipating it here.
-        item_id = str(item_id)
-        is_new = True
-        result_meta = []
-        for item_meta in items_meta:
-            if ((item_meta.get('members') and
-                 item_id == str(item_meta.get('members')[0])) or
-                    item_meta.get("instance_id") == item_id):
-                is_new = False
-                if data:
-                    item_meta.update(data)
-                    result_meta.append(item_meta)
-            else:
-                result_meta.append(item_meta)
-
-        if is_new:
-            result_meta.append(data)
-
-        # Ensure only valid ids are stored.
-        if not all_layers:
-            all_layers = self.get_layers()
-        layer_ids = [layer.id for layer in all_layers]
-        cleaned_data = []
-
-        for item in result_meta:
-            if item.get("members"):
-                if int(item["members"][0]) not in layer_ids:
-                    continue
-
-            cleaned_data.append(item)
-
-        payload = json.dumps(cleaned_data, indent=4)
-        self.websocketserver.call(
-            self.client.call('Photoshop.imprint', payload=payload)
-        )
+        cache.update(item_id, data)
+        if self._batch is None:
+            self.flush_metadata(all_layers)
 
     def get_layers(self):
         """Returns JSON document with all(?) layers in active document.
@@ -196,9 +443,7 @@ class PhotoshopServerStub:
                                      'type': 'GUIDE'|'FG'|'BG'|'OBJ'
                                      'visible': 'true'|'false'
         """
-        res = self.websocketserver.call(
-            self.client.call('Photoshop.get_layers')
-        )
+        res = self._query('Photoshop.get_layers')
 
         return self._to_records(res)
 
@@ -266,9 +511,7 @@ class PhotoshopServerStub:
             <PSItem>
         """
         enhanced_name = self.PUBLISH_ICON + name
-        ret = self.websocketserver.call(
-            self.client.call('Photoshop.create_group', name=enhanced_name)
-        )
+        ret = self._query('Photoshop.create_group', name=enhanced_name)
         # create group on PS is asynchronous, returns only id
         return PSItem(id=ret, name=name, group=True)
 
@@ -279,10 +522,8 @@ class PhotoshopServerStub:
             (Layer)
         """
         enhanced_name = self.PUBLISH_ICON + name
-        res = self.websocketserver.call(
-            self.client.call(
-                'Photoshop.group_selected_layers', name=enhanced_name
-            )
+        res = self._query(
+            'Photoshop.group_selected_layers', name=enhanced_name
         )
         res = self._to_records(res)
         if res:
@@ -296,9 +537,7 @@ class PhotoshopServerStub:
 
         Returns: <list of Layer('id':XX, 'name':"YYY")>
         """
-        res = self.websocketserver.call(
-            self.client.call('Photoshop.get_selected_layers')
-        )
+        res = self._query('Photoshop.get_selected_layers')
         return self._to_records(res)
 
     def select_layers(self, layers):
@@ -308,11 +547,9 @@ class PhotoshopServerStub:
             layers: <list of Layer('id':XX, 'name':"YYY")>
         """
         layers_id = [str(lay.id) for lay in layers]
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.select_layers',
-                layers=json.dumps(layers_id)
-            )
+        self._call(
+            'Photoshop.select_layers',
+            layers=json.dumps(layers_id)
         )
 
     def get_active_document_full_name(self):
@@ -321,9 +558,7 @@ class PhotoshopServerStub:
         Returns(string):
             full path with name
         """
-        res = self.websocketserver.call(
-            self.client.call('Photoshop.get_active_document_full_name')
-        )
+        res = self._query('Photoshop.get_active_document_full_name')
 
         return res
 
@@ -333,9 +568,7 @@ class PhotoshopServerStub:
         Returns(string):
             file name
         """
-        return self.websocketserver.call(
-            self.client.call('Photoshop.get_active_document_name')
-        )
+        return self._query('Photoshop.get_active_document_name')
 
     def is_saved(self):
         """Returns true if no changes in active document
@@ -343,15 +576,15 @@ class PhotoshopServerStub:
         Returns:
             <boolean>
         """
-        return self.websocketserver.call(
-            self.client.call('Photoshop.is_saved')
-        )
+        return self._query('Photoshop.is_saved')
 
     def save(self):
         """Saves active document"""
-        self.websocketserver.call(
-            self.client.call('Photoshop.save')
-        )
+        self.flush_metadata()
+        self._call('Photoshop.save')
+        cache = PhotoshopServerStub._metadata_cache
+        if cache is not None:
+            cache.saved = True
 
     def saveAs(self, image_path, ext, as_copy):
         """Saves active document to psd (copy) or png or jpg
@@ -362,13 +595,12 @@ class PhotoshopServerStub:
             as_copy: <boolean>
         Returns: None
         """
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.saveAs',
-                image_path=image_path,
-                ext=ext,
-                as_copy=as_copy
-            )
+        self.flush_metadata()
+        self._call(
+            'Photoshop.saveAs',
+            image_path=image_path,
+            ext=ext,
+            as_copy=as_copy
         )
 
     def set_visible(self, layer_id, visibility):
@@ -379,12 +611,10 @@ class PhotoshopServerStub:
             visibility: <true - set visible, false - hide>
         Returns: None
         """
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.set_visible',
-                layer_id=layer_id,
-                visibility=visibility
-            )
+        self._call(
+            'Photoshop.set_visible',
+            layer_id=layer_id,
+            visibility=visibility
         )
 
     def hide_all_others_layers(self, layers):
@@ -408,14 +638,25 @@ class PhotoshopServerStub:
         """
         if not layers:
             layers = self.get_layers()
-        for layer in layers:
-            if layer.visible and layer.id not in extract_ids:
-                self.set_visible(layer.id, False)
+        with self.batch():
+            for layer in layers:
+                if layer.visible and layer.id not in extract_ids:
+                    self.set_visible(layer.id, False)
 
     def get_layers_metadata(self):
-        """Reads layers metadata from Headline from active document in PS.
+        """Returns layers metadata from Headline from active document in PS.
         (Headline accessible by File > File Info)
 
+        Metadata are cached, returned items are copies.
+
+        Returns:
+            (list)
+        """
+        return copy.deepcopy(self._get_metadata_cache().items)
+
+    def _read_layers_metadata(self):
+        """Reads layers metadata from Headline from active document in PS.
+
         Returns:
             (list)
             example:
@@ -424,7 +665,7 @@ class PhotoshopServerStub:
                       "asset":"Town"}}
                 8 is layer(group) id - used for deletion, update etc.
         """
-        res = self.websocketserver.call(self.client.call('Photoshop.read'))
+        res = self._query('Photoshop.read')
         layers_data = []
         try:
             if res:
@@ -450,13 +691,11 @@ class PhotoshopServerStub:
             as_reference (bool): pull in content or reference
         """
         enhanced_name = self.LOADED_ICON + layer_name
-        res = self.websocketserver.call(
-            self.client.call(
-                'Photoshop.import_smart_object',
-                path=path,
-                name=enhanced_name,
-                as_reference=as_reference
-            )
+        res = self._query(
+            'Photoshop.import_smart_object',
+            path=path,
+            name=enhanced_name,
+            as_reference=as_reference
         )
         rec = self._to_records(res).pop()
         if rec:
@@ -473,13 +712,11 @@ class PhotoshopServerStub:
                 same smart object was loaded
         """
         enhanced_name = self.LOADED_ICON + layer_name
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.replace_smart_object',
-                layer_id=layer.id,
-                path=path,
-                name=enhanced_name
-            )
+        self._call(
+            'Photoshop.replace_smart_object',
+            layer_id=layer.id,
+            path=path,
+            name=enhanced_name
         )
 
     def delete_layer(self, layer_id):
@@ -488,9 +725,7 @@ class PhotoshopServerStub:
         Args:
             layer_id (int): id of layer to delete
         """
-        self.websocketserver.call(
-            self.client.call('Photoshop.delete_layer', layer_id=layer_id)
-        )
+        self._call('Photoshop.delete_layer', layer_id=layer_id)
 
     def rename_layer(self, layer_id, name):
         """Renames specific layer by it's id.
@@ -499,33 +734,21 @@ class PhotoshopServerStub:
             layer_id (int): id of layer to delete
             name (str): new name
         """
-        self.websocketserver.call(
-            self.client.call(
-                'Photoshop.rename_layer',
-                layer_id=layer_id,
-                name=name
-            )
+        self._call(
+            'Photoshop.rename_layer',
+            layer_id=layer_id,
+            name=name
         )
 
     def remove_instance(self, instance_id):
-        cleaned_data = []
-
-        for item in self.get_layers_metadata():
-            inst_id = item.get("instance_id") or item.get("uuid")
-            if inst_id != instance_id:
-                cleaned_data.append(item)
-
-        payload = json.dumps(cleaned_data, indent=4)
-
-        self.websocketserver.call(
-            self.client.call('Photoshop.imprint', payload=payload)
-        )
+        cache = self._get_metadata_cache()
+        cache.remove_instance(instance_id)
+        if self._batch is None:
+            self._write_metadata(cache)
 
     def get_extension_version(self):
         """Returns version number of installed extension."""
-        return self.websocketserver.call(
-            self.client.call('Photoshop.get_extension_version')
-        )
+        return self._query('Photoshop.get_extension_version')
 
     def close(self):
         """Shutting down PS and process too.
@@ -533,7 +756,9 @@ class PhotoshopServerStub:
             For webpublishing only.
         """
         # TODO change client.call to method with checks for client
-        self.websocketserver.call(self.client.call('Photoshop.close'))
+        self.flush_metadata()
+        self._call('Photoshop.close')
+        self.clear_metadata_cache()
 
     def _to_records(self, res):
         """Converts string json representation into list of PSItem for
@@ -57,7 +57,7 @@ class CollectAutoImage(pyblish.api.ContextPlugin):
         # collect stored image instances
         instance_names = []
         for layer_item in layer_items:
-            layer_meta_data = stub.read(layer_item, stored_items)
+            layer_meta_data = stub.read(layer_item)
 
             # Skip layers without metadata.
             if layer_meta_data is None:
@@ -168,6 +168,7 @@ from .plugin_tools import (
     get_subset_name_with_asset_doc,
     prepare_template_data,
     source_hash,
+    source_hash_from_stat,
 )
 
 from .path_tools import (
@@ -302,6 +303,7 @@ __all__ = [
     "get_subset_name",
     "get_subset_name_with_asset_doc",
     "source_hash",
+    "source_hash_from_stat",
 
     "format_file_size",
     "collect_frames",
@@ -2,10 +2,23 @@ import os
 import logging
 import sys
 import errno
+import time
+import hashlib
+import threading
 import six
 
 from openpype.lib import create_hard_link
 
+try:
+    from concurrent.futures import (
+        ThreadPoolExecutor,
+        FIRST_EXCEPTION,
+        wait,
+    )
+except ImportError:
+    # Python 2 without 'futures' backport - files are transferred serially
+    ThreadPoolExecutor = None
+
 # this is needed until speedcopy for linux is fixed
 if sys.platform == "win32":
     from speedcopy import copyfile
@@ -23,6 +36,16 @@ class DuplicateDestinationError(ValueError):
     """
 
 
+class FileVerificationError(IOError):
+    """Error raised when transferred file does not match its source.
+
+    Raised only when verification is enabled on the FileTransaction instance
+    and the destination file size or hash differ from the source after the
+    transfer.
+
+    """
+
+
 class FileTransaction(object):
     """File transaction with rollback options.
 
@@ -47,18 +70,57 @@ class FileTransaction(object):
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Files can be transferred concurrently using a bounded pool of worker
+    threads (`max_workers` higher than 1). Backup and rollback logic is the
+    same in both modes - if any transfer fails the remaining running
+    transfers are finished, not started transfers are skipped and the error
+    is raised so the caller can rollback.
+
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (logging.Logger): Logger used for reports.
+        allow_queue_replacements (bool): Allow replacing of source of already
+            queued destination.
+        max_workers (int): Amount of threads used for transfers. Transfers
+            are processed serially if is lower than 2 or if
+            'concurrent.futures' is not available (Python 2).
+        retries (int): How many times a failed file transfer is retried.
+        verify (Union[str, None]): Verification of transferred files. Can be
+            'size' to compare file sizes or 'hash' to compare content
+            hashes of source and destination. Nothing is verified if is
+            'None'.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    VERIFY_SIZE = "size"
+    VERIFY_HASH = "hash"
+
+    # Seconds between progress reports during transfer
+    progress_interval = 5.0
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=1,
+        retries=0,
+        verify=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
+        if verify not in (None, self.VERIFY_SIZE, self.VERIFY_HASH):
+            raise ValueError(
+                "Unknown verification type \"{}\"".format(verify))
+
         self.log = log
+        self._max_workers = max(1, int(max_workers or 1))
+        self._retries = max(0, int(retries or 0))
+        self._verify = verify
 
         # The transfer queue
         # todo: make this an actual FIFO queue?
@@ -66,12 +128,20 @@ class FileTransaction(object):
 
         # Destination file paths that a file was transferred to
         self._transferred = []
+        # Stat results of transferred destination files
+        self._transferred_stats = {}
 
         # Backup file location mapping to original locations
         self._backup_to_original = {}
 
         self._allow_queue_replacements = allow_queue_replacements
 
+        # Progress information
+        self._lock = threading.Lock()
+        self._bytes_transferred = 0
+        self._start_time = None
+        self._last_progress_report = 0.0
+
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
 
@@ -125,7 +195,8 @@ class FileTransaction(object):
                 "Backup existing file: {} -> {}".format(dst, backup))
             os.rename(dst, backup)
 
-        # Copy the files to transfer
+        # Prepare transfers and skip those with same source and destination
+        transfers = []
         for dst, (src, opts) in self._transfers.items():
             path_same = self._same_paths(src, dst)
             if path_same:
@@ -133,18 +204,174 @@ class FileTransaction(object):
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
                 continue
+            transfers.append((src, dst, opts))
 
-            self._create_folder_for_file(dst)
+        self._bytes_transferred = 0
+        self._start_time = time.time()
+        self._last_progress_report = self._start_time
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
+        if (
+            self._max_workers > 1
+            and len(transfers) > 1
+            and ThreadPoolExecutor is not None
+        ):
+            self._process_concurrent(transfers)
+        else:
+            for src, dst, opts in transfers:
+                self._process_transfer(src, dst, opts)
+
+        self._report_progress(force=True)
+
+    def _process_concurrent(self, transfers):
+        """Transfer files using a pool of threads.
+
+        Transfers that were not started yet are cancelled on first failure.
+        Transfers which are already running are waited for so they're
+        correctly stored for rollback.
+
+        Args:
+            transfers (list[tuple[str, str, dict]]): Source, destination and
+                options of each transfer.
+        """
+
+        max_workers = min(self._max_workers, len(transfers))
+        self.log.debug(
+            "Transferring {} files using {} threads".format(
+                len(transfers), max_workers))
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(self._process_transfer, src, dst, opts)
+                for src, dst, opts in transfers
+            ]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            if not_done:
+                # Some transfer failed - skip transfers that did not start
+                #   and wait for running to finish
+                for future in not_done:
+                    future.cancel()
+                wait(not_done)
+
+            for future in futures:
+                if future.cancelled():
+                    continue
+                exc = future.exception()
+                if exc is not None:
+                    raise exc
+        finally:
+            executor.shutdown(wait=True)
+
+    def _process_transfer(self, src, dst, opts):
+        """Transfer single file with retries.
+
+        Args:
+            src (str): Source path.
+            dst (str): Destination path.
+            opts (dict): Transfer options.
+        """
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self._transfer_file(src, dst, opts)
+                return
 
+            except Exception:
+                # Remove partially transferred or invalid file (existing
+                #   files were already backed up)
+                if os.path.exists(dst):
+                    os.remove(dst)
+
+                if attempt > self._retries:
+                    raise
+
+                self.log.warning(
+                    "Transfer {} -> {} failed (attempt {}/{}). Retrying.."
+                    .format(src, dst, attempt, self._retries + 1),
+                    exc_info=True)
+
+    def _transfer_file(self, src, dst, opts):
+        self._create_folder_for_file(dst)
+
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
+
+        dst_stat = os.stat(dst)
+        self._verify_transfer(src, dst, dst_stat.st_size)
+
+        with self._lock:
             self._transferred.append(dst)
+            self._transferred_stats[dst] = dst_stat
+            self._bytes_transferred += dst_stat.st_size
+        self._report_progress()
+
+    def _verify_transfer(self, src, dst, dst_size):
+        """Verify transferred file based on verification type.
+
+        Args:
+            src (str): Source path.
+            dst (str): Destination path.
+            dst_size (int): Size of transferred file.
+
+        Raises:
+            FileVerificationError: When destination does not match source.
+        """
+
+        if self._verify is None:
+            return
+
+        src_size = os.path.getsize(src)
+        if src_size != dst_size:
+            raise FileVerificationError(
+                "Size of transferred file does not match {} -> {}"
+                " ({} != {} bytes)".format(src, dst, src_size, dst_size))
+
+        if (
+            self._verify == self.VERIFY_HASH
+            and self._file_hash(src) != self._file_hash(dst)
+        ):
+            raise FileVerificationError(
+                "Hash of transferred file does not match {} -> {}".format(
+                    src, dst))
+
+    @staticmethod
+    def _file_hash(path, chunk_size=1024 * 1024):
+        file_hash = hashlib.sha1()
+        with open(path, "rb") as stream:
+            for chunk in iter(lambda: stream.read(chunk_size), b""):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    def _report_progress(self, force=False):
+        if self._start_time is None:
+            return
+
+        now = time.time()
+        with self._lock:
+            if (
+                not force
+                and now - self._last_progress_report < self.progress_interval
+            ):
+                return
+            self._last_progress_report = now
+            transferred_count = len(self._transferred)
+            bytes_transferred = self._bytes_transferred
+
+        duration = max(now - self._start_time, 0.000001)
+        self.log.debug(
+            "Transferred {} files ({:.2f} MB) in {:.2f}s ({:.2f} MB/s)".format(
+                transferred_count,
+                bytes_transferred / 1048576.0,
+                duration,
+                (bytes_transferred / 1048576.0) / duration
+            ))
 
     def finalize(self):
         # Delete any backed up files
@@ -190,6 +417,15 @@ class FileTransaction(object):
         """Return the processed transfers destination paths"""
         return list(self._transferred)
 
+    @property
+    def transferred_stats(self):
+        """Return stat results of transferred files by destination path.
+
+        Stats are collected right after transfer so files don't have to be
+        accessed again to get their size or modification time.
+        """
+        return dict(self._transferred_stats)
+
     @property
     def backups(self):
         """Return the backup file paths"""
@@ -24,6 +24,9 @@ import traceback
 import threading
 import copy
 
+from six.moves import queue
+from pymongo.errors import CollectionInvalid, OperationFailure
+
 from openpype.client.mongo import (
     MongoEnvNotSet,
     get_default_components,
@@ -181,6 +184,195 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+class MongoQueueHandler(logging.Handler):
+    """Handler storing records to mongo in batches on a background thread.
+
+    Records are formatted in calling thread and put to a bounded queue so
+    emitting never waits for database. Worker thread writes queued documents
+    using 'insert_many'. Records are dropped when the queue is full, count of
+    dropped records and failed writes is available on the handler and
+    dropped records are reported by a document in the collection.
+
+    Queued records are written on 'flush' and 'close' which are called by
+    'logging.shutdown' on process exit.
+
+    Args:
+        collection_getter (Callable[[], Collection]): Function returning
+            mongo collection where records are stored.
+        max_queue_size (int): Maximum amount of queued records.
+        batch_size (int): Maximum amount of records written at once.
+        flush_interval (float): Maximum time in seconds a record waits
+            in queue for more records.
+    """
+
+    _stop_item = object()
+
+    def __init__(
+        self,
+        collection_getter,
+        max_queue_size=10000,
+        batch_size=100,
+        flush_interval=1.0
+    ):
+        logging.Handler.__init__(self)
+        self._collection_getter = collection_getter
+        self._collection = None
+        self._queue = queue.Queue(max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._counters_lock = threading.Lock()
+        self._dropped_count = 0
+        self._reported_dropped_count = 0
+        self._failed_count = 0
+        self._written_count = 0
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def dropped_count(self):
+        """Count of records dropped because queue was full."""
+        return self._dropped_count
+
+    @property
+    def failed_count(self):
+        """Count of records which failed to be written."""
+        return self._failed_count
+
+    @property
+    def written_count(self):
+        """Count of records written to database."""
+        return self._written_count
+
+    def _start_thread(self):
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._process_queue, name="MongoQueueHandler"
+            )
+            thread.daemon = True
+            thread.start()
+            self._thread = thread
+
+    def emit(self, record):
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        self._start_thread()
+        try:
+            self._queue.put_nowait(document)
+        except queue.Full:
+            with self._counters_lock:
+                self._dropped_count += 1
+
+    def flush(self, timeout=5.0):
+        """Wait until records queued before the call are written.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds.
+        """
+
+        if self._thread is None or not self._thread.is_alive():
+            return
+
+        event = threading.Event()
+        try:
+            self._queue.put(event, timeout=timeout)
+        except queue.Full:
+            return
+        event.wait(timeout)
+
+    def close(self):
+        self.flush()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            try:
+                self._queue.put(self._stop_item, timeout=1.0)
+                thread.join(1.0)
+            except queue.Full:
+                pass
+        logging.Handler.close(self)
+
+    def _get_collection(self):
+        if self._collection is None:
+            self._collection = self._collection_getter()
+        return self._collection
+
+    def _dropped_document(self):
+        with self._counters_lock:
+            dropped = self._dropped_count - self._reported_dropped_count
+            self._reported_dropped_count = self._dropped_count
+
+        if not dropped:
+            return None
+        document = {
+            "timestamp": datetime.datetime.now(),
+            "level": "WARNING",
+            "message": (
+                "{} log records were dropped because logging queue"
+                " was full."
+            ).format(dropped),
+            "loggerName": __name__,
+        }
+        document.update(Logger.get_process_data())
+        return document
+
+    def _write(self, documents):
+        dropped_document = self._dropped_document()
+        if dropped_document is not None:
+            documents.append(dropped_document)
+
+        if not documents:
+            return
+
+        try:
+            self._get_collection().insert_many(documents, ordered=False)
+            self._written_count += len(documents)
+
+        except Exception:
+            self._failed_count += len(documents)
+            # Connection is created again on next write
+            self._collection = None
+
+    def _process_queue(self):
+        while True:
+            item = self._queue.get()
+            documents = []
+            events = []
+            stop = False
+            deadline = time.time() + self._flush_interval
+            while True:
+                if item is self._stop_item:
+                    stop = True
+                    break
+
+                if isinstance(item, threading.Event):
+                    events.append(item)
+                    break
+
+                documents.append(item)
+                if len(documents) >= self._batch_size:
+                    break
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            self._write(documents)
+            for event in events:
+                event.set()
+
+            if stop:
+                return
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -215,10 +407,19 @@ class Logger:
     log_database_name = os.environ["OPENPYPE_DATABASE_NAME"]
     # Collection name under database in Mongo
     log_collection_name = "logs"
+    # Limits of capped log collection
+    log_collection_max_documents = 5000
+    log_collection_max_size = 1073741824
 
     # Logging level - OPENPYPE_LOG_LEVEL
     log_level = None
 
+    # Mongo handler shared by all loggers and its queue options
+    _mongo_handler = None
+    mongo_queue_size = 10000
+    mongo_batch_size = 100
+    mongo_flush_interval = 1.0
+
     # Data same for all record documents
     process_data = None
     # Cached process name or ability to set different process name
@@ -237,7 +438,7 @@ class Logger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, (MongoQueueHandler, MongoHandler)):
                 add_mongo_handler = False
             elif isinstance(handler, LogStreamHandler):
                 add_console_handler = False
@@ -284,22 +485,41 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": MongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
+        if cls._mongo_handler is None:
+            handler = MongoQueueHandler(
+                cls._get_log_collection,
+                max_queue_size=cls.mongo_queue_size,
+                batch_size=cls.mongo_batch_size,
+                flush_interval=cls.mongo_flush_interval
+            )
+            handler.setFormatter(MongoFormatter())
+            cls._mongo_handler = handler
+        return cls._mongo_handler
 
-        return MongoHandler(**kwargs)
+    @classmethod
+    def _get_log_collection(cls):
+        client = cls.get_log_mongo_connection()
+        logdb = client[cls.log_database_name]
+        # Collection must be capped before first records are written
+        cls._create_log_collection(logdb)
+        return logdb[cls.log_collection_name]
+
+    @classmethod
+    def _create_log_collection(cls, logdb):
+        """Create capped log collection if it does not exist."""
+        if cls.log_collection_name in logdb.list_collection_names():
+            return
+
+        try:
+            logdb.create_collection(
+                cls.log_collection_name,
+                capped=True,
+                max=cls.log_collection_max_documents,
+                size=cls.log_collection_max_size
+            )
+        except (CollectionInvalid, OperationFailure):
+            # Collection was created by other process meanwhile
+            pass
 
     @classmethod
     def _get_console_handler(cls):
@@ -460,16 +680,7 @@ class Logger:
             # mongo db connection.
             log4mongo.handlers._connection = client
 
-        logdb = client[cls.log_database_name]
-
-        collist = logdb.list_collection_names()
-        if cls.log_collection_name not in collist:
-            logdb.create_collection(
-                cls.log_collection_name,
-                capped=True,
-                max=5000,
-                size=1073741824
-            )
+        cls._create_log_collection(client[cls.log_database_name])
         cls.bootstraped = True
 
     @classmethod
@@ -2,6 +2,7 @@ import os
 import re
 import copy
 import numbers
+import threading
 import collections
 
 import six
@@ -11,6 +12,9 @@ KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
 
+# Maximum number of compiled templates kept in memory
+COMPILED_TEMPLATES_CACHE_SIZE = 2048
+
 
 def merge_dict(main_dict, enhance_dict):
     """Merges dictionaries by keys.
@@ -80,15 +84,17 @@ class TemplateUnsolved(Exception):
         )
 
 
-class StringTemplate(object):
-    """String that can be formatted."""
-    def __init__(self, template):
-        if not isinstance(template, six.string_types):
-            raise TypeError("<{}> argument must be a string, not {}.".format(
-                self.__class__.__name__, str(type(template))
-            ))
+class _CompiledTemplate(object):
+    """Parsed template parts which can be shared by template objects.
 
-        self._template = template
+    Parts are parsed only once per template string. Parts don't hold any
+    formatting state so they can be shared.
+
+    Args:
+        template (str): Template string.
+    """
+
+    def __init__(self, template):
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -119,7 +125,66 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        self.parts = StringTemplate.find_optional_parts(new_parts)
+
+
+class _CompiledTemplatesCache(object):
+    """LRU cache of compiled templates by template string."""
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._items = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, template):
+        with self._lock:
+            compiled = self._items.pop(template, None)
+            if compiled is not None:
+                self.hits += 1
+                self._items[template] = compiled
+                return compiled
+            self.misses += 1
+
+        compiled = _CompiledTemplate(template)
+        with self._lock:
+            self._items[template] = compiled
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+        return compiled
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_compiled_templates_cache = _CompiledTemplatesCache(
+    COMPILED_TEMPLATES_CACHE_SIZE
+)
+
+
+def clear_compiled_templates_cache():
+    """Remove all compiled templates from cache."""
+
+    _compiled_templates_cache.clear()
+
+
+class StringTemplate(object):
+    """String that can be formatted.
+
+    Parsing of template string is cached so creation of template objects
+    with the same template string is cheap.
+    """
+    def __init__(self, template):
+        if not isinstance(template, six.string_types):
+            raise TypeError("<{}> argument must be a string, not {}.".format(
+                self.__class__.__name__, str(type(template))
+            ))
+
+        self._template = template
+        compiled = _compiled_templates_cache.get(template)
+        self._parts = compiled.parts
 
     def __str__(self):
         return self.template
@@ -151,6 +216,10 @@ class StringTemplate(object):
             TemplateResult: Filled or partially filled template containing all
                 data needed or missing for filling template.
         """
+        result = self._format_fast(data)
+        if result is not None:
+            return result
+
         result = TemplatePartResult()
         for part in self._parts:
             if isinstance(part, six.string_types):
@@ -177,6 +246,231 @@ class StringTemplate(object):
             invalid_types
         )
 
+    def _format_fast(self, data):
+        """Fast formatting if all required keys are available in data.
+
+        Optional parts which can't be filled are skipped the same way as in
+        full formatting.
+
+        Args:
+            data (dict): Containing keys to be filled into template.
+
+        Returns:
+            Union[TemplateResult, None]: Solved result or 'None' if any
+                required key is missing or has invalid type.
+        """
+
+        output = []
+        used_values = {}
+        if not self._format_parts_fast(
+            self._parts, data, output, used_values, {}
+        ):
+            return None
+
+        return TemplateResult(
+            "".join(output),
+            self.template,
+            True,
+            self._used_values_to_dict(used_values),
+            [],
+            {}
+        )
+
+    @staticmethod
+    def _used_values_to_dict(used_values):
+        """Convert used values by key path to nested dictionary."""
+
+        output = {}
+        for key_subdict, value in used_values.items():
+            item = output
+            for sub_key in key_subdict[:-1]:
+                if sub_key not in item:
+                    item[sub_key] = {}
+                item = item[sub_key]
+            item[key_subdict[-1]] = value
+        return output
+
+    @classmethod
+    def _format_parts_fast(
+        cls, parts, data, output, used_values, formatted_values
+    ):
+        for part in parts:
+            if isinstance(part, six.string_types):
+                output.append(part)
+                continue
+
+            if isinstance(part, OptionalPart):
+                optional_output = []
+                optional_used_values = {}
+                if cls._format_parts_fast(
+                    part.parts,
+                    data,
+                    optional_output,
+                    optional_used_values,
+                    formatted_values
+                ):
+                    output.extend(optional_output)
+                    used_values.update(optional_used_values)
+                continue
+
+            formatted_value = formatted_values.get(part.key)
+            if formatted_value is None:
+                formatted_value = part.format_value(data)
+                if formatted_value is None:
+                    return False
+                formatted_values[part.key] = formatted_value
+
+            used_values[part.key_subdict] = formatted_value
+            output.append(formatted_value)
+        return True
+
+    def format_batch(self, data, vary):
+        """Format template multiple times with changing values of keys.
+
+        Parts of template which don't use changing keys are solved only once
+        and each result is created by joining of solved parts with formatted
+        changing keys. Useful e.g. for paths of all frames of sequence.
+
+        Args:
+            data (dict): Data used for all results.
+            vary (dict[str, Iterable[Any]]): Values of top-level keys which
+                change per result. All iterables must have the same length.
+
+        Returns:
+            list[TemplateResult]: Results in order of passed values.
+        """
+
+        vary_keys = list(vary.keys())
+        vary_values = [list(vary[key]) for key in vary_keys]
+        rows_count = len(vary_values[0]) if vary_values else 0
+        for values in vary_values:
+            if len(values) != rows_count:
+                raise ValueError(
+                    "Values of changing keys must have the same length."
+                )
+
+        rows = [
+            dict(zip(vary_keys, row_values))
+            for row_values in zip(*vary_values)
+        ]
+        if not rows:
+            return []
+
+        first_data = dict(data)
+        first_data.update(rows[0])
+        segments = []
+        used_values = {}
+        if not self._prepare_batch_parts(
+            self._parts, first_data, set(vary_keys), segments, used_values
+        ):
+            segments = None
+
+        results = []
+        for row in rows:
+            result = None
+            if segments is not None:
+                result = self._format_batch_row(segments, used_values, row)
+
+            if result is None:
+                item_data = dict(data)
+                item_data.update(row)
+                result = self.format(item_data)
+            results.append(result)
+        return results
+
+    @classmethod
+    def _prepare_batch_parts(
+        cls, parts, data, vary_keys, segments, used_values
+    ):
+        """Solve parts which don't use changing keys.
+
+        Args:
+            parts (list): Template parts.
+            data (dict): Data with first values of changing keys.
+            vary_keys (set[str]): Keys which change per result.
+            segments (list): Output of solved strings and formatting parts
+                of changing keys.
+            used_values (dict): Used values of solved parts by key path.
+
+        Returns:
+            bool: Parts can be solved.
+        """
+
+        for part in parts:
+            if isinstance(part, OptionalPart):
+                optional_segments = []
+                optional_used_values = {}
+                if cls._prepare_batch_parts(
+                    part.parts,
+                    data,
+                    vary_keys,
+                    optional_segments,
+                    optional_used_values
+                ):
+                    for segment in optional_segments:
+                        cls._add_batch_segment(segments, segment)
+                    used_values.update(optional_used_values)
+                continue
+
+            if isinstance(part, six.string_types):
+                cls._add_batch_segment(segments, part)
+                continue
+
+            formatted_value = part.format_value(data)
+            if formatted_value is None:
+                return False
+
+            if part.key_subdict[0] in vary_keys:
+                cls._add_batch_segment(segments, part)
+            else:
+                used_values[part.key_subdict] = formatted_value
+                cls._add_batch_segment(segments, formatted_value)
+        return True
+
+    @staticmethod
+    def _add_batch_segment(segments, segment):
+        if (
+            segments
+            and isinstance(segment, six.string_types)
+            and isinstance(segments[-1], six.string_types)
+        ):
+            segments[-1] += segment
+        else:
+            segments.append(segment)
+
+    def _format_batch_row(self, segments, used_values, row):
+        output = []
+        row_used_values = dict(used_values)
+        formatted_values = {}
+        for segment in segments:
+            if isinstance(segment, six.string_types):
+                output.append(segment)
+                continue
+
+            formatted_value = formatted_values.get(segment.key)
+            if formatted_value is None:
+                formatted_value = segment.format_value(row)
+                if formatted_value is None:
+                    return None
+                formatted_values[segment.key] = formatted_value
+            row_used_values[segment.key_subdict] = formatted_value
+            output.append(formatted_value)
+
+        return TemplateResult(
+            "".join(output),
+            self.template,
+            True,
+            self._used_values_to_dict(row_used_values),
+            [],
+            {}
+        )
+
+    def format_strict_batch(self, data, vary):
+        results = self.format_batch(data, vary)
+        for result in results:
+            result.validate()
+        return results
+
     def format_strict(self, *args, **kwargs):
         result = self.format(*args, **kwargs)
         result.validate()
@@ -704,10 +998,29 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        key = template[1:-1]
+        # check if key expects subdictionary keys (e.g. project[name])
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+
     @property
     def template(self):
         return self._template
 
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def key_subdict(self):
+        return self._key_subdict
+
     def __repr__(self):
         return "<Format:{}>".format(self._template)
 
@@ -725,6 +1038,31 @@ class FormattingPart:
                 return True
         return False
 
+    def format_value(self, data):
+        """Format the formatting string if value is available in data.
+
+        Args:
+            data(dict): Data that should be used for formatting.
+
+        Returns:
+            Union[str, None]: Formatted value or 'None' if key is missing
+                or value has invalid type.
+        """
+
+        value = data
+        for sub_key in self._key_subdict:
+            if not hasattr(value, "items") or sub_key not in value:
+                return None
+            value = value.get(sub_key)
+
+        if value is None or not self.validate_value_type(value):
+            return None
+
+        fill_data = value
+        for sub_key in reversed(self._key_subdict):
+            fill_data = {sub_key: fill_data}
+        return self.template.format(**fill_data)
+
     def format(self, data, result):
         """Format the formattings string.
 
@@ -732,17 +1070,13 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
-        # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = list(self._key_subdict)
 
         value = data
         missing_key = False
@@ -213,8 +213,21 @@ def source_hash(filepath, *args):
     You can specify additional arguments in the function
     to allow for specific 'processing' values to be included.
     """
+    return source_hash_from_stat(filepath, os.stat(filepath), *args)
+
+
+def source_hash_from_stat(filepath, file_stat, *args):
+    """Generate identifier for a source file from already known stat result.
+
+    Output is same as output of 'source_hash' but file is not accessed.
+
+    Args:
+        filepath (str): The source file path.
+        file_stat (os.stat_result): Result of 'os.stat' of the file.
+    """
+
     # We replace dots with comma because . cannot be a key in a pymongo dict.
     file_name = os.path.basename(filepath)
-    time = str(os.path.getmtime(filepath))
-    size = str(os.path.getsize(filepath))
+    time = str(file_stat.st_mtime)
+    size = str(file_stat.st_size)
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
@@ -1,14 +1,25 @@
 import os
 import re
+import time
 import logging
 import json
+import atexit
+import shutil
 import collections
 import tempfile
+import threading
 import subprocess
 import platform
+import multiprocessing
 
 import xml.etree.ElementTree
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 without 'futures' backport - inputs are converted serially
+    ThreadPoolExecutor = None
+
 from .execute import run_subprocess
 from .vendor_bin_utils import (
     get_ffmpeg_tool_path,
@@ -78,23 +89,200 @@ def get_transcode_temp_directory():
     )
 
 
+class MediaProbeCache(object):
+    """Cache of outputs of media probing tools.
+
+    Output of a tool is cached by kind of probe, path to file, modification
+    time and size of the file, so changed file is probed again. Outputs are
+    kept in memory with limited count of items. Optionally can be outputs
+    stored to SQLite database so they can be shared between processes.
+
+    Persistent store is enabled with environment variable
+    'OPENPYPE_MEDIA_PROBE_CACHE'. Value can be path to a database file,
+    which can be shared between processes, or "1" to use database in
+    a new transcoding temp directory of the process, removed on exit.
+
+    Args:
+        max_items (int): Maximum count of outputs kept in memory.
+        db_path (Optional[str]): Path to SQLite database file.
+    """
+
+    default_db_filename = "op_transcoding_probe_cache.sqlite"
+
+    def __init__(self, max_items=512, db_path=None):
+        self._max_items = max_items
+        self._db_path = db_path
+        self._db_initialized = False
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls):
+        db_path = os.environ.get("OPENPYPE_MEDIA_PROBE_CACHE")
+        if db_path == "1":
+            temp_dir = get_transcode_temp_directory()
+            atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
+            db_path = os.path.join(temp_dir, cls.default_db_filename)
+        return cls(db_path=db_path or None)
+
+    def get_key(self, kind, filepath, variant=None):
+        """Cache key for a file.
+
+        Args:
+            kind (str): Kind of probe (e.g. 'oiio' or 'ffprobe').
+            filepath (str): Path to probed file.
+            variant (Optional[str]): Variant of probe arguments.
+
+        Returns:
+            Union[str, None]: Key or 'None' if file is not available.
+        """
+        try:
+            stat = os.stat(filepath)
+        except (OSError, ValueError):
+            return None
+        return json.dumps([
+            kind,
+            os.path.normpath(os.path.abspath(filepath)),
+            stat.st_mtime,
+            stat.st_size,
+            variant
+        ])
+
+    def get(self, key):
+        """Cached output for key.
+
+        Returns:
+            Union[str, None]: Cached output or 'None' if is not cached.
+        """
+        with self._lock:
+            value = self._items.pop(key, None)
+            if value is not None:
+                self._items[key] = value
+                self.hits += 1
+                return value
+
+        value = self._db_get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._memory_set(key, value)
+        return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._memory_set(key, value)
+        self._db_set(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def _memory_set(self, key, value):
+        self._items.pop(key, None)
+        self._items[key] = value
+        while len(self._items) > self._max_items:
+            self._items.popitem(last=False)
+
+    def _db_connect(self):
+        import sqlite3
+
+        connection = sqlite3.connect(self._db_path, timeout=10)
+        if not self._db_initialized:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS probe_cache"
+                " (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._db_initialized = True
+        return connection
+
+    def _db_get(self, key):
+        if not self._db_path:
+            return None
+        try:
+            connection = self._db_connect()
+            try:
+                row = connection.execute(
+                    "SELECT value FROM probe_cache WHERE key = ?", (key, )
+                ).fetchone()
+            finally:
+                connection.close()
+        except Exception:
+            logging.getLogger(__name__).debug(
+                "Failed to read media probe cache.", exc_info=True
+            )
+            return None
+        if row is None:
+            return None
+        return row[0]
+
+    def _db_set(self, key, value):
+        if not self._db_path:
+            return
+        try:
+            connection = self._db_connect()
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO probe_cache (key, value)"
+                        " VALUES (?, ?)",
+                        (key, value)
+                    )
+            finally:
+                connection.close()
+        except Exception:
+            logging.getLogger(__name__).debug(
+                "Failed to store media probe cache.", exc_info=True
+            )
+
+
+_MEDIA_PROBE_CACHE = None
+
+
+def get_media_probe_cache():
+    """Media probe cache shared in process.
+
+    Returns:
+        MediaProbeCache: Cache object.
+    """
+    global _MEDIA_PROBE_CACHE
+    if _MEDIA_PROBE_CACHE is None:
+        _MEDIA_PROBE_CACHE = MediaProbeCache.from_env()
+    return _MEDIA_PROBE_CACHE
+
+
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Output of oiiotool is cached
+    until the file changes.
     """
-    args = [
-        get_oiio_tools_path(),
-        "--info",
-        "-v"
-    ]
-    if subimages:
-        args.append("-a")
+    probe_cache = get_media_probe_cache()
+    cache_key = probe_cache.get_key(
+        "oiio", filepath, "subimages" if subimages else None
+    )
+    output = None
+    if cache_key is not None:
+        output = probe_cache.get(cache_key)
 
-    args.extend(["-i:infoformat=xml", filepath])
+    if output is None:
+        args = [
+            get_oiio_tools_path(),
+            "--info",
+            "-v"
+        ]
+        if subimages:
+            args.append("-a")
 
-    output = run_subprocess(args, logger=logger)
-    output = output.replace("\r\n", "\n")
+        args.extend(["-i:infoformat=xml", filepath])
+
+        output = run_subprocess(args, logger=logger)
+        output = output.replace("\r\n", "\n")
+        if cache_key is not None and "<ImageSpec" in output:
+            probe_cache.set(cache_key, output)
 
     xml_started = False
     subimages_lines = []
@@ -585,7 +773,8 @@ def convert_for_ffmpeg(
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=1
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -598,16 +787,26 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Input paths can be split into chunks converted in parallel. Each chunk
+    is converted by one worker thread which launches 'oiiotool' for each
+    file of the chunk. Chunk stops on first failure and other chunks are
+    stopped too. Errors of all failed chunks are reported in one exception.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of samy type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of parallel conversions.
+            Count of CPUs is used if 'None' or lower than 1 is passed. Inputs
+            are converted serially if 'concurrent.futures' is not available
+            (Python 2).
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
             Currently is supported only ".exr" extension.
+        RuntimeError: If conversion of any input failed.
     """
     if logger is None:
         logger = logging.getLogger(__name__)
@@ -654,72 +853,176 @@ def convert_input_paths_for_ffmpeg(
         # - this option is crashing if used on multipart exrs
         input_arg += ":ch={}".format(input_channels_str)
 
-    for input_path in input_paths:
-        # Prepare subprocess arguments
-        oiio_cmd = [
-            get_oiio_tools_path(),
+    # Prepare subprocess arguments
+    oiio_cmd_head = [
+        get_oiio_tools_path(),
 
-            # Don't add any additional attributes
-            "--nosoftwareattrib",
-        ]
-        # Add input compression if available
-        if compression:
-            oiio_cmd.extend(["--compression", compression])
+        # Don't add any additional attributes
+        "--nosoftwareattrib",
+    ]
+    # Add input compression if available
+    if compression:
+        oiio_cmd_head.extend(["--compression", compression])
+    oiio_cmd_head.append(input_arg)
 
-        oiio_cmd.extend([
-            input_arg, input_path,
-            # Tell oiiotool which channels should be put to top stack
-            #   (and output)
-            "--ch", channels_arg,
-            # Use first subimage
-            "--subimage", "0"
-        ])
+    oiio_cmd_tail = [
+        # Tell oiiotool which channels should be put to top stack
+        #   (and output)
+        "--ch", channels_arg,
+        # Use first subimage
+        "--subimage", "0"
+    ]
 
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing unallowed symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
 
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing unallowed symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            oiio_cmd_tail.extend(["--eraseattrib", attr_name])
+
+    if ThreadPoolExecutor is None:
+        max_workers = 1
+    elif not max_workers or max_workers < 1:
+        max_workers = multiprocessing.cpu_count()
+    max_workers = min(max_workers, len(input_paths))
+
+    # Split inputs to continuous chunks, one chunk per worker
+    chunk_size, remainder = divmod(len(input_paths), max_workers)
+    chunks = []
+    start_idx = 0
+    for idx in range(max_workers):
+        end_idx = start_idx + chunk_size
+        if idx < remainder:
+            end_idx += 1
+        chunks.append(input_paths[start_idx:end_idx])
+        start_idx = end_idx
+
+    stop_event = threading.Event()
+    start_time = time.time()
+    if len(chunks) == 1:
+        results = [_convert_paths_chunk(
+            chunks[0], output_dir, oiio_cmd_head, oiio_cmd_tail,
+            stop_event, logger
+        )]
+    else:
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(executor.map(
+                lambda chunk: _convert_paths_chunk(
+                    chunk, output_dir, oiio_cmd_head, oiio_cmd_tail,
+                    stop_event, logger
+                ),
+                chunks
+            ))
+
+    durations = []
+    failed_chunks = []
+    for chunk, (chunk_durations, error) in zip(chunks, results):
+        durations.extend(chunk_durations)
+        if error is not None:
+            failed_chunks.append((chunk, error))
+
+    if durations:
+        logger.debug((
+            "Converted {} of {} files in {:.2f}s using {} worker(s)."
+            " Per file average {:.2f}s, maximum {:.2f}s."
+        ).format(
+            len(durations),
+            len(input_paths),
+            time.time() - start_time,
+            len(chunks),
+            sum(durations) / len(durations),
+            max(durations)
+        ))
+
+    if failed_chunks:
+        messages = []
+        for chunk, (input_path, exc) in failed_chunks:
+            messages.append(
+                "Chunk \"{}\" - \"{}\" failed on \"{}\": {}".format(
+                    os.path.basename(chunk[0]),
+                    os.path.basename(chunk[-1]),
+                    input_path,
+                    exc
                 )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+            )
+        raise RuntimeError(
+            "Conversion for ffmpeg failed.\n{}".format("\n".join(messages))
+        )
+
+
+def _convert_paths_chunk(
+    input_paths, output_dir, oiio_cmd_head, oiio_cmd_tail, stop_event, logger
+):
+    """Convert chunk of input paths one by one.
+
+    Args:
+        input_paths (list[str]): Paths to convert.
+        output_dir (str): Path to directory where output will be rendered.
+        oiio_cmd_head (list[str]): Arguments before input path.
+        oiio_cmd_tail (list[str]): Arguments after input path.
+        stop_event (threading.Event): Conversion is stopped when is set.
+            Event is set when conversion of any path fails.
+        logger (logging.Logger): Logger used for logging.
+
+    Returns:
+        tuple[list[float], Union[tuple[str, Exception], None]]: Durations
+            of converted files and failed input path with error.
+    """
+    durations = []
+    for input_path in input_paths:
+        if stop_event.is_set():
+            break
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
         output_path = os.path.join(output_dir, base_filename)
-        oiio_cmd.extend([
-            "-o", output_path
-        ])
+        oiio_cmd = (
+            list(oiio_cmd_head)
+            + [input_path]
+            + list(oiio_cmd_tail)
+            + ["-o", output_path]
+        )
 
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+        start_time = time.time()
+        try:
+            run_subprocess(oiio_cmd, logger=logger)
+        except Exception as exc:
+            stop_event.set()
+            return durations, (input_path, exc)
+        durations.append(time.time() - start_time)
+    return durations, None
 
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Output of ffprobe is cached until the file changes.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
@@ -729,6 +1032,14 @@ def get_ffprobe_data(path_to_file, logger=None):
     logger.info(
         "Getting information about input \"{}\".".format(path_to_file)
     )
+    probe_cache = get_media_probe_cache()
+    cache_key = probe_cache.get_key("ffprobe", path_to_file)
+    if cache_key is not None:
+        output = probe_cache.get(cache_key)
+        if output is not None:
+            logger.debug("Using cached FFprobe output.")
+            return json.loads(output)
+
     args = [
         get_ffmpeg_tool_path("ffprobe"),
         "-hide_banner",
@@ -770,6 +1081,9 @@ def get_ffprobe_data(path_to_file, logger=None):
             popen_stderr.decode("utf-8")
         ))
 
+    if cache_key is not None and popen.returncode == 0:
+        probe_cache.set(cache_key, popen_stdout.decode("utf-8"))
+
     return json.loads(popen_stdout)
 
 
@@ -21,6 +21,7 @@ from openpype.pipeline import (
 from openpype.tests.lib import is_in_tests
 from openpype.pipeline.farm.patterning import match_aov_pattern
 from openpype.lib import is_running_from_build
+from openpype.lib.file_transaction import FileTransaction
 
 
 def get_resources(project_name, version, extension=None):
@@ -182,6 +183,14 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
     # poor man exclusion
     skip_integration_repre_list = []
 
+    # Copy of existing frames on extend frames
+    # - more than 1 worker copy frames concurrently, frames are copied
+    #   serially in Python 2 hosts where 'concurrent.futures' is missing
+    extend_frames_max_workers = 8
+    # - hardlink frames instead of copy if rendered frames override
+    #   existing frames (rendered frames are never hardlinked)
+    extend_frames_hardlink = False
+
     def _create_metadata_path(self, instance):
         ins_data = instance.data
         # Ensure output dir exists
@@ -373,12 +382,9 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
             representation (dict): presentation to operate on
 
         """
-        import speedcopy
-
         self.log.info("Preparing to copy ...")
         start = instance.data.get("frameStart")
         end = instance.data.get("frameEnd")
-        project_name = legacy_io.active_project()
 
         # get latest version of subset
         # this will stop if subset wasn't published yet
@@ -393,11 +399,13 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
         subset_resources = get_resources(
             project_name, version, representation.get("ext")
         )
-        r_col, _ = clique.assemble(subset_resources)
+        r_cols, _ = clique.assemble(subset_resources)
+        r_col = r_cols[0]
 
         # if override remove all frames we are expecting to be rendered
         # so we'll copy only those missing from current render
-        if instance.data.get("overrideExistingFrame"):
+        override_existing = instance.data.get("overrideExistingFrame")
+        if override_existing:
             for frame in range(start, end + 1):
                 if frame not in r_col.indexes:
                     continue
@@ -406,27 +414,24 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
         # now we need to translate published names from representation
         # back. This is tricky, right now we'll just use same naming
         # and only switch frame numbers
-        resource_files = []
         r_filename = os.path.basename(
             representation.get("files")[0])  # first file
         op = re.search(self.R_FRAME_NUMBER, r_filename)
+        assert op is not None, "padding string wasn't found"
         pre = r_filename[:op.start("frame")]
         post = r_filename[op.end("frame"):]
-        assert op is not None, "padding string wasn't found"
+        staging = self.anatomy.fill_root(representation.get("stagingDir"))
+
+        # list of tuples (source, destination)
+        resource_files = []
         for frame in list(r_col):
             fn = re.search(self.R_FRAME_NUMBER, frame)
             # silencing linter as we need to compare to True, not to
             # type
             assert fn is not None, "padding string wasn't found"
-            # list of tuples (source, destination)
-            staging = representation.get("stagingDir")
-            staging = self.anatomy.fill_root(staging)
             resource_files.append(
                 (frame,
-                 os.path.join(staging,
-                              "{}{}{}".format(pre,
-                                              fn.group("frame"),
-                                              post)))
+                 os.path.join(staging, pre + fn.group("frame") + post))
             )
 
         # test if destination dir exists and create it if not
@@ -434,10 +439,26 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
         if not os.path.isdir(output_dir):
             os.makedirs(output_dir)
 
+        # Copied frames are not rendered again so they can be hardlinked
+        #   only if all rendered frames were removed
+        mode = FileTransaction.MODE_COPY
+        if self.extend_frames_hardlink and override_existing:
+            mode = FileTransaction.MODE_HARDLINK
+
         # copy files
-        for source in resource_files:
-            speedcopy.copy(source[0], source[1])
-            self.log.info("  > {}".format(source[1]))
+        file_transactions = FileTransaction(
+            log=self.log,
+            max_workers=self.extend_frames_max_workers
+        )
+        for src, dst in resource_files:
+            file_transactions.add(src, dst, mode=mode)
+
+        try:
+            file_transactions.process()
+        except Exception:
+            file_transactions.rollback()
+            raise
+        file_transactions.finalize()
 
         self.log.info(
             "Finished copying %i files" % len(resource_files))
@@ -570,6 +570,9 @@ def cli_main():
               help="Clockify API key.")
 @click.option("--clockify-workspace", envvar="CLOCKIFY_WORKSPACE",
               help="Clockify workspace")
+@click.option("--event-workers", envvar="OPENPYPE_FTRACK_EVENT_WORKERS",
+              type=int, default=None,
+              help="Count of threads processing events concurrently")
 def eventserver(
     debug,
     ftrack_url,
@@ -577,7 +580,8 @@ def eventserver(
     ftrack_api_key,
     legacy,
     clockify_api_key,
-    clockify_workspace
+    clockify_workspace,
+    event_workers
 ):
     """Launch ftrack event server.
 
@@ -595,5 +599,6 @@ def eventserver(
         ftrack_api_key,
         legacy,
         clockify_api_key,
-        clockify_workspace
+        clockify_workspace,
+        event_workers
     )
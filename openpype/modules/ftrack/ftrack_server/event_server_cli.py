@@ -26,7 +26,10 @@ from openpype_modules.ftrack import (
 )
 from openpype_modules.ftrack.lib import credentials
 from openpype_modules.ftrack.ftrack_server import socket_thread
-from openpype_modules.ftrack.ftrack_server.lib import get_host_ip
+from openpype_modules.ftrack.ftrack_server.lib import (
+    get_host_ip,
+    EVENT_WORKERS_ENV_KEY,
+)
 
 
 class MongoPermissionsError(Exception):
@@ -430,7 +433,8 @@ def run_event_server(
     ftrack_api_key,
     legacy,
     clockify_api_key,
-    clockify_workspace
+    clockify_workspace,
+    event_workers=None
 ):
     if not ftrack_user or not ftrack_api_key:
         print((
@@ -445,6 +449,10 @@ def run_event_server(
         os.environ["CLOCKIFY_WORKSPACE"] = clockify_workspace
         os.environ["CLOCKIFY_API_KEY"] = clockify_api_key
 
+    # Count of threads in event processor subprocess
+    if event_workers:
+        os.environ[EVENT_WORKERS_ENV_KEY] = str(event_workers)
+
     # Check url regex and accessibility
     ftrack_url = resolve_ftrack_url(ftrack_url)
     if not ftrack_url:
@@ -31,6 +31,7 @@ from openpype.lib import Logger
 
 TOPIC_STATUS_SERVER = "openpype.event.server.status"
 TOPIC_STATUS_SERVER_RESULT = "openpype.event.server.status.result"
+EVENT_WORKERS_ENV_KEY = "OPENPYPE_FTRACK_EVENT_WORKERS"
 
 
 def get_host_ip():
@@ -43,6 +44,123 @@ def get_host_ip():
     return None
 
 
+def get_event_workers_count():
+    """Count of threads processing events concurrently in processor."""
+    try:
+        return max(1, int(os.environ.get(EVENT_WORKERS_ENV_KEY) or 1))
+    except ValueError:
+        return 1
+
+
+def get_event_ordering_key(event):
+    """Key of events which must be processed in order they were stored.
+
+    Events of the same project share the key. Events without entities
+    (e.g. actions) are independent.
+
+    Args:
+        event (ftrack_api.event.base.Event): Processed event.
+
+    Returns:
+        str: Ordering key.
+    """
+    entities_info = event["data"].get("entities") or []
+    for entity_info in entities_info:
+        if entity_info.get("entityType") == "show":
+            return entity_info["entityId"]
+
+        for parent in entity_info.get("parents") or []:
+            if parent.get("entityType") == "show":
+                return parent["entityId"]
+
+    for entity_info in entities_info:
+        if entity_info.get("entityId"):
+            return entity_info["entityId"]
+    return event["id"]
+
+
+class EventHandlerMetrics(object):
+    """Count and duration of calls of event handlers.
+
+    Args:
+        log_interval (float): Seconds between logging of metrics.
+    """
+
+    def __init__(self, log_interval=300):
+        self.log_interval = log_interval
+        self._lock = threading.Lock()
+        self._last_log = time.time()
+        self._metrics = {}
+
+    def add(self, handler_name, duration):
+        with self._lock:
+            metrics = self._metrics.get(handler_name)
+            if metrics is None:
+                metrics = {"count": 0, "total": 0.0, "max": 0.0}
+                self._metrics[handler_name] = metrics
+            metrics["count"] += 1
+            metrics["total"] += duration
+            metrics["max"] = max(metrics["max"], duration)
+
+    def get_metrics(self):
+        """Copy of metrics by handler name.
+
+        Returns:
+            dict[str, dict[str, Any]]: Count, total and max duration of calls
+                by handler name.
+        """
+        with self._lock:
+            return {
+                handler_name: dict(metrics)
+                for handler_name, metrics in self._metrics.items()
+            }
+
+    def log_metrics(self, log, force=False):
+        """Log metrics if 'log_interval' elapsed since last log."""
+        now = time.time()
+        if not force and now - self._last_log < self.log_interval:
+            return
+        self._last_log = now
+        lines = []
+        for handler_name, metrics in sorted(self.get_metrics().items()):
+            lines.append(
+                "{}: {} calls, avg {:.3f}s, max {:.3f}s".format(
+                    handler_name,
+                    metrics["count"],
+                    metrics["total"] / metrics["count"],
+                    metrics["max"]
+                )
+            )
+        if lines:
+            log.info("Event handlers latency:\n{}".format("\n".join(lines)))
+
+
+def _get_callback_name(callback):
+    owner = getattr(callback, "__self__", None)
+    if owner is not None:
+        return owner.__class__.__name__
+    return getattr(callback, "__qualname__", None) or str(callback)
+
+
+def _timed_callback(hub, callback):
+    """Wrap subscriber callback to store its duration to hub metrics."""
+    # Skip internal callbacks of event hub
+    if getattr(callback, "__self__", None) is hub:
+        return callback
+
+    handler_name = _get_callback_name(callback)
+
+    def timed_callback(event):
+        started = time.time()
+        try:
+            return callback(event)
+        finally:
+            metrics = hub.handler_metrics
+            if metrics is not None:
+                metrics.add(handler_name, time.time() - started)
+    return timed_callback
+
+
 class SocketBaseEventHub(ftrack_api.event.hub.EventHub):
 
     hearbeat_msg = b"hearbeat"
@@ -111,24 +229,177 @@ class StorerEventHub(SocketBaseEventHub):
         )
 
 
+class OrderedEventsPool(object):
+    """Threads processing events concurrently.
+
+    Events with the same ordering key are processed one by one in order
+    they were added, events with different keys are processed in parallel.
+
+    Args:
+        sessions (list[ftrack_api.Session]): Session for each worker thread
+            with registered event handlers.
+        process_callback (Callable[[EventHub, Event], None]): Callback
+            processing the event with event hub of worker session.
+    """
+
+    def __init__(self, sessions, process_callback):
+        self._sessions = sessions
+        self._process_callback = process_callback
+        self._condition = threading.Condition()
+        self._pending = collections.OrderedDict()
+        self._active_keys = set()
+        self._stopped = False
+        self.error = None
+        self._threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(session, ),
+                name="FtrackEventWorker{}".format(idx)
+            )
+            for idx, session in enumerate(sessions)
+        ]
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+
+    def put(self, key, event):
+        with self._condition:
+            if key not in self._pending:
+                self._pending[key] = collections.deque()
+            self._pending[key].append(event)
+            self._condition.notify()
+
+    def stop(self):
+        """Stop workers after currently processed events."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+        for thread in self._threads:
+            thread.join()
+
+        for session in self._sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    def _get_next(self):
+        with self._condition:
+            while not self._stopped:
+                for key, events in self._pending.items():
+                    if key in self._active_keys:
+                        continue
+                    event = events.popleft()
+                    if not events:
+                        self._pending.pop(key)
+                    self._active_keys.add(key)
+                    return key, event
+                self._condition.wait()
+        return None, None
+
+    def _worker(self, session):
+        while True:
+            key, event = self._get_next()
+            if event is None:
+                break
+
+            try:
+                self._process_callback(session.event_hub, event)
+            except Exception as exc:
+                # Error which can't be handled by event handlers
+                self.error = exc
+            finally:
+                with self._condition:
+                    self._active_keys.discard(key)
+                    self._condition.notify_all()
+
+
+class ProcessWorkerEventHub(ftrack_api.event.hub.EventHub):
+    """Event hub of worker session of processor.
+
+    Events are not received from server but passed by 'ProcessEventHub'.
+    """
+
+    handler_metrics = None
+
+    def _add_subscriber(self, subscription, callback, *args, **kwargs):
+        return super(ProcessWorkerEventHub, self)._add_subscriber(
+            subscription, _timed_callback(self, callback), *args, **kwargs
+        )
+
+    def _notify_server_about_subscriber(self, subscriber):
+        # Server should not send events to worker sessions
+        return
+
+    def _handle_packet(self, code, packet_identifier, path, data):
+        code_name = self._code_name_mapping[code]
+        if code_name == "event":
+            return
+
+        return super(ProcessWorkerEventHub, self)._handle_packet(
+            code, packet_identifier, path, data
+        )
+
+
 class ProcessEventHub(SocketBaseEventHub):
+    """Event hub processing events stored in Mongo.
+
+    Events are processed by 'workers_count' threads, each with own session
+    created by 'worker_session_factory'. Events are processed in main thread
+    by this hub when factory is not set or 'workers_count' is 1.
+    """
+
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
+    # Maximum count of loaded events waiting for processing by each worker
+    max_pending_events = 100
+    # Maximum count of events loaded from Mongo DB at once
+    load_limit = 100
+    # Watch Mongo change stream for new events instead of polling
+    use_change_stream = True
+    # Seconds between loads of events when change stream is not available
+    poll_interval = 0.5
+    # Seconds between loads of events which may be missed by change stream
+    reload_interval = 30
+    # Processed events are set in Mongo together when count of them reaches
+    #   'ack_batch_size' or oldest of them waits longer than 'ack_interval'
+    ack_batch_size = 50
+    ack_interval = 1.0
+    # Seconds between removals of old processed events
+    cleanup_interval = 3600
 
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
+        self.workers_count = get_event_workers_count()
+        self.worker_session_factory = None
+        self.handler_metrics = EventHandlerMetrics()
+        self._processing_ids = set()
+        self._processing_lock = threading.Lock()
+        self._processed_ids = []
+        self._first_processed_time = None
+        self._events_stream = None
+        self._new_events = threading.Event()
+        self._load_signal = object()
+        self._stop_event = threading.Event()
 
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
+    def _add_subscriber(self, subscription, callback, *args, **kwargs):
+        return super(ProcessEventHub, self)._add_subscriber(
+            subscription, _timed_callback(self, callback), *args, **kwargs
+        )
+
     def prepare_dbcon(self):
         try:
             database_name, collection_name = get_ftrack_event_mongo_info()
             mongo_client = OpenPypeMongoConnection.get_mongo_client()
             self.dbcon = mongo_client[database_name][collection_name]
             self.mongo_client = mongo_client
+            self._create_indexes()
 
         except pymongo.errors.AutoReconnect:
             self.pypelog.error((
@@ -145,37 +416,252 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+    def _create_indexes(self):
+        """Index fields used to query not processed and old events."""
+        try:
+            self.dbcon.create_index([
+                ("pype_data.is_processed", pymongo.ASCENDING),
+                ("pype_data.stored", pymongo.ASCENDING)
+            ])
+        except pymongo.errors.OperationFailure:
+            self.pypelog.warning(
+                "Failed to create index of events collection.",
+                exc_info=True
+            )
+
+    def _create_workers_pool(self):
+        if self.workers_count < 2 or self.worker_session_factory is None:
+            return None
+
+        sessions = []
+        for _ in range(self.workers_count):
+            session = self.worker_session_factory()
+            session.event_hub.handler_metrics = self.handler_metrics
+            sessions.append(session)
+
+        self.pypelog.info(
+            "Processing events with {} workers".format(len(sessions))
+        )
+        return OrderedEventsPool(sessions, self._process_event)
+
+    def _process_event(self, hub, event):
+        """Handle event by 'hub' and set it as processed in Mongo DB."""
+        mongo_id = event["data"].get("_event_mongo_id")
+        try:
+            hub._handle(event)
+
+        except Exception:
+            if mongo_id is not None:
+                with self._processing_lock:
+                    self._processing_ids.discard(mongo_id)
+            raise
+
+        if mongo_id is not None:
+            # Id stays in processing ids until is set as processed in Mongo
+            #   so the event is not loaded again
+            with self._processing_lock:
+                if not self._processed_ids:
+                    self._first_processed_time = time.time()
+                self._processed_ids.append(mongo_id)
+
+    def flush_processed(self, force=False):
+        """Set processed events as processed in Mongo DB with single update.
+
+        Args:
+            force (bool): Flush even if batch size or interval is not reached.
+        """
+        with self._processing_lock:
+            if not self._processed_ids:
+                return
+            if not force and (
+                len(self._processed_ids) < self.ack_batch_size
+                and time.time() - self._first_processed_time
+                < self.ack_interval
+            ):
+                return
+            processed_ids = self._processed_ids
+            self._processed_ids = []
+
+        try:
+            self.dbcon.update_many(
+                {"_id": {"$in": processed_ids}},
+                {"$set": {"pype_data.is_processed": True}}
+            )
+        except Exception:
+            # Keep ids for next flush
+            with self._processing_lock:
+                self._processed_ids[:0] = processed_ids
+            raise
+
+        with self._processing_lock:
+            self._processing_ids.difference_update(processed_ids)
+
+    def _mongo_not_responding(self):
+        self.pypelog.error((
+            "Mongo server \"{}\" is not responding, exiting."
+        ).format(os.environ["OPENPYPE_MONGO"]))
+        sys.exit(0)
+
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty and new events
+        were stored (signaled by change stream) or periodically when change
+        stream is not available. Handled events are set as processed in Mongo
+        DB in batches and old processed events are removed in background.
         """
         started = time.time()
         self.prepare_dbcon()
+        self._stop_event.clear()
+        threads = [
+            self._start_thread(self._cleanup_loop, "EventsCleanup")
+        ]
+        stream = self._open_events_stream()
+        if stream is not None:
+            threads.append(self._start_thread(
+                lambda: self._watch_events(stream), "EventsStream"
+            ))
+
+        pool = self._create_workers_pool()
+        try:
+            self._wait(started, duration, pool)
+        finally:
+            if pool is not None:
+                pool.stop()
+            self._stop_event.set()
+            try:
+                self.flush_processed(force=True)
+            except pymongo.errors.PyMongoError:
+                self.pypelog.warning(
+                    "Failed to set processed events in Mongo.", exc_info=True
+                )
+            for thread in threads:
+                thread.join(timeout=5)
+            self.handler_metrics.log_metrics(self.pypelog, force=True)
+
+    def _start_thread(self, target, name):
+        thread = threading.Thread(target=target, name=name)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def _open_events_stream(self):
+        """Open change stream of stored not processed events.
+
+        Change streams are available only on replica set or sharded cluster,
+        events are polled from Mongo DB otherwise.
+
+        Returns:
+            Union[pymongo.change_stream.CollectionChangeStream, None]: Change
+                stream or None when is not available.
+        """
+        self._events_stream = None
+        if not self.use_change_stream:
+            return None
+
+        pipeline = [{"$match": {
+            "operationType": {"$in": ["insert", "replace"]},
+            "fullDocument.pype_data.is_processed": False
+        }}]
+        try:
+            stream = self.dbcon.watch(pipeline, max_await_time_ms=1000)
+        except pymongo.errors.PyMongoError as exc:
+            self.pypelog.info((
+                "Change stream of events is not available, polling for new"
+                " events. {}"
+            ).format(exc))
+            return None
+
+        self._events_stream = stream
+        return stream
+
+    def _watch_events(self, stream):
+        """Wake up processing when new event is stored."""
+        try:
+            while not self._stop_event.is_set():
+                if stream.try_next() is not None:
+                    self._notify_new_events()
+
+        except pymongo.errors.PyMongoError:
+            self.pypelog.warning(
+                "Change stream of events failed, polling for new events.",
+                exc_info=True
+            )
+            self._events_stream = None
+            self._notify_new_events()
+
+        finally:
+            stream.close()
+
+    def _notify_new_events(self):
+        if not self._new_events.is_set():
+            self._new_events.set()
+            self._event_queue.put(self._load_signal)
+
+    def _cleanup_loop(self):
+        while True:
+            try:
+                self.cleanup_events()
+            except pymongo.errors.PyMongoError:
+                self.pypelog.warning(
+                    "Failed to remove old events.", exc_info=True
+                )
+            if self._stop_event.wait(self.cleanup_interval):
+                break
+
+    def cleanup_events(self):
+        """Remove processed events older than 3 days."""
+        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
+        self.dbcon.delete_many({
+            "pype_data.stored": {"$lte": ago_date},
+            "pype_data.is_processed": True
+        })
+
+    def _should_load_events(self, last_load):
+        if self._events_stream is None or self._new_events.is_set():
+            return True
+        return time.time() - last_load > self.reload_interval
+
+    def _wait(self, started, duration, pool):
+        last_load = 0
         while True:
+            if pool is not None and pool.error is not None:
+                if isinstance(pool.error, pymongo.errors.AutoReconnect):
+                    self._mongo_not_responding()
+                raise pool.error
+
+            self.handler_metrics.log_metrics(self.pypelog)
+            try:
+                self.flush_processed()
+            except pymongo.errors.AutoReconnect:
+                self._mongo_not_responding()
+
             try:
                 event = self._event_queue.get(timeout=0.1)
             except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
+                event = self._load_signal
+
+            if event is self._load_signal:
+                if self._should_load_events(last_load):
+                    self._new_events.clear()
+                    last_load = time.time()
+                    if (
+                        not self.load_events()
+                        and self._events_stream is None
+                    ):
+                        time.sleep(self.poll_interval)
+
+            elif (
+                pool is not None
+                and event["data"].get("_event_mongo_id") is not None
+            ):
+                pool.put(get_event_ordering_key(event), event)
+
             else:
                 try:
-                    self._handle(event)
-
-                    mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
+                    self._process_event(self, event)
 
                 except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["OPENPYPE_MONGO"]))
-                    sys.exit(0)
+                    self._mongo_not_responding()
                 # Additional special processing of events.
                 if event['topic'] == 'ftrack.meta.disconnected':
                     break
@@ -186,20 +672,31 @@ class ProcessEventHub(SocketBaseEventHub):
 
     def load_events(self):
         """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
-        self.dbcon.delete_many({
-            "pype_data.stored": {"$lte": ago_date},
-            "pype_data.is_processed": True
-        })
+        with self._processing_lock:
+            processing_ids = list(self._processing_ids)
+
+        # Don't load more events when workers are busy
+        max_pending = self.max_pending_events * max(1, self.workers_count)
+        if len(processing_ids) >= max_pending:
+            # Try again when events are processed
+            self._new_events.set()
+            return False
+
+        query = {"pype_data.is_processed": False}
+        # Skip events which are already being processed
+        if processing_ids:
+            query["_id"] = {"$nin": processing_ids}
 
         not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
+            query
         ).sort(
             [("pype_data.stored", pymongo.ASCENDING)]
-        ).limit(100)
+        ).limit(self.load_limit)
 
         found = False
+        loaded_count = 0
         for event_data in not_processed_events:
+            loaded_count += 1
             new_event_data = {
                 k: v for k, v in event_data.items()
                 if k not in ["_id", "pype_data"]
@@ -214,8 +711,13 @@ class ProcessEventHub(SocketBaseEventHub):
                 ))
                 continue
             found = True
+            with self._processing_lock:
+                self._processing_ids.add(event_data["_id"])
             self._event_queue.put(event)
 
+        # Not all stored events may be loaded at once
+        if loaded_count >= self.load_limit:
+            self._new_events.set()
         return found
 
     def _handle_packet(self, code, packet_identifier, path, data):
@@ -397,6 +899,15 @@ class CustomEventHubSession(ftrack_api.session.Session):
         )
 
 
+class ProcessWorkerSession(CustomEventHubSession):
+    def _create_event_hub(self):
+        return ProcessWorkerEventHub(
+            self._server_url,
+            self._api_user,
+            self._api_key
+        )
+
+
 class SocketSession(CustomEventHubSession):
     def _create_event_hub(self):
         self.sock = self.kwargs["sock"]
@@ -3,12 +3,14 @@ import sys
 import signal
 import socket
 import datetime
+import functools
 
 import ftrack_api
 
 from openpype_modules.ftrack.ftrack_server.ftrack_server import FtrackServer
 from openpype_modules.ftrack.ftrack_server.lib import (
     SocketSession,
+    ProcessWorkerSession,
     ProcessEventHub,
     TOPIC_STATUS_SERVER
 )
@@ -64,6 +66,23 @@ def register(session):
     )
 
 
+def create_worker_session(handler_paths):
+    """Create session with registered event handlers for processor worker.
+
+    Args:
+        handler_paths (list[str]): Paths to event handlers.
+
+    Returns:
+        ProcessWorkerSession: Session processing events in worker thread.
+    """
+    session = ProcessWorkerSession(auto_connect_event_hub=True)
+    register(session)
+    server = FtrackServer(handler_paths)
+    server.session = session
+    server.set_files(handler_paths)
+    return session
+
+
 def main(args):
     log = Logger.get_logger("Event processor")
 
@@ -88,9 +107,11 @@ def main(args):
 
         manager = ModulesManager()
         ftrack_module = manager.modules_by_name["ftrack"]
-        server = FtrackServer(
-            ftrack_module.server_event_handlers_paths
+        handler_paths = ftrack_module.server_event_handlers_paths
+        session.event_hub.worker_session_factory = functools.partial(
+            create_worker_session, handler_paths
         )
+        server = FtrackServer(handler_paths)
         log.debug("Launched Ftrack Event processor")
         server.run_server(session)
 
@@ -1,5 +1,6 @@
 """Python 3 only implementation."""
 import os
+import time
 import asyncio
 import threading
 import concurrent.futures
@@ -285,6 +286,79 @@ def download_last_published_workfile(
     return last_published_workfile_path
 
 
+async def _transfer_result(task, info):
+    """Await transfer task and return its result with processed file info.
+
+    Exception raised in task is returned as result, cancelled task is
+    failed transfer.
+    """
+    try:
+        result = await task
+    except asyncio.CancelledError:
+        result = asyncio.CancelledError("Transfer was cancelled")
+    except Exception as exc:
+        result = exc
+    return result, info
+
+
+class SiteUpdatesBuffer:
+    """
+        Collects results of file transfers and writes them to DB in bulk.
+
+        Results are written when count of collected results reaches
+        'flush_size' or when oldest result waits longer than 'flush_latency'
+        seconds. Waiting results are not written without new result, caller
+        should wait at most 'flush_timeout' seconds for next result and call
+        'flush_outdated'. Remaining results must be written with 'flush'.
+    """
+    def __init__(self, module, project_name, flush_size, flush_latency):
+        self.module = module
+        self.project_name = project_name
+        self.flush_size = flush_size
+        self.flush_latency = flush_latency
+        self.write_count = 0
+        self.duration = 0.0
+        self._results = []
+        self._first_added = None
+
+    def add(self, new_file_id, file, representation, site, error):
+        if not self._results:
+            self._first_added = time.time()
+        self._results.append((new_file_id, file, representation, site, error))
+        if len(self._results) >= self.flush_size:
+            self.flush()
+        else:
+            self.flush_outdated()
+
+    def flush_timeout(self):
+        """Seconds until oldest collected result should be written.
+
+        Returns:
+            Union[float, None]: None if there are no results to write.
+        """
+        if not self._results:
+            return None
+        return max(
+            0.0, self._first_added + self.flush_latency - time.time()
+        )
+
+    def flush_outdated(self):
+        """Write results if oldest of them waits longer than 'flush_latency'.
+        """
+        if self._results and self.flush_timeout() == 0.0:
+            self.flush()
+
+    def flush(self):
+        if not self._results:
+            return
+        start_time = time.time()
+        results, self._results = self._results, []
+        self.write_count += self.module.update_db_bulk(
+            self.project_name, results
+        )
+        self.duration += time.time() - start_time
+
+
 class SyncServerThread(threading.Thread):
     """
         Separate thread running synchronization server with asyncio loop.
@@ -299,6 +373,8 @@ class SyncServerThread(threading.Thread):
         self.is_running = False
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
         self.timer = None
+        # durations of parts of last loop, for debugging of performance
+        self.last_loop_metrics = {}
 
     def run(self):
         self.is_running = True
@@ -336,8 +412,15 @@ class SyncServerThread(threading.Thread):
         """
         while self.is_running and not self.module.is_paused():
             try:
-                import time
                 start_time = time.time()
+                metrics = {
+                    "query": 0.0,
+                    "prepare": 0.0,
+                    "transfer": 0.0,
+                    "db_update": 0.0,
+                    "db_writes": 0,
+                    "files": 0
+                }
                 self.module.set_sync_project_settings()  # clean cache
                 project_name = None
                 enabled_projects = self.module.get_enabled_projects()
@@ -349,11 +432,14 @@ class SyncServerThread(threading.Thread):
                     if not all([local_site, remote_site]):
                         continue
 
+                    part_start = time.time()
                     sync_repres = self.module.get_sync_representations(
                         project_name,
                         local_site,
                         remote_site
                     )
+                    metrics["query"] += time.time() - part_start
+                    part_start = time.time()
 
                     task_files_to_process = []
                     files_processed_info = []
@@ -435,25 +521,61 @@ class SyncServerThread(threading.Thread):
                     self.log.debug("Sync tasks count {}".format(
                         len(task_files_to_process)
                     ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
+                    metrics["prepare"] += time.time() - part_start
+                    metrics["files"] += len(task_files_to_process)
+                    part_start = time.time()
+
+                    flush_size, flush_latency = (
+                        self.module.get_update_flush_config(project_name)
+                    )
+                    updates_buffer = SiteUpdatesBuffer(
+                        self.module, project_name, flush_size, flush_latency
+                    )
+                    pending = {
+                        asyncio.ensure_future(_transfer_result(task, info))
+                        for task, info in zip(task_files_to_process,
+                                              files_processed_info)
+                    }
+                    # Write results of finished transfers also when
+                    #   loop is interrupted
+                    try:
+                        while pending:
+                            # wake up when waiting results should be written
+                            done, pending = await asyncio.wait(
+                                pending,
+                                timeout=updates_buffer.flush_timeout(),
+                                return_when=asyncio.FIRST_COMPLETED
+                            )
+                            for future in done:
+                                file_id, info = future.result()
+                                file, representation, site, project_name = info
+                                error = None
+                                if isinstance(file_id, BaseException):
+                                    error = str(file_id)
+                                    file_id = None
+                                updates_buffer.add(file_id,
+                                                   file,
+                                                   representation,
+                                                   site,
+                                                   error)
+                            updates_buffer.flush_outdated()
+                    finally:
+                        updates_buffer.flush()
+                    metrics["db_update"] += updates_buffer.duration
+                    metrics["db_writes"] += updates_buffer.write_count
+                    metrics["transfer"] += (
+                        time.time() - part_start - updates_buffer.duration
+                    )
 
                 duration = time.time() - start_time
-                self.log.debug("One loop took {:.2f}s".format(duration))
+                metrics["duration"] = duration
+                self.last_loop_metrics = metrics
+                self.log.debug((
+                    "One loop took {duration:.2f}s (query {query:.2f}s,"
+                    " prepare {prepare:.2f}s, transfer {transfer:.2f}s,"
+                    " db update {db_update:.2f}s) - {files} files"
+                    " in {db_writes} db writes"
+                ).format(**metrics))
                 delay = self.module.get_loop_delay(project_name)
                 self.log.debug(
                     "Waiting for {} seconds to new loop".format(delay)
@@ -5,16 +5,18 @@ from datetime import datetime
 import threading
 import copy
 import signal
-from collections import deque, defaultdict
+from collections import deque, defaultdict, OrderedDict
 
 import click
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from openpype.client import (
     get_projects,
     get_representations,
     get_representation_by_id,
 )
+from openpype.client.operations import REPRESENTATION_LAST_MODIFIED_KEY
 from openpype.modules import OpenPypeModule, ITrayModule
 from openpype.settings import (
     get_project_settings,
@@ -103,6 +105,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
     LOCAL_SITE = 'local'
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
+    # seconds of overlap of incremental scans of representations, covers
+    #   ids created on machines with slightly different time
+    INCREMENTAL_SCAN_OVERLAP = 60
 
     name = "sync_server"
     label = "Sync Queue"
@@ -136,6 +141,11 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         # projects that long tasks are running on
         self.projects_processed = set()
 
+        # state of incremental scans of representations to sync by
+        #   (project_name, active_site, remote_site)
+        self._sync_scan_states = {}
+        self._sync_scan_lock = threading.Lock()
+
     """ Start of Public API """
     def add_site(self, project_name, representation_id, site_name=None,
                  force=False, priority=None, reset_timer=False):
@@ -1672,6 +1682,12 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             ]
         }
 
+        scan_key = (project_name, active_site, remote_site)
+        scan_start = time.time()
+        scan_match = self._get_incremental_scan_match(scan_key, scan_start)
+        if scan_match is not None:
+            match = {"$and": [scan_match, match]}
+
         aggr = [
             {"$match": match},
             {'$unwind': '$files'},
@@ -1712,10 +1728,93 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             active_site, remote_site
         ))
         self.log.debug("query: {}".format(aggr))
-        representations = self.connection.aggregate(aggr)
+        representations = list(self.connection.aggregate(aggr))
 
+        self._update_sync_scan_state(
+            scan_key, scan_start, scan_match is None, representations
+        )
         return representations
 
+    def get_full_reconciliation_interval(self, project_name):
+        """
+            Return count of seconds between full scans of representations
+            to sync. Representations are scanned incrementally between full
+            scans. Full scan is used always when 0.
+
+            Incremental scan finds representations by time of their last
+            modification, which is stored by integrators and site changes.
+        Returns:
+            (int): in seconds
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        return int(config.get("full_reconciliation_interval") or 0)
+
+    def reset_sync_scans(self, project_name=None):
+        """
+            Force full scan of representations to sync in next loop.
+
+        Args:
+            project_name (string): reset only scans of project, all projects
+              are reset if not passed
+        """
+        with self._sync_scan_lock:
+            for scan_key in tuple(self._sync_scan_states.keys()):
+                if project_name is None or scan_key[0] == project_name:
+                    self._sync_scan_states.pop(scan_key)
+
+    def _get_incremental_scan_match(self, scan_key, scan_start):
+        """
+            Prepare filter of representations for incremental scan.
+
+            Incremental scan checks only representations that should be
+            synced in previous scan and that were created or modified
+            (by any process) since previous scan.
+
+        Returns:
+            (dictionary) or None if full scan should be used
+        """
+        interval = self.get_full_reconciliation_interval(scan_key[0])
+        with self._sync_scan_lock:
+            state = self._sync_scan_states.get(scan_key)
+            if (
+                state is None
+                or interval <= 0
+                or (scan_start - state["full_scan_time"]) > interval
+            ):
+                return None
+
+            representation_ids = list(state["candidate_ids"])
+            last_scan_time = state["scan_time"]
+
+        changed_after = datetime.utcfromtimestamp(
+            last_scan_time - self.INCREMENTAL_SCAN_OVERLAP
+        )
+        return {"$or": [
+            {REPRESENTATION_LAST_MODIFIED_KEY: {"$gt": changed_after}},
+            {"_id": {"$gt": ObjectId.from_datetime(changed_after)}},
+            {"_id": {"$in": representation_ids}}
+        ]}
+
+    def _update_sync_scan_state(
+        self, scan_key, scan_start, full_scan, representations
+    ):
+        with self._sync_scan_lock:
+            state = self._sync_scan_states.get(scan_key)
+            if state is None:
+                if not full_scan:
+                    # scan was reset during query
+                    return
+                state = {}
+                self._sync_scan_states[scan_key] = state
+
+            if full_scan:
+                state["full_scan_time"] = scan_start
+            state["scan_time"] = scan_start
+            state["candidate_ids"] = {
+                representation["_id"]
+                for representation in representations
+            }
+
     def check_status(self, file, local_site, remote_site, config_preset):
         """
             Check synchronization status for single 'file' of single
@@ -1801,20 +1900,12 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             "_id": representation_id
         }
 
-        update = {}
-        if new_file_id:
-            update["$set"] = self._get_success_dict(new_file_id)
-            # reset previous errors if any
-            update["$unset"] = self._get_error_dict("", "", "")
-        elif progress is not None:
-            update["$set"] = self._get_progress_dict(progress)
+        if progress is not None:
+            update = {"$set": self._get_progress_dict(progress)}
         elif priority is not None:
-            update["$set"] = self._get_priority_dict(priority, file_id)
+            update = {"$set": self._get_priority_dict(priority, file_id)}
         else:
-            tries = self._get_tries_count(file, site)
-            tries += 1
-
-            update["$set"] = self._get_error_dict(error, tries)
+            update = self._get_result_update(new_file_id, file, site, error)
 
         arr_filter = [
             {'s.name': site}
@@ -1832,6 +1923,98 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         if progress is not None or priority is not None:
             return
 
+        self._log_result_update(representation_id, file, new_file_id, error)
+
+    def update_db_bulk(self, project_name, results):
+        """
+            Update 'provider' portion of records of multiple files in DB
+            with success (file_id) or error (exception) using bulk write.
+
+            Updates of files of one representation and site are merged to
+            single update, each file has its own array filter.
+
+        Args:
+            project_name (string): name of project
+            results (list): of tuples (new_file_id, file, representation,
+              site, error) with same meaning as arguments of 'update_db'
+
+        Returns:
+            (int): count of write operations sent to DB
+        """
+        grouped_results = OrderedDict()
+        for new_file_id, file, representation, site, error in results:
+            key = (representation["_id"], site)
+            files_results = grouped_results.setdefault(key, OrderedDict())
+            files_results[file["_id"]] = (new_file_id, file, error)
+
+        operations = []
+        for (representation_id, site), files_results in (
+            grouped_results.items()
+        ):
+            update = {}
+            arr_filter = [{"s.name": site}]
+            for idx, item in enumerate(files_results.items()):
+                file_id, (new_file_id, file, error) = item
+                identifier = "f{}".format(idx)
+                arr_filter.append(
+                    {"{}._id".format(identifier): ObjectId(file_id)}
+                )
+                file_update = self._get_result_update(
+                    new_file_id, file, site, error
+                )
+                for operator, values in file_update.items():
+                    operator_values = update.setdefault(operator, {})
+                    for key, value in values.items():
+                        key = key.replace(
+                            "$[f]", "$[{}]".format(identifier)
+                        )
+                        operator_values[key] = value
+
+            operations.append(UpdateOne(
+                {"_id": representation_id},
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            ))
+
+        if operations:
+            self.connection.database[project_name].bulk_write(
+                operations, ordered=False
+            )
+
+        for (representation_id, _), files_results in grouped_results.items():
+            for new_file_id, file, error in files_results.values():
+                self._log_result_update(
+                    representation_id, file, new_file_id, error
+                )
+        return len(operations)
+
+    def _get_result_update(self, new_file_id, file, site, error):
+        """
+            Prepare update of site record with result of synchronization.
+
+        Args:
+            new_file_id (string): only present if file synced successfully
+            file (dictionary): info about processed file (pulled from DB)
+            site (string): label ('gdrive', 'S3')
+            error (string): exception message
+
+        Returns:
+            (dictionary): update for 'update_one' with array filters 'f' (file)
+              and 's' (site)
+        """
+        if new_file_id:
+            return {
+                "$set": self._get_success_dict(new_file_id),
+                # reset previous errors if any
+                "$unset": self._get_error_dict("", "", "")
+            }
+
+        tries = self._get_tries_count(file, site)
+        tries += 1
+        return {"$set": self._get_error_dict(error, tries)}
+
+    def _log_result_update(self, representation_id, file, new_file_id, error):
         status = 'failed'
         error_str = 'with error {}'.format(error)
         if new_file_id:
@@ -1973,6 +2156,10 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         query = {
             "_id": ObjectId(representation_id)
         }
+        # changes of sites are found by incremental scans of other processes
+        update.setdefault("$set", {})[REPRESENTATION_LAST_MODIFIED_KEY] = (
+            datetime.utcnow()
+        )
 
         self.connection.database[project_name].update_one(
             query,
@@ -2199,6 +2386,23 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         ld = self.sync_project_settings[project_name]["config"]["loop_delay"]
         return int(ld)
 
+    def get_update_flush_config(self, project_name):
+        """
+            Return limits of buffered updates of synchronization results.
+            Buffered results are written to DB when count of results reaches
+            size or when oldest result waits longer than latency.
+        Returns:
+            (int, float): flush size and latency in seconds
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        flush_size = config.get("update_flush_size")
+        if flush_size is None:
+            flush_size = 100
+        flush_latency = config.get("update_flush_latency")
+        if flush_latency is None:
+            flush_latency = 5
+        return int(flush_size), float(flush_latency)
+
     def show_widget(self):
         """Show dialog for Sync Queue"""
         no_errors = False
@@ -7,6 +7,7 @@ import numbers
 
 import six
 import time
+import threading
 
 from openpype.settings.lib import (
     get_local_settings,
@@ -16,6 +17,7 @@ from openpype.settings.constants import (
 )
 
 from openpype.client import get_project
+from openpype.client.operations import PROJECT_LAST_MODIFIED_KEY
 from openpype.lib.path_templates import (
     TemplateUnsolved,
     TemplateResult,
@@ -74,16 +76,21 @@ class BaseAnatomy(object):
         return copy.deepcopy(self._data[key])
 
     def get(self, key, default=None):
-        return copy.deepcopy(self._data).get(key, default)
+        if key not in self._data:
+            return default
+        return copy.deepcopy(self._data[key])
 
     def keys(self):
-        return copy.deepcopy(self._data).keys()
+        return list(self._data.keys())
 
     def values(self):
-        return copy.deepcopy(self._data).values()
+        return [copy.deepcopy(value) for value in self._data.values()]
 
     def items(self):
-        return copy.deepcopy(self._data).items()
+        return [
+            (key, copy.deepcopy(value))
+            for key, value in self._data.items()
+        ]
 
     def _prepare_anatomy_data(self, project_doc, root_overrides):
         """Prepare anatomy data for further processing.
@@ -118,6 +125,10 @@ class BaseAnatomy(object):
         """Wrap `format_all` method of Anatomy's `templates_obj`."""
         return self._templates_obj.format_all(*args, **kwargs)
 
+    def format_batch(self, *args, **kwargs):
+        """Wrap `format_batch` method of Anatomy's `templates_obj`."""
+        return self._templates_obj.format_batch(*args, **kwargs)
+
     @property
     def roots(self):
         """Wrap `roots` property of Anatomy's `roots_obj`."""
@@ -417,9 +428,149 @@ class CacheItem:
         self._cached = time.time()
 
 
+class _FrozenDict(dict):
+    """Read-only dictionary used for data shared between objects.
+
+    Copy of the object is a regular mutable dictionary.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Shared anatomy data are read-only.")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {
+            copy.deepcopy(key, memo): copy.deepcopy(value, memo)
+            for key, value in self.items()
+        }
+
+    def __reduce__(self):
+        return (dict, (dict(self), ))
+
+
+class _FrozenList(list):
+    """Read-only list used for data shared between objects.
+
+    Copy of the object is a regular mutable list.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Shared anatomy data are read-only.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = _read_only
+    clear = reverse = sort = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return (list, (list(self), ))
+
+
+def _freeze(value):
+    """Convert dictionaries and lists in data to read-only variants.
+
+    Args:
+        value (Any): Data to freeze.
+
+    Returns:
+        Any: Data which can be shared without copying.
+    """
+
+    if isinstance(value, dict):
+        return _FrozenDict(
+            (key, _freeze(item)) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
+class ProjectCacheItem(CacheItem):
+    """Cache of project document refreshed on change of the document.
+
+    Project document contains time of its last modification. Cached document
+    is compared with the database once in 'validation_interval' seconds and
+    is queried again if was changed. Changes made directly in database
+    (e.g. by synchronizers) don't update modification time, so lifetime of
+    the cache is still used as upper bound.
+
+    Cached document is read-only and is shared by all anatomy objects.
+
+    Args:
+        project_name (str): Name of project.
+    """
+
+    validation_interval = 2
+
+    def __init__(self, project_name):
+        super(ProjectCacheItem, self).__init__()
+        self._project_name = project_name
+        self._last_modified = None
+        self._validated = None
+
+    def _modification_time(self, project_doc):
+        if project_doc is None:
+            return None
+        return project_doc.get(PROJECT_LAST_MODIFIED_KEY)
+
+    @property
+    def is_outdated(self):
+        if super(ProjectCacheItem, self).is_outdated:
+            return True
+
+        if (
+            self._last_modified is None
+            or (time.time() - self._validated) < self.validation_interval
+        ):
+            return False
+
+        project_doc = get_project(
+            self._project_name, fields=[PROJECT_LAST_MODIFIED_KEY]
+        )
+        if self._modification_time(project_doc) != self._last_modified:
+            return True
+        self._validated = time.time()
+        return False
+
+    def update_data(self, data):
+        data = _freeze(data)
+        super(ProjectCacheItem, self).update_data(data)
+        self._last_modified = self._modification_time(data)
+        self._validated = self._cached
+
+
 class Anatomy(BaseAnatomy):
+    """Anatomy of a project with local settings applied.
+
+    Project documents and prepared anatomy data are shared by all objects in
+    process. Anatomy data are cached by project and site name and are
+    prepared again only when project document or root overrides change.
+
+    Args:
+        project_name (Optional[str]): Name of project. Project from
+            'AVALON_PROJECT' environment is used if not passed.
+        site_name (Optional[str]): Name of site used for root overrides.
+            Active site is used if not passed.
+    """
+
     _sync_server_addon_cache = CacheItem()
-    _project_cache = collections.defaultdict(CacheItem)
+    _project_cache = {}
+    _anatomy_data_cache = {}
+    _cache_stats = collections.Counter()
+    _cache_lock = threading.RLock()
     _default_site_id_cache = collections.defaultdict(CacheItem)
     _root_overrides_cache = collections.defaultdict(
         lambda: collections.defaultdict(CacheItem)
@@ -435,17 +586,104 @@ class Anatomy(BaseAnatomy):
                 " to load data for specific project."
             ))
 
+        self._site_name = site_name
         project_doc = self.get_project_doc_from_cache(project_name)
         root_overrides = self._get_site_root_overrides(project_name, site_name)
 
         super(Anatomy, self).__init__(project_doc, root_overrides)
 
+    def _prepare_anatomy_data(self, project_doc, root_overrides):
+        cache_key = (project_doc["name"], self._site_name)
+        cls = self.__class__
+        with cls._cache_lock:
+            cached = cls._anatomy_data_cache.get(cache_key)
+            if (
+                cached is not None
+                and cached[0] is project_doc
+                and cached[1] == root_overrides
+            ):
+                cls._cache_stats["data_hits"] += 1
+                return cached[2]
+
+            cls._cache_stats["data_misses"] += 1
+            anatomy_data = _freeze(
+                super(Anatomy, self)._prepare_anatomy_data(
+                    project_doc, root_overrides
+                )
+            )
+            cls._anatomy_data_cache[cache_key] = (
+                project_doc, copy.deepcopy(root_overrides), anatomy_data
+            )
+        return anatomy_data
+
     @classmethod
     def get_project_doc_from_cache(cls, project_name):
-        project_cache = cls._project_cache[project_name]
-        if project_cache.is_outdated:
-            project_cache.update_data(get_project(project_name))
-        return copy.deepcopy(project_cache.data)
+        """Cached project document.
+
+        Returned document is read-only and must not be modified. Use
+        'copy.deepcopy' to get a mutable copy.
+
+        Args:
+            project_name (str): Name of project.
+
+        Returns:
+            Union[dict[str, Any], None]: Project document.
+        """
+
+        with cls._cache_lock:
+            project_cache = cls._project_cache.get(project_name)
+            if project_cache is None:
+                project_cache = ProjectCacheItem(project_name)
+                cls._project_cache[project_name] = project_cache
+
+            if project_cache.is_outdated:
+                cls._cache_stats["project_misses"] += 1
+                project_cache.update_data(get_project(project_name))
+            else:
+                cls._cache_stats["project_hits"] += 1
+            return project_cache.data
+
+    @classmethod
+    def get_cache_stats(cls):
+        """Hit and miss counters of shared anatomy caches.
+
+        Returns:
+            dict[str, int]: Counters of project document cache
+                ('project_hits', 'project_misses') and anatomy data cache
+                ('data_hits', 'data_misses').
+        """
+
+        with cls._cache_lock:
+            return {
+                key: cls._cache_stats[key]
+                for key in (
+                    "project_hits",
+                    "project_misses",
+                    "data_hits",
+                    "data_misses",
+                )
+            }
+
+    @classmethod
+    def clear_cache(cls, project_name=None):
+        """Clear shared caches of project documents and anatomy data.
+
+        Args:
+            project_name (Optional[str]): Clear cache only of this project.
+                Cache of all projects is cleared if not passed.
+        """
+
+        with cls._cache_lock:
+            if project_name is None:
+                cls._project_cache.clear()
+                cls._anatomy_data_cache.clear()
+                cls._cache_stats.clear()
+                return
+
+            cls._project_cache.pop(project_name, None)
+            for key in tuple(cls._anatomy_data_cache.keys()):
+                if key[0] == project_name:
+                    cls._anatomy_data_cache.pop(key)
 
     @classmethod
     def get_sync_server_addon(cls):
@@ -632,6 +870,33 @@ class AnatomyStringTemplate(StringTemplate):
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_batch(self, data, vary):
+        """Format template multiple times with changing values of keys.
+
+        Args:
+            data (dict[str, Any]): Formatting data for all results.
+            vary (dict[str, Iterable[Any]]): Values of keys which change
+                per result.
+
+        Returns:
+            list[AnatomyTemplateResult]: Formatting results.
+        """
+
+        anatomy_templates = self.anatomy_templates
+        if not data.get("root"):
+            data = copy.deepcopy(data)
+            data["root"] = anatomy_templates.anatomy.roots
+
+        output = []
+        for result in StringTemplate.format_batch(self, data, vary):
+            if not isinstance(result, AnatomyTemplateResult):
+                rootless_path = anatomy_templates.rootless_path_from_result(
+                    result
+                )
+                result = AnatomyTemplateResult(result, rootless_path)
+            output.append(result)
+        return output
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -986,6 +1251,49 @@ class AnatomyTemplates(TemplatesDict):
         result.strict = strict
         return result
 
+    def format_batch(
+        self, data, vary, template_name, template_key="path", strict=True
+    ):
+        """Format single template for multiple values of changing keys.
+
+        Template is solved only once for values which don't change, which
+        is much faster than calling 'format' for each value e.g. for each
+        frame of a sequence.
+
+        Example:
+            ```python
+            results = anatomy.format_batch(
+                data, {"frame": [1001, 1002, 1003]}, "publish"
+            )
+            paths = [str(result) for result in results]
+            ```
+
+        Args:
+            data (dict[str, Any]): Data used for all results.
+            vary (dict[str, Iterable[Any]]): Values of top-level keys which
+                change per result. All iterables must have the same length.
+            template_name (str): Name of template category e.g. 'publish'.
+            template_key (Optional[str]): Key of template in the category.
+                Defaults to 'path'.
+            strict (Optional[bool]): Raise exception if any result is
+                not solved. Defaults to True.
+
+        Returns:
+            list[AnatomyTemplateResult]: Results in order of passed values.
+        """
+
+        copy_data = copy.deepcopy(data)
+        roots = self.roots
+        if roots:
+            copy_data["root"] = roots
+
+        template = self.objected_templates[template_name][template_key]
+        results = template.format_batch(copy_data, vary)
+        if strict:
+            for result in results:
+                result.validate()
+        return results
+
     def format_all(self, in_data, only_keys=True):
         """ Solves templates based on entered data.
 
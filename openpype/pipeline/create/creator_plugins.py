@@ -637,12 +637,12 @@ def discover_convertor_plugins(*args, **kwargs):
     return discover(SubsetConvertorPlugin, *args, **kwargs)
 
 
-def discover_legacy_creator_plugins():
+def discover_legacy_creator_plugins(lazy=False):
     from openpype.lib import Logger
 
     log = Logger.get_logger("CreatorDiscover")
 
-    plugins = discover(LegacyCreator)
+    plugins = discover(LegacyCreator, lazy=lazy)
     project_name = os.environ.get("AVALON_PROJECT")
     system_settings = get_system_settings()
     project_settings = get_project_settings(project_name)
@@ -24,6 +24,7 @@ from .utils import (
 
     get_representation_path_from_context,
     get_representation_path,
+    get_representations_paths,
     get_representation_path_with_anatomy,
 
     is_compatible_loader,
@@ -34,6 +35,7 @@ from .utils import (
     any_outdated_containers,
     get_outdated_containers,
     filter_containers,
+    clear_containers_filter_cache,
 )
 
 from .plugins import (
@@ -75,6 +77,7 @@ __all__ = (
 
     "get_representation_path_from_context",
     "get_representation_path",
+    "get_representations_paths",
     "get_representation_path_with_anatomy",
 
     "is_compatible_loader",
@@ -85,6 +88,7 @@ __all__ = (
     "any_outdated_containers",
     "get_outdated_containers",
     "filter_containers",
+    "clear_containers_filter_cache",
 
     # plugins.py
     "LoaderPlugin",
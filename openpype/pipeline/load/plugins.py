@@ -250,11 +250,11 @@ class SubsetLoaderPlugin(LoaderPlugin):
         pass
 
 
-def discover_loader_plugins(project_name=None):
+def discover_loader_plugins(project_name=None, lazy=False):
     from openpype.lib import Logger
 
     log = Logger.get_logger("LoaderDiscover")
-    plugins = discover(LoaderPlugin)
+    plugins = discover(LoaderPlugin, lazy=lazy)
     if not project_name:
         project_name = legacy_io.active_project()
     system_settings = get_system_settings()
@@ -1,12 +1,20 @@
 import os
+import time
 import platform
 import copy
 import getpass
 import logging
 import inspect
+import threading
 import collections
 import numbers
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 without 'futures' backport - paths are checked serially
+    ThreadPoolExecutor = None
+
 from openpype.host import ILoadHost
 from openpype.client import (
     get_project,
@@ -18,10 +26,13 @@ from openpype.client import (
     get_hero_version_by_subset_id,
     get_version_by_name,
     get_last_versions,
+    get_newest_version_id,
     get_representations,
     get_representation_by_id,
     get_representation_by_name,
-    get_representation_parents
+    get_representation_parents,
+    get_representations_parents,
+    get_entity_change_counter,
 )
 from openpype.lib import (
     StringTemplate,
@@ -39,6 +50,12 @@ ContainersFilterResult = collections.namedtuple(
     ["latest", "outdated", "not_found", "invalid"]
 )
 
+# States of representations referenced by containers
+REPRE_STATE_LATEST = "latest"
+REPRE_STATE_OUTDATED = "outdated"
+REPRE_STATE_MISSING_REPRE = "missing_representation"
+REPRE_STATE_MISSING_VERSION = "missing_version"
+
 
 class HeroVersionType(object):
     def __init__(self, version):
@@ -586,6 +603,128 @@ def get_representation_path_with_anatomy(repre_doc, anatomy):
     return path.normalized()
 
 
+def _fix_path_slashes(path):
+    # Force replacing backslashes with forward slashed if not on windows
+    if platform.system().lower() != "windows":
+        path = path.replace("\\", "/")
+    return path
+
+
+def _format_repre_template_path(representation, root):
+    """Path from template and context stored on representation."""
+
+    try:
+        template = representation["data"]["template"]
+    except KeyError:
+        return None
+
+    try:
+        context = representation["context"]
+        context["root"] = root
+        path = StringTemplate.format_strict_template(
+            template, context
+        )
+        path = _fix_path_slashes(path)
+    except (TemplateUnsolved, KeyError):
+        # Template references unavailable data
+        return None
+    return path
+
+
+def _format_config_template_path(representation, root, parents, dbcon):
+    """Path from publish template of project config."""
+
+    version_, subset, asset, project = parents
+    if project is None or asset is None:
+        log.debug(
+            "Representation %s wasn't found in database, "
+            "like a bug" % representation["name"]
+        )
+        return None
+
+    try:
+        template = project["config"]["template"]["publish"]
+    except KeyError:
+        log.debug(
+            "No template in project %s, "
+            "likely a bug" % project["name"]
+        )
+        return None
+
+    # default list() in get would not discover missing parents on asset
+    hierarchy = ""
+    parents = asset.get("data", {}).get("parents")
+    if parents is not None:
+        hierarchy = "/".join(parents)
+
+    # Cannot fail, required members only
+    data = {
+        "root": root,
+        "project": {
+            "name": project["name"],
+            "code": project.get("data", {}).get("code")
+        },
+        "asset": asset["name"],
+        "hierarchy": hierarchy,
+        "subset": subset["name"],
+        "version": version_["name"],
+        "representation": representation["name"],
+        "family": representation.get("context", {}).get("family"),
+        "user": dbcon.Session.get("AVALON_USER", getpass.getuser()),
+        "app": dbcon.Session.get("AVALON_APP", ""),
+        "task": dbcon.Session.get("AVALON_TASK", "")
+    }
+
+    try:
+        template_obj = StringTemplate(template)
+        path = str(template_obj.format(data))
+        path = _fix_path_slashes(path)
+
+    except KeyError as e:
+        log.debug("Template references unavailable data: %s" % e)
+        return None
+    return path
+
+
+def _existing_path(path, exists):
+    """Normalized path if exists, otherwise path as is."""
+
+    normalized_path = os.path.normpath(path)
+    if exists:
+        return normalized_path
+    return path
+
+
+def _path_from_repre_data(representation):
+    if "path" not in representation["data"]:
+        return None
+
+    path = _fix_path_slashes(representation["data"]["path"])
+
+    if os.path.exists(path):
+        return os.path.normpath(path)
+
+    dir_path, file_name = os.path.split(path)
+    if not os.path.exists(dir_path):
+        return
+
+    base_name, ext = os.path.splitext(file_name)
+    file_name_items = None
+    if "#" in base_name:
+        file_name_items = [part for part in base_name.split("#") if part]
+    elif "%" in base_name:
+        file_name_items = base_name.split("%")
+
+    if not file_name_items:
+        return
+
+    filename_start = file_name_items[0]
+
+    for _file in os.listdir(dir_path):
+        if _file.startswith(filename_start) and _file.endswith(ext):
+            return os.path.normpath(path)
+
+
 def get_representation_path(representation, root=None, dbcon=None):
     """Get filename from representation document
 
@@ -612,134 +751,136 @@ def get_representation_path(representation, root=None, dbcon=None):
 
         root = registered_root()
 
-    def path_from_represenation():
-        try:
-            template = representation["data"]["template"]
-        except KeyError:
-            return None
+    path = _format_repre_template_path(representation, root)
+    if path:
+        return _existing_path(
+            path, os.path.exists(os.path.normpath(path))
+        )
 
-        try:
-            context = representation["context"]
-            context["root"] = root
-            path = StringTemplate.format_strict_template(
-                template, context
-            )
-            # Force replacing backslashes with forward slashed if not on
-            #   windows
-            if platform.system().lower() != "windows":
-                path = path.replace("\\", "/")
-        except (TemplateUnsolved, KeyError):
-            # Template references unavailable data
-            return None
+    project_name = dbcon.active_project()
+    parents = get_representation_parents(project_name, representation)
+    path = _format_config_template_path(
+        representation, root, parents, dbcon
+    )
+    if path:
+        return _existing_path(
+            path, os.path.exists(os.path.normpath(path))
+        )
 
-        if not path:
-            return path
+    return _path_from_repre_data(representation)
 
-        normalized_path = os.path.normpath(path)
-        if os.path.exists(normalized_path):
-            return normalized_path
-        return path
 
-    def path_from_config():
-        try:
-            project_name = dbcon.active_project()
-            version_, subset, asset, project = get_representation_parents(
-                project_name, representation
-            )
-        except ValueError:
-            log.debug(
-                "Representation %s wasn't found in database, "
-                "like a bug" % representation["name"]
-            )
-            return None
+def _paths_exist(paths, max_workers):
+    """Check existence of paths, concurrently if 'max_workers' is set.
 
-        try:
-            template = project["config"]["template"]["publish"]
-        except KeyError:
-            log.debug(
-                "No template in project %s, "
-                "likely a bug" % project["name"]
-            )
-            return None
+    Paths are checked serially if 'concurrent.futures' is not available
+    (Python 2).
 
-        # default list() in get would not discover missing parents on asset
-        parents = asset.get("data", {}).get("parents")
-        if parents is not None:
-            hierarchy = "/".join(parents)
+    Returns:
+        dict[str, bool]: Existence of paths by path.
+    """
 
-        # Cannot fail, required members only
-        data = {
-            "root": root,
-            "project": {
-                "name": project["name"],
-                "code": project.get("data", {}).get("code")
-            },
-            "asset": asset["name"],
-            "hierarchy": hierarchy,
-            "subset": subset["name"],
-            "version": version_["name"],
-            "representation": representation["name"],
-            "family": representation.get("context", {}).get("family"),
-            "user": dbcon.Session.get("AVALON_USER", getpass.getuser()),
-            "app": dbcon.Session.get("AVALON_APP", ""),
-            "task": dbcon.Session.get("AVALON_TASK", "")
-        }
+    paths = list(set(paths))
+    if (
+        not max_workers
+        or max_workers < 2
+        or len(paths) < 2
+        or ThreadPoolExecutor is None
+    ):
+        return {path: os.path.exists(path) for path in paths}
 
-        try:
-            template_obj = StringTemplate(template)
-            path = str(template_obj.format(data))
-            # Force replacing backslashes with forward slashed if not on
-            #   windows
-            if platform.system().lower() != "windows":
-                path = path.replace("\\", "/")
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(paths)))
+    try:
+        return dict(zip(paths, executor.map(os.path.exists, paths)))
+    finally:
+        executor.shutdown(wait=True)
 
-        except KeyError as e:
-            log.debug("Template references unavailable data: %s" % e)
-            return None
 
-        normalized_path = os.path.normpath(path)
-        if os.path.exists(normalized_path):
-            return normalized_path
-        return path
+def get_representations_paths(
+    representations,
+    root=None,
+    dbcon=None,
+    check_existence=True,
+    max_workers=8
+):
+    """Get filenames of multiple representation documents at once.
 
-    def path_from_data():
-        if "path" not in representation["data"]:
-            return None
+    Output paths are same as output of 'get_representation_path' called for
+    each representation. Parents of representations which need template
+    from project config are queried at once and existence of paths can be
+    checked concurrently.
 
-        path = representation["data"]["path"]
-        # Force replacing backslashes with forward slashed if not on
-        #   windows
-        if platform.system().lower() != "windows":
-            path = path.replace("\\", "/")
+    Args:
+        representations (Iterable[dict]): Representation documents.
+        root (Optional[dict]): Roots used for formatting, registered root
+            is used if not passed.
+        dbcon (Optional[AvalonMongoDB]): Connection to database with
+            active project.
+        check_existence (Optional[bool]): Check existence of paths. Paths
+            are normalized without existence check if disabled, paths from
+            representation 'path' data are not resolved in that case.
+        max_workers (Optional[int]): Threads used for existence checks.
 
-        if os.path.exists(path):
-            return os.path.normpath(path)
+    Returns:
+        dict[ObjectId, Union[str, None]]: Paths by representation id.
+    """
 
-        dir_path, file_name = os.path.split(path)
-        if not os.path.exists(dir_path):
-            return
+    if dbcon is None:
+        dbcon = legacy_io
 
-        base_name, ext = os.path.splitext(file_name)
-        file_name_items = None
-        if "#" in base_name:
-            file_name_items = [part for part in base_name.split("#") if part]
-        elif "%" in base_name:
-            file_name_items = base_name.split("%")
+    if root is None:
+        from openpype.pipeline import registered_root
 
-        if not file_name_items:
-            return
+        root = registered_root()
 
-        filename_start = file_name_items[0]
+    representations = list(representations)
+    formatted_paths = {}
+    missing_repres = []
+    for repre_doc in representations:
+        path = _format_repre_template_path(repre_doc, root)
+        if path:
+            formatted_paths[repre_doc["_id"]] = path
+        else:
+            missing_repres.append(repre_doc)
 
-        for _file in os.listdir(dir_path):
-            if _file.startswith(filename_start) and _file.endswith(ext):
-                return os.path.normpath(path)
+    without_path = []
+    if missing_repres:
+        project_name = dbcon.active_project()
+        parents_by_repre_id = get_representations_parents(
+            project_name, missing_repres
+        )
+        for repre_doc in missing_repres:
+            path = _format_config_template_path(
+                repre_doc,
+                root,
+                parents_by_repre_id[repre_doc["_id"]],
+                dbcon
+            )
+            if path:
+                formatted_paths[repre_doc["_id"]] = path
+            else:
+                without_path.append(repre_doc)
+
+    output = {}
+    if not check_existence:
+        for repre_id, path in formatted_paths.items():
+            output[repre_id] = os.path.normpath(path)
+        for repre_doc in without_path:
+            output[repre_doc["_id"]] = None
+        return output
 
-    return (
-        path_from_represenation() or
-        path_from_config() or
-        path_from_data()
+    exist_by_path = _paths_exist(
+        [os.path.normpath(path) for path in formatted_paths.values()],
+        max_workers
     )
+    for repre_id, path in formatted_paths.items():
+        output[repre_id] = _existing_path(
+            path, exist_by_path[os.path.normpath(path)]
+        )
+
+    for repre_doc in without_path:
+        output[repre_doc["_id"]] = _path_from_repre_data(repre_doc)
+    return output
 
 
 def is_compatible_loader(Loader, context):
@@ -806,7 +947,160 @@ def get_outdated_containers(host=None, project_name=None):
     return filter_containers(containers, project_name).outdated
 
 
-def filter_containers(containers, project_name):
+class _RepresentationsStateCache(object):
+    """Cache of states of representations referenced by containers.
+
+    Items are stored by project name and set of representation ids. Item is
+    invalid when entities of the project were changed in this process
+    (e.g. new version was published), when newest version of referenced
+    subsets changed (e.g. version was published by other process) or after
+    'max_lifetime' seconds.
+    """
+
+    max_lifetime = 60
+    max_items = 16
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = collections.OrderedDict()
+
+    def get(self, project_name, repre_ids):
+        key = (project_name, frozenset(repre_ids))
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+
+            created, change_counter, subset_ids, newest_version_id, states = (
+                item
+            )
+            if (
+                change_counter != get_entity_change_counter(project_name)
+                or time.time() - created > self.max_lifetime
+            ):
+                self._items.pop(key)
+                return None
+
+        # Query database without lock
+        current_version_id = get_newest_version_id(project_name, subset_ids)
+        if current_version_id != newest_version_id:
+            with self._lock:
+                if self._items.get(key) is item:
+                    self._items.pop(key)
+            return None
+        return states
+
+    def set(
+        self,
+        project_name,
+        repre_ids,
+        change_counter,
+        subset_ids,
+        newest_version_id,
+        states
+    ):
+        key = (project_name, frozenset(repre_ids))
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = (
+                time.time(),
+                change_counter,
+                subset_ids,
+                newest_version_id,
+                states
+            )
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_REPRESENTATIONS_STATE_CACHE = _RepresentationsStateCache()
+
+
+def clear_containers_filter_cache():
+    """Clear cached states used by 'filter_containers'."""
+
+    _REPRESENTATIONS_STATE_CACHE.clear()
+
+
+def get_representations_states(project_name, repre_ids):
+    """States of representations used to filter containers.
+
+    Last versions of all subsets are received using one aggregated query.
+
+    Args:
+        project_name (str): Name of project.
+        repre_ids (Iterable[str]): Representation ids.
+
+    Returns:
+        tuple[dict[str, str], set[ObjectId]]: State of representation by
+            stringified representation id and ids of subsets of
+            the representations.
+    """
+
+    repre_docs = get_representations(
+        project_name,
+        representation_ids=repre_ids,
+        fields=["_id", "parent"]
+    )
+    # Store version ids by stringified representation id
+    version_ids_by_repre_id = {}
+    for repre_doc in repre_docs:
+        version_ids_by_repre_id[str(repre_doc["_id"])] = repre_doc["parent"]
+
+    # Query version docs to get it's subset ids
+    # - also query hero version to be able identify if representation
+    #   belongs to existing version
+    version_docs = get_versions(
+        project_name,
+        version_ids=set(version_ids_by_repre_id.values()),
+        hero=True,
+        fields=["_id", "parent", "type"]
+    )
+    version_ids = set()
+    subset_ids_by_version_id = {}
+    for version_doc in version_docs:
+        version_id = version_doc["_id"]
+        version_ids.add(version_id)
+        # There's no need to query subsets for hero versions
+        #   - they are considered as latest?
+        if version_doc["type"] != "hero_version":
+            subset_ids_by_version_id[version_id] = version_doc["parent"]
+
+    last_versions = get_last_versions(
+        project_name,
+        subset_ids=set(subset_ids_by_version_id.values()),
+        fields=["_id"]
+    )
+    # Figure out which versions are outdated
+    outdated_version_ids = set()
+    for version_id, subset_id in subset_ids_by_version_id.items():
+        last_version_doc = last_versions.get(subset_id)
+        if (
+            last_version_doc is not None
+            and last_version_doc["_id"] != version_id
+        ):
+            outdated_version_ids.add(version_id)
+
+    output = {}
+    for repre_id in repre_ids:
+        version_id = version_ids_by_repre_id.get(repre_id)
+        if version_id is None:
+            state = REPRE_STATE_MISSING_REPRE
+        elif version_id in outdated_version_ids:
+            state = REPRE_STATE_OUTDATED
+        elif version_id not in version_ids:
+            state = REPRE_STATE_MISSING_VERSION
+        else:
+            state = REPRE_STATE_LATEST
+        output[repre_id] = state
+    return output, set(subset_ids_by_version_id.values())
+
+
+def filter_containers(containers, project_name, use_cache=True):
     """Filter containers and split them into 4 categories.
 
     Categories are 'latest', 'outdated', 'invalid' and 'not_found'.
@@ -814,10 +1108,15 @@ def filter_containers(containers, project_name):
     'invalid' are invalid containers (invalid content) and 'not_found' has
     some missing entity in database.
 
+    States of representations are cached by set of representation ids. The
+    cache is invalidated by changes of entities in this process, by new
+    versions of referenced subsets and after a short time.
+
     Args:
         containers (Iterable[dict]): List of containers referenced into scene.
         project_name (str): Name of project in which context shoud look for
             versions.
+        use_cache (Optional[bool]): Use cached states of representations.
 
     Returns:
         ContainersFilterResult: Named tuple with 'latest', 'outdated',
@@ -837,7 +1136,6 @@ def filter_containers(containers, project_name):
         not_found_containers,
         invalid_containers
     )
-    # Query representation docs to get it's version ids
     repre_ids = {
         container["representation"]
         for container in containers
@@ -848,87 +1146,56 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_docs = get_representations(
-        project_name,
-        representation_ids=repre_ids,
-        fields=["_id", "parent"]
-    )
-    # Store representations by stringified representation id
-    repre_docs_by_str_id = {}
-    repre_docs_by_version_id = collections.defaultdict(list)
-    for repre_doc in repre_docs:
-        repre_id = str(repre_doc["_id"])
-        version_id = repre_doc["parent"]
-        repre_docs_by_str_id[repre_id] = repre_doc
-        repre_docs_by_version_id[version_id].append(repre_doc)
-
-    # Query version docs to get it's subset ids
-    # - also query hero version to be able identify if representation
-    #   belongs to existing version
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True,
-        fields=["_id", "parent", "type"]
-    )
-    verisons_by_id = {}
-    versions_by_subset_id = collections.defaultdict(list)
-    hero_version_ids = set()
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
-        # Store versions by their ids
-        verisons_by_id[version_id] = version_doc
-        # There's no need to query subsets for hero versions
-        #   - they are considered as latest?
-        if version_doc["type"] == "hero_version":
-            hero_version_ids.add(version_id)
-            continue
-        subset_id = version_doc["parent"]
-        versions_by_subset_id[subset_id].append(version_doc)
+    states = None
+    if use_cache:
+        states = _REPRESENTATIONS_STATE_CACHE.get(project_name, repre_ids)
 
-    last_versions = get_last_versions(
-        project_name,
-        subset_ids=versions_by_subset_id.keys(),
-        fields=["_id"]
-    )
-    # Figure out which versions are outdated
-    outdated_version_ids = set()
-    for subset_id, last_version_doc in last_versions.items():
-        for version_doc in versions_by_subset_id[subset_id]:
-            version_id = version_doc["_id"]
-            if version_id != last_version_doc["_id"]:
-                outdated_version_ids.add(version_id)
+    if states is None:
+        # Counter is received before queries so changes made during
+        #   the queries invalidate the result
+        change_counter = get_entity_change_counter(project_name)
+        states, subset_ids = get_representations_states(
+            project_name, repre_ids
+        )
+        # Version published by other process between the queries is
+        #   discovered after 'max_lifetime'
+        newest_version_id = get_newest_version_id(project_name, subset_ids)
+        _REPRESENTATIONS_STATE_CACHE.set(
+            project_name,
+            repre_ids,
+            change_counter,
+            subset_ids,
+            newest_version_id,
+            states
+        )
 
     # Based on all collected data figure out which containers are outdated
     #   - log out if there are missing representation or version documents
     for container in containers:
-        container_name = container["objectName"]
         repre_id = container["representation"]
         if not repre_id:
             invalid_containers.append(container)
             continue
 
-        repre_doc = repre_docs_by_str_id.get(repre_id)
-        if not repre_doc:
+        state = states[repre_id]
+        if state == REPRE_STATE_LATEST:
+            uptodate_containers.append(container)
+
+        elif state == REPRE_STATE_OUTDATED:
+            outdated_containers.append(container)
+
+        elif state == REPRE_STATE_MISSING_REPRE:
             log.debug((
                 "Container '{}' has an invalid representation."
                 " It is missing in the database."
-            ).format(container_name))
+            ).format(container["objectName"]))
             not_found_containers.append(container)
-            continue
 
-        version_id = repre_doc["parent"]
-        if version_id in outdated_version_ids:
-            outdated_containers.append(container)
-
-        elif version_id not in verisons_by_id:
+        else:
             log.debug((
                 "Representation on container '{}' has an invalid version."
                 " It is missing in the database."
-            ).format(container_name))
+            ).format(container["objectName"]))
             not_found_containers.append(container)
 
-        else:
-            uptodate_containers.append(container)
-
     return output
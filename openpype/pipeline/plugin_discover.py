@@ -1,15 +1,27 @@
 import os
+import sys
+import ast
+import json
+import hashlib
 import inspect
+import importlib
 import traceback
 
+import six
+
 from openpype.lib import Logger
 from openpype.lib.python_module_tools import (
+    import_filepath,
     modules_from_path,
     classes_from_module,
 )
 
 log = Logger.get_logger(__name__)
 
+# Filename of precomputed manifest in plugins directory
+PLUGINS_MANIFEST_FILENAME = "_plugins_manifest.json"
+PLUGINS_MANIFEST_VERSION = 1
+
 
 class DiscoverResult:
     """Result of Plug-ins discovery of a single superclass type.
@@ -25,6 +37,8 @@ class DiscoverResult:
         self.duplicated_plugins = []
         self.abstract_plugins = []
         self.ignored_plugins = set()
+        # Duration of discovery by plugin path
+        self.discover_durations = {}
         # Store loaded modules to keep them in memory
         self._modules = set()
 
@@ -96,6 +110,602 @@ class DiscoverResult:
             log.info(report)
 
 
+def _get_expression_path(node):
+    """Names of 'a.b.C' expression, None for other expressions."""
+    names = []
+    while isinstance(node, ast.Attribute):
+        names.insert(0, node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    names.insert(0, node.id)
+    return names
+
+
+def _get_decorator_names(node):
+    names = []
+    for decorator in node.decorator_list:
+        path = _get_expression_path(decorator)
+        names.append(path[-1] if path else None)
+    return names
+
+
+def _mangle_name(class_name, name):
+    if name.startswith("__") and not name.endswith("__"):
+        return "_{}{}".format(class_name.lstrip("_"), name)
+    return name
+
+
+def _get_literal(node):
+    """Representation of literal value which can be stored to manifest."""
+    try:
+        value = ast.literal_eval(node)
+        value_repr = repr(value)
+        if ast.literal_eval(value_repr) == value:
+            return value_repr
+    except Exception:
+        pass
+    return None
+
+
+def _describe_class(node):
+    """Describe attributes defined in body of class.
+
+    Returns:
+        Union[dict[str, Any], None]: Description of class or None if body
+            contains statements that can't be described.
+    """
+
+    literals = {}
+    # Methods and classmethods which can be called without import
+    methods = []
+    # Any other attributes which require import
+    values = []
+    abstract = []
+    doc = None
+    for idx, item in enumerate(node.body):
+        if isinstance(item, ast.Pass):
+            continue
+
+        if isinstance(item, ast.Expr):
+            value = _get_literal(item.value)
+            if value is None:
+                return None
+            if idx == 0:
+                doc = ast.literal_eval(value)
+            continue
+
+        literal = None
+        is_method = False
+        if isinstance(item, ast.Assign):
+            names = []
+            for target in item.targets:
+                for sub_node in ast.walk(target):
+                    if isinstance(sub_node, ast.Name):
+                        names.append(sub_node.id)
+                    elif not isinstance(sub_node, (
+                        ast.Tuple, ast.List, ast.Store, ast.Load
+                    )):
+                        return None
+            if all(isinstance(target, ast.Name) for target in item.targets):
+                literal = _get_literal(item.value)
+
+        elif isinstance(item, getattr(ast, "AnnAssign", ())):
+            if not isinstance(item.target, ast.Name):
+                return None
+            if item.value is None:
+                continue
+            names = [item.target.id]
+            literal = _get_literal(item.value)
+
+        elif isinstance(item, (
+            ast.FunctionDef, getattr(ast, "AsyncFunctionDef", ())
+        )):
+            names = [item.name]
+            decorator_names = _get_decorator_names(item)
+            is_method = all(
+                name in ("classmethod", "staticmethod", "abstractmethod")
+                for name in decorator_names
+            )
+            if "abstractmethod" in decorator_names:
+                abstract.append(_mangle_name(node.name, item.name))
+
+        elif isinstance(item, ast.ClassDef):
+            names = [item.name]
+
+        else:
+            return None
+
+        for name in names:
+            if name.startswith("__") and name.endswith("__"):
+                continue
+            name = _mangle_name(node.name, name)
+            for collection in (methods, values):
+                if name in collection:
+                    collection.remove(name)
+            literals.pop(name, None)
+            if literal is not None:
+                literals[name] = literal
+            elif is_method:
+                methods.append(name)
+            else:
+                values.append(name)
+
+    return {
+        "name": node.name,
+        "doc": doc,
+        "literals": literals,
+        "methods": methods,
+        "values": values,
+        "abstract": abstract,
+    }
+
+
+def _describe_class_bases(node, class_names, imports):
+    """Import paths of base classes, None if can't be resolved."""
+    bases = []
+    for base_node in node.bases:
+        path = _get_expression_path(base_node)
+        if path is None:
+            return None
+        if path[0] in class_names:
+            if len(path) > 1:
+                return None
+            bases.append(["", path])
+        elif imports.get(path[0]) is not None:
+            module_name, attrs = imports[path[0]]
+            bases.append([module_name, attrs + path[1:]])
+        elif path == ["object"]:
+            bases.append([six.moves.builtins.__name__, path])
+        else:
+            return None
+    return bases
+
+
+def _process_module_statement(node, class_names, imports):
+    """Check other module statement than import or class definition.
+
+    Names bound by the statement are marked as not resolvable in 'imports'.
+
+    Returns:
+        bool: Statement does not change classes defined in file.
+    """
+
+    # Decorators of functions are called on import
+    if isinstance(node, (
+        ast.FunctionDef, getattr(ast, "AsyncFunctionDef", ())
+    )):
+        imports[node.name] = None
+        sub_nodes = []
+        for decorator in node.decorator_list:
+            sub_nodes.extend(ast.walk(decorator))
+    else:
+        sub_nodes = ast.walk(node)
+
+    for sub_node in sub_nodes:
+        if isinstance(sub_node, ast.ClassDef):
+            return False
+
+        if isinstance(sub_node, ast.Name):
+            # Class may be changed after definition
+            if sub_node.id in class_names:
+                return False
+            if isinstance(sub_node.ctx, ast.Store):
+                imports[sub_node.id] = None
+
+        elif isinstance(sub_node, (ast.Import, ast.ImportFrom)):
+            for alias in sub_node.names:
+                name = alias.asname or alias.name.split(".")[0]
+                imports[name] = None
+
+        elif isinstance(sub_node, (
+            ast.FunctionDef, getattr(ast, "AsyncFunctionDef", ())
+        )):
+            imports[sub_node.name] = None
+    return True
+
+
+def describe_plugins_file(content):
+    """Describe classes defined in python file without its import.
+
+    Description contains names and base classes of classes defined in the
+    file, their literal attributes (e.g. 'families' or 'label') and names
+    of other attributes. Files doing anything which would make the
+    description differ from classes created by import (e.g. decorated
+    classes, changes of classes after definition or classes defined in
+    conditions) can't be described.
+
+    Args:
+        content (bytes): Content of python file.
+
+    Returns:
+        Union[dict[str, Any], None]: Description of the file or None if
+            file can't be described.
+    """
+
+    try:
+        tree = ast.parse(content)
+    except Exception:
+        return None
+
+    # Import paths by bound name, 'None' if name can't be resolved
+    imports = {}
+    classes = []
+    class_names = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    imports[alias.asname] = [alias.name, []]
+                else:
+                    name = alias.name.split(".")[0]
+                    imports[name] = [name, []]
+            continue
+
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if alias.name == "*":
+                    return None
+                name = alias.asname or alias.name
+                if node.level or not node.module:
+                    imports[name] = None
+                else:
+                    imports[name] = [node.module, [alias.name]]
+            continue
+
+        if isinstance(node, ast.ClassDef):
+            if (
+                node.decorator_list
+                or getattr(node, "keywords", None)
+                or getattr(node, "starargs", None)
+                or getattr(node, "kwargs", None)
+                or node.name in class_names
+            ):
+                return None
+
+            bases = _describe_class_bases(node, class_names, imports)
+            class_description = _describe_class(node)
+            if bases is None or class_description is None:
+                return None
+            class_description["bases"] = bases
+            class_names.add(node.name)
+            imports.pop(node.name, None)
+            classes.append(class_description)
+            continue
+
+        if not _process_module_statement(node, class_names, imports):
+            return None
+
+    # Classes imported from other modules are discovered too
+    imported = []
+    for name, import_path in sorted(imports.items()):
+        if import_path is not None and import_path[1]:
+            imported.append([name, import_path[0], import_path[1][0]])
+
+    return {"classes": classes, "imported": imported}
+
+
+def _file_hash(content):
+    return hashlib.sha1(content).hexdigest()
+
+
+def create_plugins_manifest(dirpath):
+    """Create precomputed manifest of plugins in a directory.
+
+    Manifest stores descriptions of python files in the directory, so
+    lazy discovery does not have to parse unchanged files. Python files are
+    not imported.
+
+    Args:
+        dirpath (str): Path to directory with plugins.
+
+    Returns:
+        str: Path to created manifest.
+    """
+
+    files = {}
+    for filename, filepath in _iter_plugin_files(dirpath):
+        with open(filepath, "rb") as stream:
+            content = stream.read()
+        description = describe_plugins_file(content)
+        if description is not None:
+            files[filename] = {
+                "hash": _file_hash(content),
+                "description": description,
+            }
+
+    output_path = os.path.join(dirpath, PLUGINS_MANIFEST_FILENAME)
+    with open(output_path, "w") as stream:
+        json.dump(
+            {"version": PLUGINS_MANIFEST_VERSION, "files": files},
+            stream,
+            indent=4,
+            sort_keys=True
+        )
+    return output_path
+
+
+def _read_plugins_manifest(dirpath):
+    path = os.path.join(dirpath, PLUGINS_MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as stream:
+            data = json.load(stream)
+    except Exception:
+        log.debug(
+            "Failed to read plugins manifest {}".format(path), exc_info=True
+        )
+        return {}
+
+    if data.get("version") != PLUGINS_MANIFEST_VERSION:
+        return {}
+    return data.get("files") or {}
+
+
+def _iter_plugin_files(dirpath):
+    """Python files in directory which would be imported by discovery."""
+    for filename in os.listdir(dirpath):
+        # Ignore files which start with underscore
+        if filename.startswith("_"):
+            continue
+
+        if os.path.splitext(filename)[1] != ".py":
+            continue
+
+        filepath = os.path.join(dirpath, filename)
+        if os.path.isfile(filepath):
+            yield filename, filepath
+
+
+def _resolve_object(module_name, attrs):
+    obj = importlib.import_module(module_name)
+    for attr in attrs:
+        if hasattr(obj, attr):
+            obj = getattr(obj, attr)
+        elif inspect.ismodule(obj):
+            obj = importlib.import_module("{}.{}".format(obj.__name__, attr))
+        else:
+            raise AttributeError("{} has no attribute {}".format(obj, attr))
+    return obj
+
+
+class _LazyPluginState(object):
+    """State of lazy plugin class shared with its attributes."""
+
+    def __init__(self, filepath, importer, literals):
+        self.filepath = filepath
+        self.importer = importer
+        self.literals = literals
+        self.overrides = {}
+        self.plugin_class = None
+        self.created = False
+
+
+class _LazyMethod(object):
+    """Method of lazy plugin class, file is imported when it's called."""
+
+    def __init__(self, owner, name):
+        self._owner = owner
+        self.__name__ = name
+
+    def __call__(self, *args, **kwargs):
+        plugin_class = self._owner._lazy_load()
+        return getattr(plugin_class, self.__name__)(*args, **kwargs)
+
+
+class _LazyAttribute(object):
+    """Attribute of lazy plugin class which can't be stored in manifest.
+
+    Args:
+        name (str): Name of attribute.
+        is_method (bool): Attribute is method or classmethod which can be
+            returned without import.
+        is_abstract (bool): Method is abstract.
+    """
+
+    def __init__(self, name, is_method, is_abstract):
+        self.name = name
+        self.is_method = is_method
+        self.__isabstractmethod__ = is_abstract
+
+    def __get__(self, instance, owner):
+        state = type.__getattribute__(owner, "__dict__").get("_lazy_state")
+        # Class is being created (e.g. abstract methods are collected)
+        if state is not None and not state.created:
+            return self
+
+        if self.is_method:
+            return _LazyMethod(owner, self.name)
+        return getattr(owner._lazy_load(), self.name)
+
+
+class _LazyPluginMeta(type):
+    """Metaclass of plugin classes which import their file on first use.
+
+    Lazy plugin class is subclass of the same base classes as the plugin
+    class in file. Values of literal attributes are available without
+    import. The file is imported when plugin object is created or when
+    other attribute is used. Attributes set on the lazy class (e.g. from
+    settings) are set on the plugin class and from that moment all
+    attributes are used from the plugin class.
+    """
+
+    def __getattribute__(cls, name):
+        if not name.startswith("__") and not name.startswith("_lazy_"):
+            state = type.__getattribute__(cls, "__dict__").get("_lazy_state")
+            if state is not None and state.plugin_class is not None:
+                return getattr(state.plugin_class, name)
+        return super(_LazyPluginMeta, cls).__getattribute__(name)
+
+    def __setattr__(cls, name, value):
+        super(_LazyPluginMeta, cls).__setattr__(name, value)
+        state = type.__getattribute__(cls, "__dict__").get("_lazy_state")
+        if state is None:
+            return
+        if state.plugin_class is not None:
+            setattr(state.plugin_class, name, value)
+        else:
+            state.overrides[name] = value
+
+    def __call__(cls, *args, **kwargs):
+        return cls._lazy_load()(*args, **kwargs)
+
+    def __instancecheck__(cls, instance):
+        state = type.__getattribute__(cls, "__dict__").get("_lazy_state")
+        if (
+            state is not None
+            and state.plugin_class is not None
+            and isinstance(instance, state.plugin_class)
+        ):
+            return True
+        return super(_LazyPluginMeta, cls).__instancecheck__(instance)
+
+    def _lazy_load(cls):
+        """Import file of the plugin and return plugin class."""
+        state = type.__getattribute__(cls, "__dict__")["_lazy_state"]
+        if state.plugin_class is not None:
+            return state.plugin_class
+
+        # Load lazy parent classes first so their changes are applied
+        for base in type.__getattribute__(cls, "__mro__")[1:]:
+            if isinstance(base, _LazyPluginMeta):
+                base._lazy_load()
+
+        module = state.importer(state.filepath)
+        plugin_class = getattr(module, cls.__name__, None)
+        if not inspect.isclass(plugin_class):
+            raise ImportError("Class {} was not found in {}".format(
+                cls.__name__, state.filepath
+            ))
+
+        class_dict = type.__getattribute__(cls, "__dict__")
+        for name, value in state.literals.items():
+            # Mutable values may have been changed in place
+            if name not in state.overrides and class_dict[name] != value:
+                setattr(plugin_class, name, class_dict[name])
+
+        for name, value in state.overrides.items():
+            setattr(plugin_class, name, value)
+        state.plugin_class = plugin_class
+        return plugin_class
+
+
+_LAZY_METACLASSES = {}
+
+
+def _get_lazy_metaclass(bases):
+    metaclass = type
+    for base in bases:
+        base_metaclass = type(base)
+        if issubclass(base_metaclass, metaclass):
+            metaclass = base_metaclass
+        elif not issubclass(metaclass, base_metaclass):
+            raise TypeError("Metaclass conflict of {}".format(bases))
+
+    if issubclass(metaclass, _LazyPluginMeta):
+        return metaclass
+
+    if metaclass is type:
+        return _LazyPluginMeta
+
+    lazy_metaclass = _LAZY_METACLASSES.get(metaclass)
+    if lazy_metaclass is None:
+        lazy_metaclass = type(
+            str("Lazy{}".format(metaclass.__name__)),
+            (_LazyPluginMeta, metaclass),
+            {}
+        )
+        _LAZY_METACLASSES[metaclass] = lazy_metaclass
+    return lazy_metaclass
+
+
+def _create_lazy_classes(description, filepath, importer):
+    """Create lazy plugin classes from description of python file.
+
+    Raises:
+        Exception: When base classes can't be resolved without import of
+            the file.
+
+    Returns:
+        list[type]: Classes of the file sorted by name.
+    """
+
+    module_name = os.path.splitext(os.path.basename(filepath))[0]
+    classes = {}
+    for class_item in description["classes"]:
+        bases = []
+        for base_module_name, attrs in class_item["bases"]:
+            if base_module_name:
+                base = _resolve_object(base_module_name, attrs)
+            else:
+                base = classes[attrs[0]]
+            if not inspect.isclass(base):
+                raise TypeError("Base {} is not a class".format(base))
+            bases.append(base)
+
+        name = class_item["name"]
+        literals = {
+            attr_name: ast.literal_eval(value)
+            for attr_name, value in class_item["literals"].items()
+        }
+        state = _LazyPluginState(filepath, importer, literals)
+        namespace = {
+            "__module__": module_name,
+            "__doc__": class_item["doc"],
+            "_lazy_state": state,
+        }
+        if six.PY3:
+            namespace["__qualname__"] = name
+
+        abstract = set(class_item["abstract"])
+        for is_method, key in ((True, "methods"), (False, "values")):
+            for attr_name in class_item[key]:
+                namespace[attr_name] = _LazyAttribute(
+                    attr_name, is_method, attr_name in abstract
+                )
+
+        # Class gets own copies of literal values
+        for attr_name, value in class_item["literals"].items():
+            namespace[attr_name] = ast.literal_eval(value)
+
+        metaclass = _get_lazy_metaclass(bases)
+        classes[name] = metaclass(
+            str(name), tuple(bases or [object]), namespace
+        )
+        state.created = True
+
+    output = {}
+    for name, module_name, attr_name in description["imported"]:
+        module = sys.modules.get(module_name)
+        obj = getattr(module, attr_name, None)
+        if inspect.isclass(obj):
+            output[name] = obj
+    output.update(classes)
+    return [output[name] for name in sorted(output)]
+
+
+class _LazyPluginsImporter(object):
+    """Import python files of lazy plugins of one discovery.
+
+    Each file is imported only once, so all lazy classes from a file use
+    classes from the same module.
+    """
+
+    def __init__(self, result):
+        self._result = result
+        self._modules = {}
+
+    def __call__(self, filepath):
+        module = self._modules.get(filepath)
+        if module is None:
+            module_name = os.path.splitext(os.path.basename(filepath))[0]
+            module = import_filepath(filepath, module_name)
+            self._modules[filepath] = module
+            self._result.add_module(module)
+        return module
+
+
 class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
@@ -110,6 +720,8 @@ class PluginDiscoverContext(object):
         self._last_discovered_plugins = {}
         # Store the last result to memory
         self._last_discovered_results = {}
+        # Descriptions of python files by hash of their content
+        self._file_descriptions = {}
 
     def get_last_discovered_plugins(self, superclass):
         """Access last discovered plugin by a subperclass.
@@ -126,7 +738,8 @@ class PluginDiscoverContext(object):
         superclass,
         allow_duplicates=True,
         ignore_classes=None,
-        return_report=False
+        return_report=False,
+        lazy=False
     ):
         """Find and return subclasses of `superclass`
 
@@ -136,6 +749,9 @@ class PluginDiscoverContext(object):
             ignore_classes (list): List of classes that will be ignored
                 and not added to result.
             return_report (bool): Output will be full report if set to 'True'.
+            lazy (bool): Python files from registered paths are imported
+                only when their plugin is used. Plugins are subclasses of
+                the same base classes created from description of the file.
 
         Returns:
             Union[DiscoverResult, list[Any]]: Object holding successfully
@@ -167,16 +783,17 @@ class PluginDiscoverContext(object):
             result.plugins.append(cls)
 
         # Include plug-ins from registered paths
+        importer = _LazyPluginsImporter(result)
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
-            for item in crashed:
-                filepath, exc_info = item
-                result.crashed_file_paths[filepath] = exc_info
-
-            for item in modules:
-                filepath, module = item
-                result.add_module(module)
-                for cls in classes_from_module(superclass, module):
+            if lazy:
+                items = self._lazy_classes_from_path(
+                    path, superclass, importer, result
+                )
+            else:
+                items = self._classes_from_path(path, superclass, result)
+
+            for classes in items:
+                for cls in classes:
                     if cls is superclass or cls in ignore_classes:
                         result.ignored_plugins.add(cls)
                         continue
@@ -204,6 +821,69 @@ class PluginDiscoverContext(object):
             return result
         return result.plugins
 
+    def _classes_from_path(self, path, superclass, result):
+        modules, crashed = modules_from_path(path)
+        for item in crashed:
+            filepath, exc_info = item
+            result.crashed_file_paths[filepath] = exc_info
+
+        for item in modules:
+            filepath, module = item
+            result.add_module(module)
+            yield classes_from_module(superclass, module)
+
+    def _lazy_classes_from_path(self, path, superclass, importer, result):
+        if not os.path.isdir(path):
+            log.warning("Not a directory path: {}".format(path))
+            return
+
+        manifest = _read_plugins_manifest(path)
+        for filename, filepath in _iter_plugin_files(path):
+            with open(filepath, "rb") as stream:
+                content = stream.read()
+            file_hash = _file_hash(content)
+            manifest_item = manifest.get(filename)
+            if manifest_item and manifest_item.get("hash") == file_hash:
+                description = manifest_item["description"]
+            elif file_hash in self._file_descriptions:
+                description = self._file_descriptions[file_hash]
+            else:
+                description = describe_plugins_file(content)
+                self._file_descriptions[file_hash] = description
+
+            classes = None
+            if description is not None:
+                try:
+                    classes = _create_lazy_classes(
+                        description, filepath, importer
+                    )
+                except Exception:
+                    log.debug(
+                        "Failed to create lazy plugins of \"{}\"".format(
+                            filepath
+                        ),
+                        exc_info=True
+                    )
+
+            # Import file which can't be described
+            if classes is None:
+                try:
+                    module = importer(filepath)
+                except Exception:
+                    result.crashed_file_paths[filepath] = sys.exc_info()
+                    log.warning(
+                        "Failed to load path: \"{0}\"".format(filepath),
+                        exc_info=True
+                    )
+                    continue
+                classes = classes_from_module(superclass, module)
+
+            yield [
+                cls
+                for cls in classes
+                if cls is not superclass and issubclass(cls, superclass)
+            ]
+
     def register_plugin(self, superclass, cls):
         """Register a directory containing plug-ins of type `superclass`
 
@@ -273,7 +953,8 @@ def discover(
     superclass,
     allow_duplicates=True,
     ignore_classes=None,
-    return_report=False
+    return_report=False,
+    lazy=False
 ):
     """Find and return subclasses of `superclass`
 
@@ -283,6 +964,8 @@ def discover(
         ignore_classes (list): List of classes that will be ignored
             and not added to result.
         return_report (bool): Output will be full report if set to 'True'.
+        lazy (bool): Import python files of plugins from registered paths
+            when the plugins are used.
 
     Returns:
         Union[DiscoverResult, list[Any]]: Object holding successfully
@@ -295,7 +978,8 @@ def discover(
         superclass,
         allow_duplicates,
         ignore_classes,
-        return_report
+        return_report,
+        lazy
     )
 
 
@@ -26,6 +26,7 @@ from .lib import (
     get_publish_template_name,
 
     publish_plugins_discover,
+    clear_publish_plugins_cache,
     load_help_content_from_plugin,
     load_help_content_from_filepath,
 
@@ -73,6 +74,7 @@ __all__ = (
     "get_publish_template_name",
 
     "publish_plugins_discover",
+    "clear_publish_plugins_cache",
     "load_help_content_from_plugin",
     "load_help_content_from_filepath",
 
@@ -1,5 +1,7 @@
 import os
 import sys
+import stat
+import time
 import inspect
 import copy
 import tempfile
@@ -31,6 +33,9 @@ from .contants import (
     TRANSIENT_DIR_TEMPLATE
 )
 
+# Imported publish plugin files by absolute path
+_PUBLISH_FILES_CACHE = {}
+
 
 def get_template_name_profiles(
     project_name, project_settings=None, logger=None
@@ -265,22 +270,97 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
-def publish_plugins_discover(paths=None):
+class _PublishFileCacheItem(object):
+    """Imported publish plugin file with its discovered plugins.
+
+    Attributes of plugin classes are stored right after import and restored
+    when the item is reused so changes made on classes during processing
+    (e.g. applied settings) don't leak to next discovery.
+    """
+
+    def __init__(self, file_stat, module, plugins):
+        self.mtime = file_stat.st_mtime
+        self.size = file_stat.st_size
+        self.module = module
+        self.plugins = plugins
+        self._attributes = [
+            (plugin, dict(plugin.__dict__))
+            for plugin in plugins
+        ]
+
+    def is_valid(self, file_stat):
+        return (
+            self.mtime == file_stat.st_mtime
+            and self.size == file_stat.st_size
+        )
+
+    def restore_plugins(self):
+        for plugin, attributes in self._attributes:
+            for key in tuple(plugin.__dict__.keys()):
+                if key not in attributes:
+                    delattr(plugin, key)
+
+            for key, value in attributes.items():
+                if plugin.__dict__.get(key) is not value:
+                    setattr(plugin, key, value)
+        return self.plugins
+
+
+def clear_publish_plugins_cache():
+    """Force import of all publish plugin files on next discovery."""
+
+    _PUBLISH_FILES_CACHE.clear()
+
+
+def _import_publish_plugins_file(abspath, mod_name, file_stat):
+    module = import_filepath(abspath, mod_name)
+
+    # Store reference to original module, to avoid
+    # garbage collection from collecting it's global
+    # imports, such as `import os`.
+    sys.modules[abspath] = module
+
+    plugins = []
+    for plugin in pyblish.plugin.plugins_from_module(module):
+        # Ignore base plugin classes
+        # NOTE 'pyblish.api.discover' does not ignore them!
+        if (
+            plugin is pyblish.api.Plugin
+            or plugin is pyblish.api.ContextPlugin
+            or plugin is pyblish.api.InstancePlugin
+        ):
+            continue
+        plugin.__module__ = module.__file__
+        plugins.append(plugin)
+
+    cache_item = _PublishFileCacheItem(file_stat, module, plugins)
+    _PUBLISH_FILES_CACHE[abspath] = cache_item
+    return cache_item
+
+
+def publish_plugins_discover(paths=None, use_cache=True):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able to collect
         crashed files and reason of their crash.
 
+    Files are imported only if were not imported before or their
+        modification time or size changed since last discovery. Changes
+        of modules imported by plugin files are not detected, use
+        'clear_publish_plugins_cache' or 'use_cache' to force import.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        use_cache (bool, optional): Reuse plugins from files which did
+            not change since last discovery.
     """
 
     # The only difference with `pyblish.api.discover`
     result = DiscoverResult(pyblish.api.Plugin)
 
     plugins = {}
-    plugin_names = []
+    plugin_names = set()
 
     allow_duplicates = pyblish.plugin.ALLOW_DUPLICATES
     log = pyblish.plugin.log
@@ -294,54 +374,71 @@ def publish_plugins_discover(paths=None):
         if not os.path.isdir(path):
             continue
 
+        start_time = time.time()
+        imported_count = 0
+        cached_count = 0
         for fname in os.listdir(path):
             if fname.startswith("_"):
                 continue
 
-            abspath = os.path.join(path, fname)
-
-            if not os.path.isfile(abspath):
-                continue
-
             mod_name, mod_ext = os.path.splitext(fname)
 
             if mod_ext != ".py":
                 continue
 
-            try:
-                module = import_filepath(abspath, mod_name)
-
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[abspath] = module
+            abspath = os.path.join(path, fname)
 
-            except Exception as err:
-                result.crashed_file_paths[abspath] = sys.exc_info()
+            try:
+                file_stat = os.stat(abspath)
+            except OSError:
+                continue
 
-                log.debug("Skipped: \"%s\" (%s)", mod_name, err)
+            if not stat.S_ISREG(file_stat.st_mode):
                 continue
 
-            for plugin in pyblish.plugin.plugins_from_module(module):
-                # Ignore base plugin classes
-                # NOTE 'pyblish.api.discover' does not ignore them!
-                if (
-                    plugin is pyblish.api.Plugin
-                    or plugin is pyblish.api.ContextPlugin
-                    or plugin is pyblish.api.InstancePlugin
-                ):
+            cache_item = _PUBLISH_FILES_CACHE.get(abspath)
+            if (
+                use_cache
+                and cache_item is not None
+                and cache_item.is_valid(file_stat)
+            ):
+                cached_count += 1
+                file_plugins = cache_item.restore_plugins()
+
+            else:
+                try:
+                    cache_item = _import_publish_plugins_file(
+                        abspath, mod_name, file_stat
+                    )
+
+                except Exception as err:
+                    _PUBLISH_FILES_CACHE.pop(abspath, None)
+                    result.crashed_file_paths[abspath] = sys.exc_info()
+
+                    log.debug("Skipped: \"%s\" (%s)", mod_name, err)
                     continue
+
+                imported_count += 1
+                file_plugins = cache_item.plugins
+
+            for plugin in file_plugins:
                 if not allow_duplicates and plugin.__name__ in plugin_names:
                     result.duplicated_plugins.append(plugin)
                     log.debug("Duplicate plug-in found: %s", plugin)
                     continue
 
-                plugin_names.append(plugin.__name__)
+                plugin_names.add(plugin.__name__)
 
-                plugin.__module__ = module.__file__
                 key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
                 plugins[key] = plugin
 
+        duration = time.time() - start_time
+        result.discover_durations[path] = duration
+        log.debug(
+            "Discovered plug-ins in \"%s\" in %.3fs (%d imported, %d cached)",
+            path, duration, imported_count, cached_count
+        )
+
     # Include plug-ins from registration.
     # Directly registered plug-ins take precedence.
     for plugin in pyblish.plugin.registered_plugins():
@@ -350,7 +447,7 @@ def publish_plugins_discover(paths=None):
             log.debug("Duplicate plug-in found: %s", plugin)
             continue
 
-        plugin_names.append(plugin.__name__)
+        plugin_names.add(plugin.__name__)
 
         plugins[plugin.__name__] = plugin
 
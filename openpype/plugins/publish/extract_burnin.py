@@ -74,6 +74,8 @@ class ExtractBurnin(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Maximum parallel conversions for ffmpeg, CPU count is used if 0
+    oiio_conversion_max_workers = 0
 
     def process(self, instance):
         if not self.profiles:
@@ -237,7 +239,8 @@ class ExtractBurnin(publish.Extractor):
                 convert_input_paths_for_ffmpeg(
                     src_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    max_workers=self.oiio_conversion_max_workers
                 )
 
             # Add anatomy keys to burnin_data.
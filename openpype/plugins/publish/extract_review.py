@@ -76,6 +76,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Maximum parallel conversions for ffmpeg, CPU count is used if 0
+    oiio_conversion_max_workers = 0
+    # Render outputs with same input using one ffmpeg command
+    single_pass_outputs = False
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -277,7 +281,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 convert_input_paths_for_ffmpeg(
                     input_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    max_workers=self.oiio_conversion_max_workers
                 )
 
             try:
@@ -301,7 +306,67 @@ class ExtractReview(pyblish.api.InstancePlugin):
     def _render_output_definitions(
         self, instance, repre, src_repre_staging_dir, output_definitions
     ):
+        # Gaps are filled once for all output definitions
+        files_to_clean = []
+        if self.input_is_sequence(repre):
+            self.log.debug("Checking sequence to fill gaps in sequence..")
+            files_to_clean = self.fill_sequence_gaps(
+                files=repre["files"],
+                staging_dir=src_repre_staging_dir,
+                start_frame=instance.data["frameStart"],
+                end_frame=instance.data["frameEnd"]
+            )
+
+        try:
+            output_items = self._prepare_output_items(
+                instance, repre, src_repre_staging_dir, output_definitions
+            )
+            for items in self._group_output_items(output_items):
+                self._render_output_items(items)
+
+        finally:
+            # delete files added to fill gaps
+            for filepath in files_to_clean:
+                os.unlink(filepath)
+
+        for item in output_items:
+            new_repre = item["new_repre"]
+            temp_data = item["temp_data"]
+            output_name = item["output_name"]
+            new_repre.update({
+                "fps": temp_data["fps"],
+                "name": "{}_{}".format(output_name, item["output_ext"]),
+                "outputName": output_name,
+                "outputDef": item["output_def"],
+                "frameStartFtrack": temp_data["output_frame_start"],
+                "frameEndFtrack": temp_data["output_frame_end"],
+                "ffmpeg_cmd": item["ffmpeg_cmd"]
+            })
+
+            # Force to pop these key if are in new repre
+            new_repre.pop("thumbnail", None)
+            if "clean_name" in new_repre.get("tags", []):
+                new_repre.pop("outputName")
+
+            # adding representation
+            self.log.debug(
+                "Adding new representation: {}".format(new_repre)
+            )
+            instance.data["representations"].append(new_repre)
+
+            add_repre_files_for_cleanup(instance, new_repre)
+
+    def _prepare_output_items(
+        self, instance, repre, src_repre_staging_dir, output_definitions
+    ):
+        """Prepare representations and ffmpeg arguments of outputs.
+
+        Returns:
+            list[dict]: Prepared outputs.
+        """
+
         fill_data = copy.deepcopy(instance.data["anatomyData"])
+        output_items = []
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
             # Make sure output definition has "tags" key
@@ -344,15 +409,6 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
             temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
-                self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
-                )
 
             # create or update outputName
             output_name = new_repre.get("outputName", "")
@@ -370,10 +426,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
             })
 
             try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
+                args_parts = self._ffmpeg_arguments_parts(
                     output_def, instance, new_repre, temp_data, fill_data
                 )
             except ZeroDivisionError:
+                # Outputs prepared before are still processed
                 # TODO recalculate width and height using OIIO before
                 #   conversion
                 if 'exr' in temp_data["origin_repre"]["ext"]:
@@ -384,43 +441,86 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    break
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
+            output_items.append({
+                "output_def": output_def,
+                "new_repre": new_repre,
+                "temp_data": temp_data,
+                "output_name": output_name,
+                "output_ext": output_ext,
+                "args_parts": args_parts,
+            })
+        return output_items
 
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+    def _group_output_items(self, output_items):
+        """Group outputs which can be rendered by one ffmpeg command.
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+        Outputs are grouped only if 'single_pass_outputs' is enabled. Outputs
+        with exactly same input arguments are in one group, so the input is
+        decoded only once for all of them.
 
-            # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
+        Args:
+            output_items (list[dict]): Prepared outputs.
 
-            new_repre.update({
-                "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
-                "outputName": output_name,
-                "outputDef": output_def,
-                "frameStartFtrack": temp_data["output_frame_start"],
-                "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
-            })
+        Returns:
+            list[list[dict]]: Groups of outputs.
+        """
 
-            # Force to pop these key if are in new repre
-            new_repre.pop("thumbnail", None)
-            if "clean_name" in new_repre.get("tags", []):
-                new_repre.pop("outputName")
+        if not self.single_pass_outputs:
+            return [[item] for item in output_items]
 
-            # adding representation
-            self.log.debug(
-                "Adding new representation: {}".format(new_repre)
+        groups = []
+        groups_by_input = {}
+        for item in output_items:
+            args_parts = item["args_parts"]
+            if not self._can_use_single_pass(args_parts):
+                groups.append([item])
+                continue
+
+            input_key = tuple(args_parts["input_args"])
+            group = groups_by_input.get(input_key)
+            if group is None:
+                group = []
+                groups_by_input[input_key] = group
+                groups.append(group)
+            group.append(item)
+        return groups
+
+    def _render_output_items(self, items):
+        """Run ffmpeg for group of outputs sharing input arguments.
+
+        Args:
+            items (list[dict]): Prepared outputs.
+        """
+
+        if len(items) == 1:
+            args_parts = items[0]["args_parts"]
+            ffmpeg_args = self.ffmpeg_full_args(
+                args_parts["input_args"],
+                args_parts["video_filters"],
+                args_parts["audio_filters"],
+                args_parts["output_args"]
             )
-            instance.data["representations"].append(new_repre)
+        else:
+            ffmpeg_args = self.single_pass_full_args(
+                items[0]["args_parts"]["input_args"],
+                [item["args_parts"] for item in items]
+            )
+            self.log.debug((
+                "Rendering {} outputs with single pass of input."
+            ).format(len(items)))
 
-            add_repre_files_for_cleanup(instance, new_repre)
+        subprcs_cmd = " ".join(ffmpeg_args)
+
+        # run subprocess
+        self.log.debug("Executing: {}".format(subprcs_cmd))
+
+        run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+
+        for item in items:
+            item["ffmpeg_cmd"] = subprcs_cmd
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -545,6 +645,40 @@ class ExtractReview(pyblish.api.InstancePlugin):
             new_repre (dict): Representation representing output of this
                 process.
             temp_data (dict): Base data for successful process.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+
+        args_parts = self._ffmpeg_arguments_parts(
+            output_def, instance, new_repre, temp_data, fill_data
+        )
+        return self.ffmpeg_full_args(
+            args_parts["input_args"],
+            args_parts["video_filters"],
+            args_parts["audio_filters"],
+            args_parts["output_args"]
+        )
+
+    def _ffmpeg_arguments_parts(
+        self, output_def, instance, new_repre, temp_data, fill_data
+    ):
+        """Prepares parts of ffmpeg arguments for expected extraction.
+
+        Parts are kept separated so arguments of multiple output definitions
+        can be combined to one ffmpeg command.
+
+        Args:
+            output_def (dict): Currently processed output definition.
+            instance (Instance): Currently processed instance.
+            new_repre (dict): Representation representing output of this
+                process.
+            temp_data (dict): Base data for successful process.
+
+        Returns:
+            dict: Input arguments, video filters, audio filters and output
+                arguments with output filepath. Key 'with_audio_inputs'
+                tells if audio inputs were added to input arguments.
         """
 
         # Get FFmpeg arguments from profile presets
@@ -721,12 +855,20 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
-            ffmpeg_input_args,
-            ffmpeg_video_filters,
-            ffmpeg_audio_filters,
-            ffmpeg_output_args
+        ffmpeg_output_args = self._move_filters_from_output_args(
+            ffmpeg_video_filters, ffmpeg_audio_filters, ffmpeg_output_args
         )
+        return {
+            "input_args": ffmpeg_input_args,
+            "video_filters": ffmpeg_video_filters,
+            "audio_filters": ffmpeg_audio_filters,
+            "output_args": ffmpeg_output_args,
+            "with_audio_inputs": (
+                not temp_data["output_ext_is_image"]
+                and temp_data["with_audio"]
+            ),
+            "with_source_audio": not temp_data["output_ext_is_image"]
+        }
 
     def split_ffmpeg_args(self, in_args):
         """Makes sure all entered arguments are separated in individual items.
@@ -769,6 +911,41 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self._move_filters_from_output_args(
+            video_filters, audio_filters, output_args
+        )
+
+        all_args = []
+        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def _move_filters_from_output_args(
+        self, video_filters, audio_filters, output_args
+    ):
+        """Move video and audio filters from output arguments to filters.
+
+        Args:
+            video_filters (list): All collected video filters. Filters found
+                in output arguments are appended.
+            audio_filters (list): All collected audio filters. Filters found
+                in output arguments are appended.
+            output_args (list): All collected ffmpeg output arguments with
+                output filepath.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -786,19 +963,76 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
 
+        return output_args
+
+    def _can_use_single_pass(self, args_parts):
+        """Output can be rendered as one of outputs of single ffmpeg command.
+
+        Outputs with audio inputs, audio filters or labeled video filters
+        (e.g. background color) are rendered separately as their filter
+        graph can't be simply attached to split input.
+
+        Args:
+            args_parts (dict): Parts of ffmpeg arguments of an output.
+
+        Returns:
+            bool: Output can be combined with other outputs.
+        """
+
+        if args_parts["with_audio_inputs"] or args_parts["audio_filters"]:
+            return False
+
+        for video_filter in args_parts["video_filters"]:
+            if "[" in video_filter or ";" in video_filter:
+                return False
+
+        for arg in args_parts["output_args"]:
+            arg_name = arg.split(" ")[0]
+            if arg_name in ("-map", "-filter_complex", "-lavfi"):
+                return False
+        return True
+
+    def single_pass_full_args(self, input_args, outputs_args_parts):
+        """Combine multiple outputs with same input to one ffmpeg command.
+
+        Decoded input is split using 'split' filter to a branch per output
+        and each branch has applied video filters of the output. Output
+        arguments of each output are prefixed with mapping of its branch
+        and of audio streams of the input for non-image outputs.
+
+        Args:
+            input_args (list): Input arguments shared by all outputs.
+            outputs_args_parts (list[dict]): Parts of ffmpeg arguments
+                of each output.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+
+        outputs_count = len(outputs_args_parts)
+        filter_graph = ["[0:v]split={}{}".format(
+            outputs_count,
+            "".join("[s{}]".format(idx) for idx in range(outputs_count))
+        )]
+        output_args = []
+        for idx, args_parts in enumerate(outputs_args_parts):
+            video_filters = args_parts["video_filters"] or ["null"]
+            filter_graph.append("[s{}]{}[v{}]".format(
+                idx, ",".join(video_filters), idx
+            ))
+            output_args.extend(["-map", "\"[v{}]\"".format(idx)])
+            # Explicit mapping disables automatic selection of streams so
+            #   audio of source is mapped too (if there is any)
+            if args_parts.get("with_source_audio"):
+                output_args.extend(["-map", "0:a?"])
+            output_args.extend(args_parts["output_args"])
+
         all_args = []
         all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
         all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
-
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(filter_graph)))
         all_args.extend(output_args)
-
         return all_args
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
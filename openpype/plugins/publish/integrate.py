@@ -5,6 +5,12 @@ import copy
 import clique
 import six
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 without 'futures' backport - files are stat serially
+    ThreadPoolExecutor = None
+
 from bson.objectid import ObjectId
 import pyblish.api
 
@@ -19,11 +25,12 @@ from openpype.client.operations import (
 )
 
 from openpype.client import (
+    entity_cache,
     get_representations,
     get_subset_by_name,
     get_version_by_name,
 )
-from openpype.lib import source_hash
+from openpype.lib import source_hash_from_stat
 from openpype.lib.file_transaction import (
     FileTransaction,
     DuplicateDestinationError
@@ -150,6 +157,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
     ]
     skip_host_families = []
 
+    # File transfer options
+    # - more than 1 worker transfer files concurrently
+    transfer_max_workers = 4
+    transfer_retries = 0
+    # - verification of transferred files ("none", "size" or "hash")
+    transfer_verify = "none"
+
     def process(self, instance):
         if self._temp_skip_instance_by_settings(instance):
             return
@@ -178,11 +192,22 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        transfer_verify = self.transfer_verify
+        if transfer_verify == "none":
+            transfer_verify = None
+
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers,
+            retries=self.transfer_retries,
+            verify=transfer_verify
+        )
+        project_name = instance.context.data["projectName"]
         try:
-            self.register(instance, file_transactions, filtered_repres)
+            with entity_cache(project_name):
+                self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
             # Raise DuplicateDestinationError as KnownPublishError
             # and rollback the transactions
@@ -367,9 +392,26 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can re-use those file infos per representation
+        # Stats of transferred files are reused, other files are collected
+        #   at once so each file is accessed only once
+        file_stats = file_transactions.transferred_stats
+        all_destinations = list(resource_destinations)
+        for prepared in prepared_representations:
+            all_destinations.extend(
+                dst for _, dst in prepared["transfers"]
+            )
+        file_stats.update(self.get_files_stats(
+            [
+                path
+                for path in all_destinations
+                if self._file_stat_key(path) not in file_stats
+            ]
+        ))
+
         resource_file_infos = self.get_files_info(resource_destinations,
                                                   sites=sites,
-                                                  anatomy=anatomy)
+                                                  anatomy=anatomy,
+                                                  file_stats=file_stats)
 
         # Finalize the representations now the published files are integrated
         # Get 'files' info for representations and its attached resources
@@ -380,7 +422,10 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_doc["files"] = self.get_files_info(
-                destinations, sites=sites, anatomy=anatomy
+                destinations,
+                sites=sites,
+                anatomy=anatomy,
+                file_stats=file_stats
             )
 
             # Add the version resource file infos to each representation
@@ -700,17 +745,20 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             if not is_sequence_representation:
                 files = [files]
 
-            repre_context = None
-            transfers = []
-            for src_file_name in files:
-                template_data["originalBasename"], _ = os.path.splitext(
-                    src_file_name)
+            original_basenames = [
+                os.path.splitext(src_file_name)[0]
+                for src_file_name in files
+            ]
+            dst_filepaths = path_template_obj.format_strict_batch(
+                template_data, {"originalBasename": original_basenames}
+            )
+            template_data["originalBasename"] = original_basenames[-1]
 
-                dst = path_template_obj.format_strict(template_data)
+            transfers = []
+            for src_file_name, dst in zip(files, dst_filepaths):
                 src = os.path.join(stagingdir, src_file_name)
                 transfers.append((src, dst))
-                if repre_context is None:
-                    repre_context = dst.used_values
+            repre_context = dst_filepaths[0].used_values
 
             if not is_udim and first_index_padded is not None:
                 repre_context["frame"] = first_index_padded
@@ -759,22 +807,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            index_key = "udim" if is_udim else "frame"
+            dst_filepaths = path_template_obj.format_strict_batch(
+                template_data, {index_key: destination_indexes}
+            )
+            template_data[index_key] = destination_indexes[-1]
+            self.log.debug(
+                "Template filled: {}".format(str(dst_filepaths[0]))
+            )
+            repre_context = dst_filepaths[0].used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -979,25 +1020,71 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, destinations, sites, anatomy):
+    @staticmethod
+    def _file_stat_key(path):
+        # Same normalization as 'FileTransaction' uses for destinations
+        return os.path.normpath(os.path.abspath(path))
+
+    def get_files_stats(self, paths):
+        """Stat files concurrently.
+
+        Uses the same amount of threads as file transfers. Files are stat
+        serially if 'concurrent.futures' is not available (Python 2).
+
+        Arguments:
+            paths (list): Paths to files.
+        Returns:
+            dict: Stat results by normalized path.
+        """
+
+        paths = list({self._file_stat_key(path) for path in paths})
+        max_workers = min(self.transfer_max_workers, len(paths))
+        if max_workers < 2 or ThreadPoolExecutor is None:
+            return {path: os.stat(path) for path in paths}
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            return dict(zip(paths, executor.map(os.stat, paths)))
+        finally:
+            executor.shutdown(wait=True)
+
+    def get_files_info(self, destinations, sites, anatomy, file_stats=None):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             destinations (list): List of transferred file destinations
             sites (list): array of published locations
             anatomy: anatomy part from instance
+            file_stats (dict): Already known stat results by normalized
+                destination, missing are collected
         Returns:
             output_resources: array of dictionaries to be added to 'files' key
             in representation
         """
 
+        if file_stats is None:
+            file_stats = {}
+        missing_stats = self.get_files_stats(
+            [
+                path
+                for path in destinations
+                if self._file_stat_key(path) not in file_stats
+            ]
+        )
+
         file_infos = []
         for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+            stat_key = self._file_stat_key(file_path)
+            file_stat = file_stats.get(stat_key)
+            if file_stat is None:
+                file_stat = missing_stats[stat_key]
+            file_info = self.prepare_file_info(
+                file_path, anatomy, sites=sites, file_stat=file_stat
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def prepare_file_info(self, path, anatomy, sites, file_stat=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -1006,16 +1093,21 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            file_stat: result of 'os.stat' of the file, file is accessed
+                if not passed
 
         Returns:
             dict: file info dictionary
         """
 
+        if file_stat is None:
+            file_stat = os.stat(path)
+
         return {
             "_id": ObjectId(),
             "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
+            "size": file_stat.st_size,
+            "hash": source_hash_from_stat(path, file_stat),
             "sites": sites
         }
 
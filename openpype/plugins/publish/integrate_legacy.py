@@ -24,6 +24,7 @@ from openpype.client import (
     get_representations,
     get_archived_representations,
 )
+from openpype.client.operations import REPRESENTATION_LAST_MODIFIED_KEY
 from openpype.lib import (
     prepare_template_data,
     create_hard_link,
@@ -697,6 +698,9 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         for rep in instance.data["representations"]:
             self.log.debug("__ rep: {}".format(rep))
 
+        last_modified = datetime.utcnow()
+        for representation in representations:
+            representation[REPRESENTATION_LAST_MODIFIED_KEY] = last_modified
         legacy_io.insert_many(representations)
         instance.data["published_representations"] = (
             published_representations
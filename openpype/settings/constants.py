@@ -17,6 +17,8 @@ SYSTEM_SETTINGS_KEY = "system_settings"
 PROJECT_SETTINGS_KEY = "project_settings"
 PROJECT_ANATOMY_KEY = "project_anatomy"
 LOCAL_SETTING_KEY = "local_settings"
+# Document with token which is changed on each change of settings
+SETTINGS_CHANGE_TOKEN_KEY = "settings_change_token"
 
 LEGACY_SETTINGS_VERSION = "legacy"
 
@@ -40,6 +42,7 @@ __all__ = (
     "PROJECT_SETTINGS_KEY",
     "PROJECT_ANATOMY_KEY",
     "LOCAL_SETTING_KEY",
+    "SETTINGS_CHANGE_TOKEN_KEY",
 
     "SCHEMA_KEY_SYSTEM_SETTINGS",
     "SCHEMA_KEY_PROJECT_SETTINGS",
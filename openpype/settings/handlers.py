@@ -1,6 +1,8 @@
 import os
 import json
 import copy
+import time
+import uuid
 import collections
 import datetime
 from abc import ABCMeta, abstractmethod
@@ -9,6 +11,7 @@ import six
 import openpype.version
 from openpype.client.mongo import OpenPypeMongoConnection
 from openpype.client.entities import get_project_connection, get_project
+from openpype.client.operations import PROJECT_LAST_MODIFIED_KEY
 from openpype.lib.pype_info import get_workstation_info
 
 from .constants import (
@@ -17,6 +20,7 @@ from .constants import (
     PROJECT_SETTINGS_KEY,
     PROJECT_ANATOMY_KEY,
     LOCAL_SETTING_KEY,
+    SETTINGS_CHANGE_TOKEN_KEY,
     M_OVERRIDDEN_KEY,
 
     LEGACY_SETTINGS_VERSION
@@ -479,6 +483,18 @@ class SettingsHandler(object):
 
         pass
 
+    def get_change_token(self):
+        """Token which is changed on each change of settings.
+
+        Token can be used to find out if settings resolved from overrides
+        are still valid. Handlers which don't track changes return 'None'.
+
+        Returns:
+            Union[str, None]: Current change token.
+        """
+
+        return None
+
     # UI related calls
     @abstractmethod
     def get_last_opened_info(self):
@@ -550,6 +566,31 @@ class LocalSettingsHandler:
         pass
 
 
+def update_settings_change_token(collection):
+    """Change token stored with settings documents.
+
+    Must be called on each change of settings documents so other processes
+    know that their resolved settings are outdated.
+
+    Args:
+        collection (Collection): Settings collection.
+
+    Returns:
+        str: New change token.
+    """
+
+    token = uuid.uuid4().hex
+    collection.update_one(
+        {"type": SETTINGS_CHANGE_TOKEN_KEY},
+        {"$set": {
+            "token": token,
+            "timestamp": datetime.datetime.now()
+        }},
+        upsert=True
+    )
+    return token
+
+
 class CacheValues:
     cache_lifetime = 10
 
@@ -604,6 +645,8 @@ class MongoSettingsHandler(SettingsHandler):
     key_suffix = "_versioned"
     _version_order_key = "versions_order"
     _all_versions_keys = "all_versions"
+    # Interval in seconds in which is change token validated in database
+    change_token_check_interval = 2
 
     def __init__(self):
         # Get mongo connection
@@ -635,6 +678,28 @@ class MongoSettingsHandler(SettingsHandler):
         self.project_settings_cache = collections.defaultdict(CacheValues)
         self.project_anatomy_cache = collections.defaultdict(CacheValues)
 
+        self._change_token = None
+        self._change_token_checked = None
+
+    def get_change_token(self):
+        now = time.time()
+        if (
+            self._change_token_checked is None
+            or (now - self._change_token_checked)
+            > self.change_token_check_interval
+        ):
+            doc = self.collection.find_one(
+                {"type": SETTINGS_CHANGE_TOKEN_KEY},
+                {"token": True}
+            )
+            self._change_token = (doc or {}).get("token")
+            self._change_token_checked = now
+        return self._change_token
+
+    def _settings_changed(self):
+        self._change_token = update_settings_change_token(self.collection)
+        self._change_token_checked = time.time()
+
     def _prepare_project_settings_keys(self):
         from .entities import ProjectSettings
         # Prepare anatomy keys and attribute keys
@@ -849,6 +914,7 @@ class MongoSettingsHandler(SettingsHandler):
             },
             upsert=True
         )
+        self._settings_changed()
 
     def save_project_settings(self, project_name, overrides):
         """Save studio overrides of project settings.
@@ -1010,10 +1076,13 @@ class MongoSettingsHandler(SettingsHandler):
             new_key = "config.{}".format(key)
             update_dict[new_key] = value
 
+        update_dict[PROJECT_LAST_MODIFIED_KEY] = datetime.datetime.utcnow()
+
         collection.update_one(
             {"type": "project"},
             {"$set": update_dict}
         )
+        self._settings_changed()
 
     def _save_project_data(
         self, project_name, doc_type, data_cache, last_saved_info
@@ -1048,6 +1117,7 @@ class MongoSettingsHandler(SettingsHandler):
             )
         else:
             self.collection.insert_one(new_project_settings_doc)
+        self._settings_changed()
 
     def _get_versions_order_doc(self, projection=None):
         # TODO cache
@@ -1575,6 +1645,7 @@ class MongoSettingsHandler(SettingsHandler):
             "type": self._system_settings_key,
             "version": version
         })
+        self._settings_changed()
 
     def clear_studio_project_settings_overrides_for_version(self, version):
         self.collection.delete_one({
@@ -1582,12 +1653,14 @@ class MongoSettingsHandler(SettingsHandler):
             "version": version,
             "is_default": True
         })
+        self._settings_changed()
 
     def clear_studio_project_anatomy_overrides_for_version(self, version):
         self.collection.delete_one({
             "type": self._project_anatomy_key,
             "version": version
         })
+        self._settings_changed()
 
     def clear_project_settings_overrides_for_version(
         self, version, project_name
@@ -1597,6 +1670,7 @@ class MongoSettingsHandler(SettingsHandler):
             "version": version,
             "project_name": project_name
         })
+        self._settings_changed()
 
     def _sort_versions(self, versions):
         """Sort versions.
@@ -1847,6 +1921,7 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             },
             upsert=True
         )
+        update_settings_change_token(self.collection)
 
     def get_local_settings(self):
         """Local settings for local site id."""
@@ -1,9 +1,16 @@
 import os
 import json
+import time
+import pickle
+import hashlib
 import functools
 import logging
 import platform
 import copy
+import threading
+
+import appdirs
+
 from .exceptions import (
     SaveWarningExc
 )
@@ -30,6 +37,12 @@ DEFAULTS_DIR = os.path.join(
     "defaults"
 )
 
+# Directory where bundles of default settings from 'DEFAULTS_DIR' are cached
+#   - is per user as package directory can be shared or read-only
+DEFAULTS_BUNDLE_DIR = appdirs.user_cache_dir("openpype", "pypeclub")
+# Version of bundle structure
+_DEFAULTS_BUNDLE_VERSION = 1
+
 # Variable where cache of default settings are stored
 _DEFAULT_SETTINGS = None
 
@@ -40,6 +53,62 @@ _SETTINGS_HANDLER = None
 _LOCAL_SETTINGS_HANDLER = None
 
 
+class ResolvedSettingsCache(object):
+    """Cache of settings with applied overrides and local settings.
+
+    Resolved values are valid until change token of settings handler changes.
+    Values resolved when handler did not provide any token are valid only
+    for 'lifetime' seconds.
+    """
+
+    lifetime = 10
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, token):
+        """Copy of cached settings if are still valid.
+
+        Args:
+            key (tuple): Cache key.
+            token (Union[str, None]): Current change token.
+
+        Returns:
+            Union[dict[str, Any], None]: Copy of resolved settings.
+        """
+
+        with self._lock:
+            item = self._items.get(key)
+            valid = (
+                item is not None
+                and item[0] == token
+                and (
+                    token is not None
+                    or (time.time() - item[1]) < self.lifetime
+                )
+            )
+            if not valid:
+                self.misses += 1
+                return None
+            self.hits += 1
+            value = item[2]
+        return copy.deepcopy(value)
+
+    def set(self, key, token, value):
+        with self._lock:
+            self._items[key] = (token, time.time(), copy.deepcopy(value))
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_RESOLVED_SETTINGS_CACHE = ResolvedSettingsCache()
+
+
 def require_handler(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -116,6 +185,59 @@ def closed_settings_ui(info_obj):
     return _SETTINGS_HANDLER.closed_settings_ui(info_obj)
 
 
+@require_handler
+def get_settings_change_token():
+    """Token which is changed on each change of settings.
+
+    Returns:
+        Union[str, None]: Current change token or 'None' if settings handler
+            does not track changes.
+    """
+
+    return _SETTINGS_HANDLER.get_change_token()
+
+
+def clear_resolved_settings_cache():
+    """Clear cache of resolved system and project settings."""
+    _RESOLVED_SETTINGS_CACHE.clear()
+
+
+def _get_resolved_settings(
+    settings_key, project_name, clear_metadata, exclude_locals, resolve_func
+):
+    """Resolved settings from cache or resolved using passed function.
+
+    Args:
+        settings_key (str): Type of settings.
+        project_name (Union[str, None]): Name of project.
+        clear_metadata (bool): Metadata are removed from settings.
+        exclude_locals (Union[bool, None]): Local settings are not applied.
+        resolve_func (Callable[[], dict[str, Any]]): Function resolving
+            settings when cache is not valid.
+
+    Returns:
+        dict[str, Any]: Resolved settings.
+    """
+
+    from openpype.version import __version__
+
+    # Local site id can be changed only using environment variable
+    cache_key = (
+        settings_key,
+        project_name,
+        os.environ.get("OPENPYPE_LOCAL_ID"),
+        __version__,
+        clear_metadata,
+        exclude_locals
+    )
+    token = get_settings_change_token()
+    result = _RESOLVED_SETTINGS_CACHE.get(cache_key, token)
+    if result is None:
+        result = resolve_func()
+        _RESOLVED_SETTINGS_CACHE.set(cache_key, token, result)
+    return result
+
+
 @require_handler
 def save_studio_settings(data):
     """Save studio overrides of system settings.
@@ -490,7 +612,10 @@ def clear_project_settings_overrides_for_version(
 
 @require_local_handler
 def save_local_settings(data):
-    return _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
+    output = _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
+    # Local settings handler does not change token known by settings handler
+    clear_resolved_settings_cache()
+    return output
 
 
 @require_local_handler
@@ -499,8 +624,158 @@ def get_local_settings():
 
 
 def load_openpype_default_settings():
-    """Load openpype default settings."""
-    return load_jsons_from_dir(DEFAULTS_DIR)
+    """Load openpype default settings.
+
+    Defaults are loaded from bundle in user's cache if is up to date with
+    json files in 'DEFAULTS_DIR'. Bundle is created if is missing or
+    outdated.
+    """
+    bundle_path = _get_defaults_bundle_path()
+    fingerprint = _get_defaults_fingerprint(DEFAULTS_DIR)
+    defaults = _load_defaults_bundle(bundle_path, fingerprint)
+    if defaults is None:
+        defaults = load_jsons_from_dir(DEFAULTS_DIR)
+        _save_defaults_bundle(bundle_path, fingerprint, defaults)
+    return defaults
+
+
+def _get_defaults_bundle_path():
+    """Path to bundle of default settings in user's cache.
+
+    Each defaults directory has own bundle, so multiple installed versions
+    of OpenPype don't overwrite bundles of each other.
+
+    Returns:
+        str: Path to bundle file.
+    """
+    dir_hash = hashlib.sha1(
+        os.path.normpath(DEFAULTS_DIR).encode("utf-8")
+    ).hexdigest()
+    return os.path.join(
+        DEFAULTS_BUNDLE_DIR, "defaults_{}.bundle".format(dir_hash[:16])
+    )
+
+
+def _get_defaults_fingerprint(path):
+    """Fingerprint of json files in directory based on their stats.
+
+    Args:
+        path (str): Path to directory with json files.
+
+    Returns:
+        str: Hash of relative paths, sizes and modification times of files.
+    """
+    items = []
+    base_len = len(os.path.normpath(path)) + 1
+    for base, _directories, filenames in os.walk(path):
+        for filename in filenames:
+            if not filename.endswith(".json"):
+                continue
+            full_path = os.path.join(base, filename)
+            stat = os.stat(full_path)
+            # Integer modification time is formatted same in Python 2 and 3
+            items.append("{}|{}|{}".format(
+                full_path[base_len:], stat.st_size, int(stat.st_mtime)
+            ))
+    items.sort()
+    return hashlib.sha1("\n".join(items).encode("utf-8")).hexdigest()
+
+
+def _load_defaults_bundle(bundle_path, fingerprint):
+    """Load default settings from bundle.
+
+    Args:
+        bundle_path (str): Path to bundle.
+        fingerprint (str): Expected fingerprint of source files.
+
+    Returns:
+        Union[dict[str, Any], None]: Default settings or 'None' if bundle
+            is missing, outdated or invalid.
+    """
+    if not os.path.exists(bundle_path):
+        return None
+
+    try:
+        with open(bundle_path, "rb") as stream:
+            bundle = pickle.loads(stream.read())
+
+        if (
+            bundle.get("version") != _DEFAULTS_BUNDLE_VERSION
+            or bundle.get("fingerprint") != fingerprint
+        ):
+            return None
+
+        data = bundle["data"]
+        if hashlib.sha1(data).hexdigest() != bundle["hash"]:
+            log.warning(
+                "Bundle of default settings is corrupted \"{}\"".format(
+                    bundle_path
+                )
+            )
+            return None
+        return pickle.loads(data)
+
+    except Exception:
+        log.warning(
+            "Failed to load bundle of default settings \"{}\"".format(
+                bundle_path
+            ),
+            exc_info=True
+        )
+    return None
+
+
+def _save_defaults_bundle(bundle_path, fingerprint, defaults):
+    """Save default settings to bundle.
+
+    Failed save is not an issue as defaults can be loaded from json files.
+
+    Args:
+        bundle_path (str): Path to bundle.
+        fingerprint (str): Fingerprint of source files.
+        defaults (dict[str, Any]): Loaded default settings.
+
+    Returns:
+        bool: Bundle was saved.
+    """
+    # Protocol 2 can be loaded in both Python 2 and 3
+    data = pickle.dumps(defaults, 2)
+    bundle = {
+        "version": _DEFAULTS_BUNDLE_VERSION,
+        "fingerprint": fingerprint,
+        "hash": hashlib.sha1(data).hexdigest(),
+        "data": data,
+    }
+    tmp_path = "{}.{}.tmp".format(bundle_path, os.getpid())
+    try:
+        bundle_dir = os.path.dirname(bundle_path)
+        if not os.path.exists(bundle_dir):
+            os.makedirs(bundle_dir)
+
+        with open(tmp_path, "wb") as stream:
+            stream.write(pickle.dumps(bundle, 2))
+
+        if hasattr(os, "replace"):
+            os.replace(tmp_path, bundle_path)
+        else:
+            if os.path.exists(bundle_path):
+                os.remove(bundle_path)
+            os.rename(tmp_path, bundle_path)
+        return True
+
+    except (IOError, OSError):
+        log.debug(
+            "Couldn't save bundle of default settings \"{}\"".format(
+                bundle_path
+            ),
+            exc_info=True
+        )
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except (IOError, OSError):
+                pass
+    return False
 
 
 def reset_default_settings():
@@ -892,6 +1167,16 @@ def apply_local_settings_on_project_settings(
 
 def get_system_settings(clear_metadata=True, exclude_locals=None):
     """System settings with applied studio overrides."""
+    return _get_resolved_settings(
+        SYSTEM_SETTINGS_KEY,
+        None,
+        clear_metadata,
+        exclude_locals,
+        lambda: _get_system_settings(clear_metadata, exclude_locals)
+    )
+
+
+def _get_system_settings(clear_metadata, exclude_locals):
     default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
     studio_values = get_studio_system_settings_overrides()
     result = apply_overrides(default_values, studio_values)
@@ -1002,6 +1287,18 @@ def get_project_settings(
             " Call `get_default_project_settings` to get project defaults."
         )
 
+    return _get_resolved_settings(
+        PROJECT_SETTINGS_KEY,
+        project_name,
+        clear_metadata,
+        exclude_locals,
+        lambda: _get_project_settings(
+            project_name, clear_metadata, exclude_locals
+        )
+    )
+
+
+def _get_project_settings(project_name, clear_metadata, exclude_locals):
     studio_overrides = get_default_project_settings(False)
     project_overrides = get_project_settings_overrides(
         project_name
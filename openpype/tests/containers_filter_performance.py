@@ -0,0 +1,132 @@
+"""Benchmark of filtering of scene containers.
+
+Filters synthetic containers referencing representations of many subsets
+with queries replaced by in-memory data, so only processing time and count
+of queries are measured. Benchmark does not require database connection.
+
+Run:
+    python -m openpype.tests.containers_filter_performance
+"""
+import time
+
+from bson.objectid import ObjectId
+
+from openpype.pipeline.load import utils
+
+
+class SyntheticProject(object):
+    """In-memory replacement of queries used by 'filter_containers'.
+
+    Args:
+        subsets_count (int): Count of subsets.
+        versions_count (int): Count of versions of each subset.
+    """
+
+    def __init__(self, subsets_count, versions_count):
+        self.queries = 0
+        self.repre_docs = {}
+        self.version_docs = {}
+        self.last_versions = {}
+        for _ in range(subsets_count):
+            subset_id = ObjectId()
+            for _ in range(versions_count):
+                version_id = ObjectId()
+                self.version_docs[version_id] = {
+                    "_id": version_id,
+                    "parent": subset_id,
+                    "type": "version",
+                }
+                repre_id = ObjectId()
+                self.repre_docs[repre_id] = {
+                    "_id": repre_id,
+                    "parent": version_id,
+                }
+            self.last_versions[subset_id] = {"_id": version_id}
+
+    def get_representations(self, project_name, representation_ids, fields):
+        self.queries += 1
+        for repre_id in representation_ids:
+            repre_doc = self.repre_docs.get(ObjectId(repre_id))
+            if repre_doc is not None:
+                yield repre_doc
+
+    def get_versions(self, project_name, version_ids, hero, fields):
+        self.queries += 1
+        for version_id in version_ids:
+            version_doc = self.version_docs.get(version_id)
+            if version_doc is not None:
+                yield version_doc
+
+    def get_last_versions(self, project_name, subset_ids, fields):
+        self.queries += 1
+        return {
+            subset_id: self.last_versions[subset_id]
+            for subset_id in subset_ids
+        }
+
+    def get_newest_version_id(self, project_name, subset_ids):
+        self.queries += 1
+        subset_ids = set(subset_ids)
+        return max(
+            (
+                version_id
+                for version_id, version_doc in self.version_docs.items()
+                if version_doc["parent"] in subset_ids
+            ),
+            default=None
+        )
+
+    def add_version(self, subset_id):
+        """Publish new version of subset like other process would."""
+        version_id = ObjectId()
+        self.version_docs[version_id] = {
+            "_id": version_id,
+            "parent": subset_id,
+            "type": "version",
+        }
+        self.last_versions[subset_id] = {"_id": version_id}
+        return version_id
+
+    def create_containers(self, count):
+        repre_ids = list(self.repre_docs.keys())
+        return [
+            {
+                "objectName": "container_{}".format(idx),
+                "representation": str(repre_ids[idx % len(repre_ids)]),
+            }
+            for idx in range(count)
+        ]
+
+    def install(self):
+        utils.get_representations = self.get_representations
+        utils.get_versions = self.get_versions
+        utils.get_last_versions = self.get_last_versions
+        utils.get_newest_version_id = self.get_newest_version_id
+
+
+def benchmark(containers_count=10000, subsets_count=1000, versions_count=3):
+    """Print duration and query count of containers filtering.
+
+    Args:
+        containers_count (int): Count of synthetic containers.
+        subsets_count (int): Count of subsets referenced by containers.
+        versions_count (int): Count of versions of each subset.
+    """
+
+    project = SyntheticProject(subsets_count, versions_count)
+    project.install()
+    containers = project.create_containers(containers_count)
+
+    utils.clear_containers_filter_cache()
+    for label in ("Filter containers", "Filter containers (cached)"):
+        project.queries = 0
+        start = time.time()
+        result = utils.filter_containers(containers, "benchmark")
+        duration = time.time() - start
+        print("{:<30} {:>8.3f}s {:>3} queries ({} outdated)".format(
+            label, duration, project.queries, len(result.outdated)
+        ))
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,132 @@
+"""Benchmark of communication with Harmony.
+
+Loopback client mimicking the Harmony side of the protocol is connected to
+'Server' and replies to every request, so only the latency of the
+communication is measured. Benchmark does not require Harmony.
+
+Run:
+    python -m openpype.tests.harmony_server_performance
+"""
+import json
+import socket
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from openpype.hosts.harmony.api.server import Server
+
+
+class FakeHarmonyClient(threading.Thread):
+    """Loopback client replying to requests of 'Server' like Harmony does.
+
+    Outgoing messages are prefixed with 'AH' and content length as 8
+    characters long hex string, incoming messages have the length packed
+    to 4 bytes.
+
+    Args:
+        port (int): Port of running server.
+        chunk_size (int): Send messages in chunks of this size to simulate
+            fragmented messages. Whole message is sent at once if 0.
+    """
+
+    def __init__(self, port, chunk_size=0):
+        super(FakeHarmonyClient, self).__init__()
+        self.daemon = True
+        self.chunk_size = chunk_size
+        self.socket = socket.create_connection(("127.0.0.1", port))
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.received = []
+
+    def _recv_exactly(self, size):
+        data = b""
+        while len(data) < size:
+            try:
+                chunk = self.socket.recv(size - len(data))
+            except OSError:
+                return None
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def send(self, message):
+        encoded = json.dumps(message).encode("utf-8")
+        data = b"AH" + "{:08x}".format(len(encoded)).encode() + encoded
+        if not self.chunk_size:
+            self.socket.sendall(data)
+            return
+
+        for idx in range(0, len(data), self.chunk_size):
+            self.socket.sendall(data[idx:idx + self.chunk_size])
+
+    def run(self):
+        while True:
+            header = self._recv_exactly(6)
+            if header is None:
+                break
+            length = struct.unpack(">I", header[2:])[0]
+            data = self._recv_exactly(length)
+            if data is None:
+                break
+            request = json.loads(data.decode("utf-8"))
+            self.received.append(request)
+            if request.get("reply"):
+                continue
+            request["reply"] = True
+            request["result"] = request.get("args")
+            self.send(request)
+
+    def close(self):
+        self.socket.close()
+
+
+def _get_free_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def benchmark(requests_count=1000, workers=8, chunk_size=0):
+    """Print duration of sequential and concurrent requests.
+
+    Args:
+        requests_count (int): Count of requests sent to fake Harmony.
+        workers (int): Count of threads sending concurrent requests.
+        chunk_size (int): Fragment replies to chunks of this size.
+    """
+
+    server = Server(_get_free_port())
+    server.start()
+    client = FakeHarmonyClient(server.port, chunk_size)
+    client.start()
+
+    def _send(idx):
+        reply = server.send(
+            {"function": "AvalonHarmony.benchmark", "args": [idx]})
+        assert reply["result"] == [idx]
+
+    start = time.time()
+    for idx in range(requests_count):
+        _send(idx)
+    duration = time.time() - start
+    print("{:<30} {:>8.3f}s {:>8.3f}ms per request".format(
+        "Sequential requests", duration, duration * 1000 / requests_count
+    ))
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_send, range(requests_count)))
+    duration = time.time() - start
+    print("{:<30} {:>8.3f}s {:>8.3f}ms per request".format(
+        "Concurrent requests", duration, duration * 1000 / requests_count
+    ))
+
+    server.stop()
+    client.close()
+
+
+if __name__ == "__main__":
+    benchmark()
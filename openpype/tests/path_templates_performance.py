@@ -0,0 +1,99 @@
+"""Micro-benchmark of path templates formatting.
+
+Measures how many templates can be formatted per second. Benchmark does not
+require database connection or any other OpenPype service.
+
+Run:
+    python -m openpype.tests.path_templates_performance
+"""
+import time
+
+from openpype.lib.path_templates import (
+    StringTemplate,
+    TemplatesDict,
+    clear_compiled_templates_cache,
+)
+
+PUBLISH_TEMPLATE = (
+    "{root[work]}/{project[name]}/{hierarchy}/{asset}/publish/{family}"
+    "/{subset}/v{version:0>3}/{project[code]}_{asset}_{subset}"
+    "_v{version:0>3}<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+)
+
+FILL_DATA = {
+    "root": {"work": "/mnt/projects"},
+    "project": {"name": "Test", "code": "tst"},
+    "hierarchy": "shots/sq01",
+    "asset": "sh010",
+    "family": "render",
+    "subset": "renderMain",
+    "version": 12,
+    "frame": 1001,
+    "ext": "exr",
+}
+
+
+def _run(label, func, iterations):
+    start = time.time()
+    for _ in range(iterations):
+        func()
+    duration = time.time() - start
+    print("{:<40} {:>12.0f} formats/sec".format(
+        label, iterations / max(duration, 0.000001)
+    ))
+
+
+def benchmark(iterations=20000):
+    """Print formats per second for common template usages.
+
+    Args:
+        iterations (int): Number of formats in each benchmark.
+    """
+
+    template = StringTemplate(PUBLISH_TEMPLATE)
+    missing_data = dict(FILL_DATA)
+    missing_data.pop("asset")
+
+    _run(
+        "Format (all keys)",
+        lambda: template.format(FILL_DATA),
+        iterations
+    )
+    _run(
+        "Format (missing key)",
+        lambda: template.format(missing_data),
+        iterations
+    )
+
+    def _format_template():
+        StringTemplate.format_template(PUBLISH_TEMPLATE, FILL_DATA)
+
+    _run("Create and format", _format_template, iterations)
+
+    def _format_uncached():
+        clear_compiled_templates_cache()
+        StringTemplate.format_template(PUBLISH_TEMPLATE, FILL_DATA)
+
+    _run("Create and format (no cache)", _format_uncached, iterations)
+
+    frames = list(range(1001, 1001 + iterations))
+    start = time.time()
+    template.format_batch(FILL_DATA, {"frame": frames})
+    duration = time.time() - start
+    print("{:<40} {:>12.0f} formats/sec".format(
+        "Format batch (frames)", iterations / max(duration, 0.000001)
+    ))
+
+    templates = TemplatesDict({
+        "publish": {"path": PUBLISH_TEMPLATE},
+        "work": {"file": "{project[code]}_{asset}_v{version:0>3}.{ext}"},
+    })
+    _run(
+        "TemplatesDict format",
+        lambda: templates.format(FILL_DATA),
+        iterations
+    )
+
+
+if __name__ == "__main__":
+    benchmark()
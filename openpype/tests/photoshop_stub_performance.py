@@ -0,0 +1,194 @@
+"""Benchmark of calls from Photoshop server stub to the extension.
+
+In-process fake of Photoshop extension replaces websocket server and
+connected client. Each call to the fake extension waits for simulated round
+trip latency, so duration of one by one and batched calls is compared.
+Benchmark does not require Photoshop.
+
+Run:
+    python -m openpype.tests.photoshop_stub_performance
+"""
+import asyncio
+import json
+import threading
+import time
+
+from openpype.hosts.photoshop.api import ws_stub
+
+
+class FakeExtensionServer(object):
+    """Replacement of 'WebServerTool' running event loop in a thread."""
+
+    _instance = None
+
+    def __init__(self):
+        FakeExtensionServer._instance = self
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    @staticmethod
+    def get_instance():
+        return FakeExtensionServer._instance
+
+    def call(self, func):
+        future = asyncio.run_coroutine_threadsafe(func, self.loop)
+        return future.result()
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
+class FakePhotoshopClient(object):
+    """Connected client answering like Photoshop extension.
+
+    Args:
+        layers_count (int): Count of layers in fake document.
+        latency (float): Simulated round trip of single message in seconds.
+    """
+
+    def __init__(self, layers_count, latency=0.005):
+        self.latency = latency
+        self.messages_count = 0
+        self.headline = "[]"
+        self.layers = {
+            idx: {
+                "id": idx,
+                "name": "layer_{}".format(idx),
+                "group": False,
+                "parents": [],
+                "visible": True,
+                "type": "layer",
+            }
+            for idx in range(1, layers_count + 1)
+        }
+
+    async def call(self, method, **params):
+        await asyncio.sleep(self.latency)
+        self.messages_count += 1
+        if method != "Photoshop.batch":
+            return self.process(method, params)
+
+        results = []
+        for call in params["calls"]:
+            try:
+                result = {
+                    "result": self.process(call["method"], call["params"])
+                }
+            except Exception as exc:
+                result = {"error": str(exc)}
+            results.append(result)
+        return results
+
+    def process(self, method, params):
+        if method == "Photoshop.get_layers":
+            return json.dumps(list(self.layers.values()))
+
+        if method == "Photoshop.set_visible":
+            self.layers[params["layer_id"]]["visible"] = params["visibility"]
+
+        elif method == "Photoshop.rename_layer":
+            self.layers[params["layer_id"]]["name"] = params["name"]
+
+        elif method == "Photoshop.read":
+            return self.headline
+
+        elif method == "Photoshop.imprint":
+            self.headline = params["payload"]
+
+        elif method == "Photoshop.get_active_document_full_name":
+            return "/benchmark/benchmark.psd"
+
+        elif method == "Photoshop.is_saved":
+            # evalScript returns boolean as string
+            return "false"
+
+        else:
+            raise ValueError("Route not found: {}".format(method))
+
+
+class FakeWebSocketAsync(object):
+    clients = {}
+
+    @classmethod
+    def get_clients(cls):
+        return cls.clients
+
+
+def install(client):
+    """Use fake extension client by 'PhotoshopServerStub'."""
+    FakeExtensionServer()
+    FakeWebSocketAsync.clients = {"benchmark": client}
+    ws_stub.WebServerTool = FakeExtensionServer
+    ws_stub.WebSocketAsync = FakeWebSocketAsync
+
+
+def benchmark(layers_count=200, latency=0.005):
+    """Print duration and messages count of one by one and batched calls.
+
+    Args:
+        layers_count (int): Count of layers in fake document.
+        latency (float): Simulated round trip of single message in seconds.
+    """
+
+    client = FakePhotoshopClient(layers_count, latency)
+    install(client)
+    stub = ws_stub.PhotoshopServerStub()
+
+    def _process(visible):
+        for layer in stub.get_layers():
+            stub.set_visible(layer.id, visible)
+            stub.rename_layer(layer.id, "{}_renamed".format(layer.name))
+
+    for label, use_batch in (
+        ("One by one calls", False),
+        ("Batched calls", True),
+    ):
+        client.messages_count = 0
+        start = time.time()
+        if use_batch:
+            with stub.batch():
+                _process(use_batch)
+        else:
+            _process(use_batch)
+        duration = time.time() - start
+        print("{:<30} {:>8.3f}s {:>5} messages".format(
+            label, duration, client.messages_count
+        ))
+
+    def _imprint(layers):
+        for layer in layers:
+            stub.imprint(layer.id, {
+                "id": "pyblish.avalon.instance",
+                "members": [str(layer.id)],
+                "subset": "image{}".format(layer.id),
+            }, all_layers=layers)
+        for layer in layers:
+            stub.read(layer)
+
+    layers = stub.get_layers()
+    for label, use_batch in (
+        ("One by one imprint", False),
+        ("Batched imprint", True),
+    ):
+        client.headline = "[]"
+        stub.clear_metadata_cache()
+        client.messages_count = 0
+        start = time.time()
+        if use_batch:
+            with stub.batch():
+                _imprint(layers)
+        else:
+            _imprint(layers)
+        duration = time.time() - start
+        print("{:<30} {:>8.3f}s {:>5} messages".format(
+            label, duration, client.messages_count
+        ))
+
+    FakeExtensionServer.get_instance().stop()
+
+
+if __name__ == "__main__":
+    benchmark()
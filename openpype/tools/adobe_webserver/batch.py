@@ -0,0 +1,148 @@
+"""Batching of calls from server stubs to Adobe extensions.
+
+Every call of a stub method is one websocket round trip to the host
+extension. Calls collected by 'StubBatch' are sent in single message to
+'<Host>.batch' route of the extension, which executes them in order and
+returns all results together.
+"""
+import logging
+
+log = logging.getLogger(__name__)
+
+
+class BatchCallError(ValueError):
+    """Raised when any of batched calls failed in host extension."""
+
+    def __init__(self, failed_calls):
+        self.failed_calls = failed_calls
+        super(BatchCallError, self).__init__(
+            "Batched calls failed:\n{}".format("\n".join(
+                "{}: {}".format(call.method, call.error)
+                for call in failed_calls
+            ))
+        )
+
+
+class BatchCall(object):
+    """Single call collected in batch.
+
+    Args:
+        method (str): Name of route in host extension.
+        params (dict): Parameters of the call.
+    """
+
+    def __init__(self, method, params):
+        self.method = method
+        self.params = params
+        self.result = None
+        self.error = None
+        self.done = False
+
+    def to_data(self):
+        return {"method": self.method, "params": self.params}
+
+    def set_result(self, result):
+        self.result = result
+        self.done = True
+
+    def set_error(self, error):
+        self.error = error
+        self.done = True
+
+
+class StubBatch(object):
+    """Calls collected to be sent to host extension together.
+
+    Args:
+        websocketserver (WebServerTool): Server running event loop.
+        client (WebSocketAsync): Connected client of host extension.
+        route (str): Name of batch route in host extension
+            (e.g. 'Photoshop.batch').
+        result_handler (Callable[[Any], Any]): Optional processing of raw
+            results, may raise an error for a failed call.
+    """
+
+    # Remember if host extension does not have batch route
+    _unsupported_routes = set()
+
+    def __init__(self, websocketserver, client, route, result_handler=None):
+        self.websocketserver = websocketserver
+        self.client = client
+        self.route = route
+        self.result_handler = result_handler
+        self.calls = []
+        self._pending = []
+
+    @property
+    def results(self):
+        """Results of already sent calls in order of the calls."""
+        return [call.result for call in self.calls if call.done]
+
+    def add(self, method, **params):
+        """Add call to batch.
+
+        Returns:
+            BatchCall: Object holding result after batch is flushed.
+        """
+        call = BatchCall(method, params)
+        self.calls.append(call)
+        self._pending.append(call)
+        return call
+
+    def flush(self):
+        """Send pending calls to host extension.
+
+        Raises:
+            BatchCallError: When any of calls failed.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        if len(pending) == 1 or self.route in self._unsupported_routes:
+            self._call_sequentially(pending)
+        else:
+            try:
+                raw_results = self.websocketserver.call(self.client.call(
+                    self.route, calls=[call.to_data() for call in pending]
+                ))
+            except Exception as exc:
+                if "Route not found" not in str(exc):
+                    raise
+                log.warning((
+                    "Host extension does not support '{}'."
+                    " Update the extension, calls are sent one by one."
+                ).format(self.route))
+                self._unsupported_routes.add(self.route)
+                self._call_sequentially(pending)
+            else:
+                for call, raw_result in zip(pending, raw_results):
+                    if raw_result.get("error") is not None:
+                        call.set_error(raw_result["error"])
+                    else:
+                        self._set_result(call, raw_result.get("result"))
+
+        failed_calls = [call for call in pending if call.error is not None]
+        if failed_calls:
+            raise BatchCallError(failed_calls)
+
+    def _call_sequentially(self, calls):
+        for call in calls:
+            try:
+                raw_result = self.websocketserver.call(
+                    self.client.call(call.method, **call.params)
+                )
+            except Exception as exc:
+                call.set_error(str(exc))
+            else:
+                self._set_result(call, raw_result)
+
+    def _set_result(self, call, raw_result):
+        if self.result_handler is None:
+            call.set_result(raw_result)
+            return
+
+        try:
+            call.set_result(self.result_handler(raw_result))
+        except Exception as exc:
+            call.set_error(str(exc))
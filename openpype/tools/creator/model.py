@@ -21,7 +21,7 @@ class CreatorsModel(QtGui.QStandardItemModel):
         self._creators_by_id = {}
 
         items = []
-        creators = discover_legacy_creator_plugins()
+        creators = discover_legacy_creator_plugins(lazy=True)
         for creator in creators:
             if not creator.enabled:
                 continue
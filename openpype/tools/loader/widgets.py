@@ -450,7 +450,7 @@ class SubsetWidget(QtWidgets.QWidget):
         # Get all representation->loader combinations available for the
         # index under the cursor, so we can list the user the options.
         project_name = self.dbcon.active_project()
-        available_loaders = discover_loader_plugins(project_name)
+        available_loaders = discover_loader_plugins(project_name, lazy=True)
         if self.tool_name:
             available_loaders = lib.remove_tool_name_from_loaders(
                 available_loaders, self.tool_name
@@ -1363,7 +1363,7 @@ class RepresentationWidget(QtWidgets.QWidget):
         # Get all representation->loader combinations available for the
         # index under the cursor, so we can list the user the options.
         project_name = self.dbcon.active_project()
-        available_loaders = discover_loader_plugins(project_name)
+        available_loaders = discover_loader_plugins(project_name, lazy=True)
 
         filtered_loaders = []
         for loader in available_loaders:
@@ -367,7 +367,7 @@ class SwitchAssetDialog(QtWidgets.QDialog):
             return list()
 
         available_loaders = []
-        for loader_plugin in discover_loader_plugins():
+        for loader_plugin in discover_loader_plugins(lazy=True):
             # Skip loaders without switch method
             if not hasattr(loader_plugin, "switch"):
                 continue
@@ -13,7 +13,7 @@ from openpype.style import (
     get_default_entity_icon_color,
     get_disabled_entity_icon_color,
 )
-from openpype.pipeline import get_representation_path
+from openpype.pipeline.load import get_representations_paths
 
 log = logging.getLogger(__name__)
 
@@ -354,10 +354,11 @@ class PublishFilesModel(QtGui.QStandardItemModel):
                 filtered_repre_docs.append(repre_doc)
 
         # Collect paths of representations
+        paths_by_repre_id = get_representations_paths(
+            filtered_repre_docs, root=self._anatomy.roots
+        )
         for repre_doc in filtered_repre_docs:
-            path = get_representation_path(
-                repre_doc, root=self._anatomy.roots
-            )
+            path = paths_by_repre_id[repre_doc["_id"]]
             output.append((path, repre_doc["_id"]))
         return output
 
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Test suite for entity cache of client query functions."""
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client import entities
+from openpype.client.entity_cache import (
+    entity_cache,
+    get_entity_cache,
+    invalidate_entity_cache,
+    project_document_fields,
+)
+
+PROJECT_NAME = "test_project"
+
+
+class FakeCollection(object):
+    """Collection supporting only simple queries used by the tests."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = 0
+
+    def _match(self, doc, query_filter):
+        for key, value in query_filter.items():
+            doc_value = doc.get(key)
+            if isinstance(value, dict):
+                if doc_value not in value["$in"]:
+                    return False
+            elif doc_value != value:
+                return False
+        return True
+
+    def find(self, query_filter, projection=None):
+        self.queries += 1
+        return [
+            dict(doc)
+            for doc in self.docs
+            if self._match(doc, query_filter)
+        ]
+
+    def find_one(self, query_filter, projection=None):
+        docs = self.find(query_filter, projection)
+        if docs:
+            return docs[0]
+        return None
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    asset_id = ObjectId()
+    docs = [
+        {"_id": ObjectId(), "type": "project", "name": PROJECT_NAME},
+        {
+            "_id": asset_id,
+            "type": "asset",
+            "name": "sh010",
+            "data": {"frameStart": 1001, "frameEnd": 1010}
+        },
+        {
+            "_id": ObjectId(),
+            "type": "subset",
+            "name": "renderMain",
+            "parent": asset_id,
+            "data": {}
+        },
+    ]
+    fake_collection = FakeCollection(docs)
+    monkeypatch.setattr(
+        entities,
+        "get_project_connection",
+        lambda project_name: fake_collection
+    )
+    return fake_collection
+
+
+def test_project_document_fields():
+    doc = {
+        "_id": 1,
+        "name": "sh010",
+        "data": {"frameStart": 1001, "frameEnd": 1010, "fps": 25}
+    }
+    assert project_document_fields(doc, ["data.fps"]) == {
+        "_id": 1, "data": {"fps": 25}
+    }
+    assert project_document_fields(doc, ["data", "data.fps"]) == {
+        "_id": 1, "data": doc["data"]
+    }
+    output = project_document_fields(doc, None)
+    output["data"]["fps"] = 30
+    assert doc["data"]["fps"] == 25
+
+
+def test_cache_queries_once(collection):
+    with entity_cache(PROJECT_NAME):
+        asset_doc = entities.get_asset_by_name(PROJECT_NAME, "sh010")
+        for _ in range(5):
+            doc = entities.get_asset_by_name(
+                PROJECT_NAME, "sh010", fields=["data.frameStart"]
+            )
+            assert doc == {
+                "_id": asset_doc["_id"], "data": {"frameStart": 1001}
+            }
+            assert entities.get_asset_by_id(
+                PROJECT_NAME, asset_doc["_id"]) == asset_doc
+            subset_doc = entities.get_subset_by_name(
+                PROJECT_NAME, "renderMain", asset_doc["_id"]
+            )
+            assert entities.get_project(PROJECT_NAME)["name"] == PROJECT_NAME
+
+        assert list(entities.get_subsets(
+            PROJECT_NAME, subset_ids=[subset_doc["_id"]]
+        )) == [subset_doc]
+        # asset, subset and project were queried
+        assert collection.queries == 3
+
+    assert get_entity_cache(PROJECT_NAME) is None
+    entities.get_asset_by_name(PROJECT_NAME, "sh010")
+    assert collection.queries == 4
+
+
+def test_cache_invalidation(collection):
+    with entity_cache(PROJECT_NAME):
+        asset_doc = entities.get_asset_by_name(PROJECT_NAME, "sh010")
+        collection.docs[1]["data"] = {"frameStart": 1}
+
+        invalidate_entity_cache(PROJECT_NAME, [asset_doc["_id"]])
+        asset_doc = entities.get_asset_by_name(PROJECT_NAME, "sh010")
+        assert asset_doc["data"]["frameStart"] == 1
+        assert collection.queries == 2
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Test suite for operations session commit."""
+import pytest
+
+from openpype.client import operations
+from openpype.client.operations import (
+    REPRESENTATION_LAST_MODIFIED_KEY,
+    OperationsSession,
+    new_subset_document,
+    new_version_doc,
+    new_representation_doc,
+)
+
+PROJECT_NAME = "test_project"
+
+
+class FakeCollection(object):
+    def __init__(self):
+        self.bulk_writes = []
+
+    def bulk_write(self, requests, ordered=True):
+        self.bulk_writes.append((list(requests), ordered))
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    fake_collection = FakeCollection()
+    monkeypatch.setattr(
+        operations,
+        "get_project_connection",
+        lambda project_name: fake_collection
+    )
+    return fake_collection
+
+
+def _create_subsets(session, count):
+    subset_docs = []
+    for idx in range(count):
+        subset_doc = new_subset_document(
+            "subset{}".format(idx), "render", "asset_id")
+        session.create_entity(PROJECT_NAME, "subset", subset_doc)
+        subset_docs.append(subset_doc)
+    return subset_docs
+
+
+def test_commit_batches(collection):
+    session = OperationsSession(batch_size=4, ordered=False)
+    _create_subsets(session, 10)
+    results = session.commit()
+
+    assert [len(requests) for requests, _ in collection.bulk_writes] == [
+        4, 4, 2
+    ]
+    assert all(not ordered for _, ordered in collection.bulk_writes)
+    assert len(results) == 10
+    assert [result.batch_index for result in results[-3:]] == [1, 2, 2]
+
+
+def test_commit_unordered_fallback(collection):
+    session = OperationsSession(ordered=False)
+    subset_doc = _create_subsets(session, 1)[0]
+    session.create_entity(
+        PROJECT_NAME, "version", new_version_doc(1, subset_doc["_id"]))
+    session.update_entity(
+        PROJECT_NAME, "subset", subset_doc["_id"], {"data.active": False})
+    session.commit()
+
+    requests, ordered = collection.bulk_writes[0]
+    assert len(requests) == 3
+    assert ordered
+
+
+def test_commit_unordered_with_parent(collection):
+    # Version would be orphaned if creation of its subset failed
+    session = OperationsSession(ordered=False)
+    subset_doc = _create_subsets(session, 1)[0]
+    session.create_entity(
+        PROJECT_NAME, "version", new_version_doc(1, subset_doc["_id"]))
+    session.commit()
+
+    requests, ordered = collection.bulk_writes[0]
+    assert len(requests) == 2
+    assert ordered
+
+
+def test_representation_last_modified(collection):
+    session = OperationsSession()
+    subset_doc = _create_subsets(session, 1)[0]
+    repre_doc = new_representation_doc("ma", "version_id", {})
+    session.create_entity(PROJECT_NAME, "representation", repre_doc)
+    session.update_entity(
+        PROJECT_NAME, "representation", repre_doc["_id"], {"files": []})
+    session.update_entity(
+        PROJECT_NAME, "subset", subset_doc["_id"], {"data.active": False})
+    session.commit()
+
+    requests, _ = collection.bulk_writes[0]
+    subset_insert, repre_insert, repre_update, subset_update = requests
+    assert REPRESENTATION_LAST_MODIFIED_KEY in repre_insert._doc
+    assert REPRESENTATION_LAST_MODIFIED_KEY not in repre_doc
+    assert REPRESENTATION_LAST_MODIFIED_KEY in repre_update._doc["$set"]
+    assert REPRESENTATION_LAST_MODIFIED_KEY not in subset_insert._doc
+    assert subset_update._doc == {"$set": {"data.active": False}}
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cached Headline metadata of Photoshop server stub."""
+import json
+
+import pytest
+
+pytest.importorskip("wsrpc_aiohttp")
+pytest.importorskip("qtpy")
+
+from openpype.hosts.photoshop.api import ws_stub  # noqa: E402
+
+
+class FakeServer(object):
+    def call(self, func):
+        return func
+
+
+class FakeClient(object):
+    """Answers like Photoshop extension, booleans are strings."""
+
+    def __init__(self):
+        self.messages = []
+        self.closed = False
+        self.full_name = "C:\\projects\\a\\work.psd"
+        self.saved = "true"
+        self.headline = "[]"
+        self.layers = [
+            {"id": layer_id, "name": "layer_{}".format(layer_id)}
+            for layer_id in (1, 2)
+        ]
+
+    def call(self, method, **params):
+        self.messages.append(method)
+        if self.closed:
+            raise RuntimeError("Photoshop is closed")
+        if method != "Photoshop.batch":
+            return self._process(method, params)
+
+        return [
+            {"result": self._process(call["method"], call["params"])}
+            for call in params["calls"]
+        ]
+
+    def _process(self, method, params):
+        if method == "Photoshop.get_active_document_full_name":
+            return self.full_name
+        if method == "Photoshop.is_saved":
+            return self.saved
+        if method == "Photoshop.read":
+            return self.headline
+        if method == "Photoshop.imprint":
+            self.headline = params["payload"]
+            self.saved = "false"
+        elif method == "Photoshop.save":
+            self.saved = "true"
+        elif method == "Photoshop.get_layers":
+            return json.dumps(self.layers)
+        return None
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake_client = FakeClient()
+    monkeypatch.setattr(
+        ws_stub.WebServerTool, "get_instance", lambda: FakeServer())
+    monkeypatch.setattr(
+        ws_stub.PhotoshopServerStub,
+        "get_client",
+        staticmethod(lambda: fake_client)
+    )
+    # Validate cache on each access
+    monkeypatch.setattr(
+        ws_stub.PhotoshopServerStub, "metadata_validation_interval", -1)
+    ws_stub.PhotoshopServerStub.clear_metadata_cache()
+    yield fake_client
+    ws_stub.PhotoshopServerStub.clear_metadata_cache()
+
+
+def _imprint(stub):
+    stub.imprint(1, {"id": "pyblish.avalon.instance", "members": ["1"]})
+
+
+def test_unchanged_document_is_not_read_again(client):
+    stub = ws_stub.PhotoshopServerStub()
+    _imprint(stub)
+    for _ in range(3):
+        assert len(stub.get_layers_metadata()) == 1
+    assert client.messages.count("Photoshop.read") == 1
+
+    # Save of stub keeps the cache
+    stub.save()
+    assert len(stub.get_layers_metadata()) == 1
+    assert client.messages.count("Photoshop.read") == 1
+
+
+def test_revert_invalidates_cache(client):
+    stub = ws_stub.PhotoshopServerStub()
+    _imprint(stub)
+    assert len(stub.get_layers_metadata()) == 1
+
+    # File > Revert in Photoshop
+    client.headline = "[]"
+    client.saved = "true"
+    assert stub.get_layers_metadata() == []
+
+
+def test_document_with_same_name_invalidates_cache(client):
+    stub = ws_stub.PhotoshopServerStub()
+    _imprint(stub)
+    stub.save()
+
+    client.full_name = "C:\\projects\\b\\work.psd"
+    client.headline = "[]"
+    assert stub.get_layers_metadata() == []
+
+
+def test_batch_keeps_error_of_block(client):
+    stub = ws_stub.PhotoshopServerStub()
+    with pytest.raises(KeyError):
+        with stub.batch():
+            stub.set_visible(1, False)
+            client.closed = True
+            raise KeyError("Failed in block")
+
+    client.closed = False
+    client.messages[:] = []
+    with stub.batch():
+        stub.set_visible(1, True)
+    assert client.messages == ["Photoshop.set_visible"]
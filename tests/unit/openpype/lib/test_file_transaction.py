@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file transaction."""
+import os
+
+import pytest
+
+from openpype.lib import file_transaction
+from openpype.lib.file_transaction import (
+    FileTransaction,
+    FileVerificationError,
+)
+
+
+def _create_sources(directory, count):
+    src_dir = directory / "src"
+    src_dir.mkdir()
+    paths = []
+    for idx in range(count):
+        path = src_dir / "file.{:04d}.exr".format(idx)
+        path.write_bytes(os.urandom(128 + idx))
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_process_transfers_files(tmp_path, max_workers):
+    sources = _create_sources(tmp_path, 20)
+    dst_dir = tmp_path / "dst"
+
+    transaction = FileTransaction(max_workers=max_workers, verify="hash")
+    for src in sources:
+        transaction.add(src, str(dst_dir / os.path.basename(src)))
+    transaction.process()
+
+    assert len(transaction.transferred) == len(sources)
+    transferred_stats = transaction.transferred_stats
+    for src in sources:
+        dst = dst_dir / os.path.basename(src)
+        with open(src, "rb") as stream:
+            assert dst.read_bytes() == stream.read()
+        assert transferred_stats[str(dst)] == os.stat(str(dst))
+
+
+def test_process_without_concurrent_futures(tmp_path, monkeypatch):
+    # Python 2 hosts don't have 'concurrent.futures'
+    monkeypatch.setattr(file_transaction, "ThreadPoolExecutor", None)
+    sources = _create_sources(tmp_path, 5)
+    dst_dir = tmp_path / "dst"
+
+    transaction = FileTransaction(max_workers=4)
+    for src in sources:
+        transaction.add(src, str(dst_dir / os.path.basename(src)))
+    transaction.process()
+
+    assert len(transaction.transferred) == len(sources)
+
+
+def test_process_rollback_restores_backups(tmp_path):
+    sources = _create_sources(tmp_path, 10)
+    dst_dir = tmp_path / "dst"
+    dst_dir.mkdir()
+    existing = dst_dir / os.path.basename(sources[0])
+    existing.write_bytes(b"original")
+
+    transaction = FileTransaction(max_workers=4)
+    for src in sources:
+        transaction.add(src, str(dst_dir / os.path.basename(src)))
+    # Source which does not exist makes the transaction fail
+    transaction.add(
+        str(tmp_path / "missing.exr"), str(dst_dir / "missing.exr"))
+
+    with pytest.raises(IOError):
+        transaction.process()
+    transaction.rollback()
+
+    assert existing.read_bytes() == b"original"
+    assert sorted(os.listdir(str(dst_dir))) == [existing.name]
+
+
+def test_process_verification_retries(tmp_path, monkeypatch):
+    sources = _create_sources(tmp_path, 1)
+    dst = str(tmp_path / "dst" / "file.exr")
+    calls = []
+
+    def _corrupted_copy(src, dst):
+        calls.append(dst)
+        with open(dst, "wb") as stream:
+            stream.write(b"corrupted")
+
+    monkeypatch.setattr(
+        "openpype.lib.file_transaction.copyfile", _corrupted_copy)
+
+    transaction = FileTransaction(retries=2, verify="size")
+    transaction.add(sources[0], dst)
+    with pytest.raises(FileVerificationError):
+        transaction.process()
+
+    assert len(calls) == 3
+    assert not os.path.exists(dst)
+    assert transaction.transferred == []
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Test suite for queued mongo log handler."""
+import logging
+import threading
+
+from pymongo.errors import CollectionInvalid
+
+from openpype.lib.log import Logger, MongoQueueHandler
+
+
+class FakeCollection(object):
+    def __init__(self):
+        self.batches = []
+        self.blocker = threading.Event()
+        self.blocker.set()
+
+    def insert_many(self, documents, ordered=True):
+        self.blocker.wait()
+        self.batches.append(list(documents))
+
+
+class DictFormatter(logging.Formatter):
+    def format(self, record):
+        return {"message": record.getMessage()}
+
+
+def _create_logger(handler):
+    handler.setFormatter(DictFormatter())
+    logger = logging.getLogger("test_mongo_queue_handler")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_records_are_written_in_batches():
+    collection = FakeCollection()
+    handler = MongoQueueHandler(
+        lambda: collection, batch_size=10, flush_interval=10.0)
+    logger = _create_logger(handler)
+    for idx in range(25):
+        logger.info("Record %d", idx)
+    handler.flush()
+
+    messages = [
+        document["message"]
+        for batch in collection.batches
+        for document in batch
+    ]
+    assert messages == ["Record {}".format(idx) for idx in range(25)]
+    assert max(len(batch) for batch in collection.batches) == 10
+    assert handler.written_count == 25
+    handler.close()
+
+
+def test_full_queue_drops_records():
+    collection = FakeCollection()
+    collection.blocker.clear()
+    handler = MongoQueueHandler(
+        lambda: collection, max_queue_size=5, batch_size=1)
+    logger = _create_logger(handler)
+    for idx in range(20):
+        logger.info("Record %d", idx)
+
+    assert handler.dropped_count > 0
+    collection.blocker.set()
+    handler.close()
+
+    messages = [
+        document["message"]
+        for batch in collection.batches
+        for document in batch
+    ]
+    dropped_messages = [
+        message
+        for message in messages
+        if "log records were dropped" in message
+    ]
+    assert dropped_messages
+    assert sum(
+        int(message.split(" ")[0])
+        for message in dropped_messages
+    ) == handler.dropped_count
+
+
+class FakeDatabase(object):
+    def __init__(self, collection_names=None):
+        self.collections = {
+            name: {}
+            for name in collection_names or []
+        }
+
+    def list_collection_names(self):
+        return list(self.collections)
+
+    def create_collection(self, name, **kwargs):
+        if name in self.collections:
+            raise CollectionInvalid("collection {} exists".format(name))
+        self.collections[name] = kwargs
+
+    def __getitem__(self, name):
+        return self.collections.setdefault(name, {})
+
+
+def test_log_collection_is_created_capped(monkeypatch):
+    database = FakeDatabase()
+    client = {Logger.log_database_name: database}
+    monkeypatch.setattr(
+        Logger, "get_log_mongo_connection", classmethod(lambda cls: client))
+
+    Logger._get_log_collection()
+    assert database.collections[Logger.log_collection_name] == {
+        "capped": True,
+        "max": Logger.log_collection_max_documents,
+        "size": Logger.log_collection_max_size,
+    }
+
+    # Existing collection is used
+    database = FakeDatabase([Logger.log_collection_name])
+    client[Logger.log_database_name] = database
+    Logger._get_log_collection()
+    assert database.collections[Logger.log_collection_name] == {}
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Test suite for path templates formatting."""
+import pytest
+
+from openpype.lib.path_templates import StringTemplate
+
+TEMPLATES = [
+    (
+        "{root[work]}/{project[name]}/{asset}/v{version:0>3}"
+        "/{project[code]}_{asset}_v{version:0>3}<_{output}><.{frame:0>4}>"
+        ".{ext}"
+    ),
+    "{a}<{b}<{c}>>x{a:0>3}",
+    "<>{a}<x>",
+    "<{a}_<{b}>_{c}>",
+    "{a[b][c]}_{a[b][d]}",
+]
+
+FILL_DATA = [
+    {},
+    {"a": 1},
+    {"a": 1, "b": "x"},
+    {"a": 1, "c": 2.5},
+    {"a": 1, "b": None},
+    {"a": {"b": {"c": 1, "d": "z"}}},
+    {
+        "root": {"work": "/mnt/work"},
+        "project": {"name": "Test", "code": "tst"},
+        "asset": "sh010",
+        "version": 3,
+        "ext": "exr",
+        "frame": 1001,
+    },
+]
+
+
+def _format_full(template, data):
+    template = StringTemplate(template)
+    template._format_fast = lambda _data: None
+    return template.format(data)
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+@pytest.mark.parametrize("data", FILL_DATA)
+def test_fast_format_matches_full_format(template, data):
+    result = StringTemplate(template).format(data)
+    expected = _format_full(template, data)
+
+    assert str(result) == str(expected)
+    assert result.solved == expected.solved
+    assert result.used_values == expected.used_values
+    assert result.invalid_types == expected.invalid_types
+    assert sorted(result.missing_keys) == sorted(expected.missing_keys)
+
+
+def test_optional_parts():
+    template = StringTemplate("{asset}<_{output}><.{frame:0>4}>.{ext}")
+    result = template.format({"asset": "sh010", "frame": 1, "ext": "exr"})
+    assert result == "sh010.0001.exr"
+    assert result.solved
+    assert result.used_values == {
+        "asset": "sh010", "frame": "0001", "ext": "exr"
+    }
+
+    result = template.format({"frame": 1, "ext": "exr"})
+    assert not result.solved
+    assert result.missing_keys == ["asset"]
+
+
+def test_compiled_template_is_shared():
+    template_a = StringTemplate("{asset}<_{output}>.{ext}")
+    template_b = StringTemplate("{asset}<_{output}>.{ext}")
+    assert template_a._parts is template_b._parts
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+def test_format_batch_matches_format(template):
+    data = {
+        "a": 1,
+        "root": {"work": "/mnt/work"},
+        "project": {"name": "Test", "code": "tst"},
+        "asset": "sh010",
+        "version": 3,
+        "ext": "exr",
+    }
+    vary = {"frame": [1001, 1002, None, 1004], "b": ["x", None, "y", "z"]}
+    results = StringTemplate(template).format_batch(data, vary)
+
+    assert len(results) == 4
+    for idx, result in enumerate(results):
+        item_data = dict(data)
+        item_data["frame"] = vary["frame"][idx]
+        item_data["b"] = vary["b"][idx]
+        expected = _format_full(template, item_data)
+        assert str(result) == str(expected)
+        assert result.solved == expected.solved
+        assert result.used_values == expected.used_values
+
+
+def test_format_batch_values_length():
+    template = StringTemplate("{a}.{frame}")
+    with pytest.raises(ValueError):
+        template.format_batch({"a": 1}, {"frame": [1, 2], "b": [1]})
+    assert template.format_batch({"a": 1}, {"frame": []}) == []
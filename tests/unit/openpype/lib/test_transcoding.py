@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Test suite for transcoding functions."""
+import os
+import threading
+
+import pytest
+
+from openpype.lib import transcoding
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    executed = []
+    lock = threading.Lock()
+
+    def _run_subprocess(cmd, logger=None):
+        if any("fail" in arg for arg in cmd):
+            raise RuntimeError("oiiotool failed")
+        with lock:
+            executed.append(cmd)
+
+    monkeypatch.setattr(transcoding, "run_subprocess", _run_subprocess)
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tools_path", lambda: "oiiotool")
+    monkeypatch.setattr(
+        transcoding,
+        "get_oiio_info_for_input",
+        lambda filepath, logger=None: {
+            "attribs": {"compression": "dwaa", "note": "\"quoted\""},
+            "channelnames": ["R", "G", "B", "A"],
+            "subimages": 1,
+        }
+    )
+    return executed
+
+
+def _input_paths(count):
+    return [
+        os.path.join("/src", "render.{:04d}.exr".format(frame))
+        for frame in range(1001, 1001 + count)
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4, None])
+def test_convert_input_paths(commands, max_workers):
+    input_paths = _input_paths(10)
+    transcoding.convert_input_paths_for_ffmpeg(
+        input_paths, "/dst", max_workers=max_workers
+    )
+
+    assert len(commands) == len(input_paths)
+    outputs = sorted(cmd[-1] for cmd in commands)
+    assert outputs == [
+        os.path.join("/dst", os.path.basename(path))
+        for path in input_paths
+    ]
+    for cmd in commands:
+        assert cmd[:4] == [
+            "oiiotool", "--nosoftwareattrib", "--compression", "none"]
+        assert cmd[cmd.index("--eraseattrib") + 1] == "note"
+
+
+def test_convert_input_paths_without_concurrent_futures(
+    commands, monkeypatch
+):
+    # Python 2 hosts don't have 'concurrent.futures'
+    monkeypatch.setattr(transcoding, "ThreadPoolExecutor", None)
+    input_paths = _input_paths(5)
+    transcoding.convert_input_paths_for_ffmpeg(
+        input_paths, "/dst", max_workers=None
+    )
+
+    assert [cmd[-1] for cmd in commands] == [
+        os.path.join("/dst", os.path.basename(path))
+        for path in input_paths
+    ]
+
+
+def test_convert_input_paths_failure(commands):
+    input_paths = _input_paths(10)
+    input_paths[6] = "/src/fail.1007.exr"
+    with pytest.raises(RuntimeError) as exc_info:
+        transcoding.convert_input_paths_for_ffmpeg(
+            input_paths, "/dst", max_workers=3
+        )
+
+    assert "/src/fail.1007.exr" in str(exc_info.value)
+    assert len(commands) < len(input_paths)
+
+
+def test_media_probe_cache(tmp_path):
+    filepath = tmp_path / "render.1001.exr"
+    filepath.write_bytes(b"data")
+    probe_cache = transcoding.MediaProbeCache(
+        max_items=1, db_path=str(tmp_path / "cache.sqlite"))
+
+    key = probe_cache.get_key("oiio", str(filepath))
+    assert probe_cache.get(key) is None
+    probe_cache.set(key, "<ImageSpec>")
+    assert probe_cache.get(key) == "<ImageSpec>"
+
+    # Output is loaded from database when is not in memory
+    other_key = probe_cache.get_key("ffprobe", str(filepath))
+    probe_cache.set(other_key, "{}")
+    assert probe_cache.get(key) == "<ImageSpec>"
+
+    # Changed file has different key
+    filepath.write_bytes(b"changed data")
+    assert probe_cache.get_key("oiio", str(filepath)) != key
+    assert probe_cache.get_key("oiio", str(tmp_path / "missing.exr")) is None
+
+
+def test_media_probe_cache_from_env(tmp_path, monkeypatch):
+    temp_dir = tmp_path / "op_transcoding_temp"
+    temp_dir.mkdir()
+    monkeypatch.setattr(
+        transcoding, "get_transcode_temp_directory", lambda: str(temp_dir))
+    monkeypatch.setattr(transcoding.atexit, "register", lambda *args, **kw: 0)
+
+    monkeypatch.setenv("OPENPYPE_MEDIA_PROBE_CACHE", "1")
+    probe_cache = transcoding.MediaProbeCache.from_env()
+    assert os.path.dirname(probe_cache._db_path) == str(temp_dir)
+
+    monkeypatch.delenv("OPENPYPE_MEDIA_PROBE_CACHE")
+    assert transcoding.MediaProbeCache.from_env()._db_path is None
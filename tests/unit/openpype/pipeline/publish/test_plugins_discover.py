@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cached discovery of publish plugins."""
+import os
+
+import pytest
+
+from openpype.pipeline.publish import lib
+
+PLUGIN_CONTENT = """import pyblish.api
+
+
+class CollectCached(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+    label = "{label}"
+"""
+
+
+def _write_plugin(directory, label):
+    path = directory / "collect_cached.py"
+    path.write_text(PLUGIN_CONTENT.format(label=label))
+    return path
+
+
+@pytest.fixture
+def plugins_dir(tmp_path):
+    lib.clear_publish_plugins_cache()
+    yield tmp_path
+    lib.clear_publish_plugins_cache()
+
+
+def _discover_plugin(path):
+    result = lib.publish_plugins_discover([str(path)])
+    assert str(path) in result.discover_durations
+    plugins = [
+        plugin
+        for plugin in result.plugins
+        if plugin.__name__ == "CollectCached"
+    ]
+    assert len(plugins) == 1
+    return plugins[0]
+
+
+def test_unchanged_files_are_not_imported(plugins_dir):
+    _write_plugin(plugins_dir, "Cached")
+    plugin = _discover_plugin(plugins_dir)
+
+    # Changes of class attributes are reverted on next discovery
+    plugin.label = "Changed"
+    plugin.active = False
+    plugin.enabled = False
+    cached_plugin = _discover_plugin(plugins_dir)
+    assert cached_plugin is plugin
+    assert plugin.label == "Cached"
+    assert plugin.active is True
+    assert "enabled" not in plugin.__dict__
+
+
+def test_changed_files_are_imported(plugins_dir):
+    path = _write_plugin(plugins_dir, "Cached")
+    plugin = _discover_plugin(plugins_dir)
+
+    _write_plugin(plugins_dir, "Changed")
+    file_stat = os.stat(str(path))
+    os.utime(str(path), (file_stat.st_atime, file_stat.st_mtime + 10))
+    new_plugin = _discover_plugin(plugins_dir)
+    assert new_plugin is not plugin
+    assert new_plugin.label == "Changed"
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Test suite for shared caches of Anatomy."""
+import copy
+import datetime
+
+import pytest
+
+from openpype.pipeline import anatomy as anatomy_module
+from openpype.pipeline.anatomy import Anatomy
+
+PROJECT_NAME = "test_project"
+
+
+@pytest.fixture
+def project_doc(monkeypatch):
+    doc = {
+        "_id": "project_id",
+        "type": "project",
+        "name": PROJECT_NAME,
+        "last_modified": datetime.datetime(2023, 1, 1),
+        "data": {"code": "test"},
+        "config": {
+            "roots": {"work": {"linux": "/mnt/work"}},
+            "templates": {
+                "work": {"folder": "{root[work]}/{project[name]}"}
+            },
+        },
+    }
+    queries = []
+
+    def _get_project(project_name, fields=None):
+        queries.append(fields)
+        output = copy.deepcopy(doc)
+        if fields:
+            output = {key: output[key] for key in fields}
+        return output
+
+    monkeypatch.setattr(anatomy_module, "get_project", _get_project)
+    monkeypatch.setattr(
+        Anatomy, "_get_site_root_overrides",
+        classmethod(lambda cls, project_name, site_name: None)
+    )
+    Anatomy.clear_cache()
+    yield doc, queries
+    Anatomy.clear_cache()
+
+
+def test_anatomy_data_are_shared(project_doc):
+    doc, queries = project_doc
+    anatomies = [Anatomy(PROJECT_NAME) for _ in range(5)]
+
+    assert queries == [None]
+    assert anatomies[0]._data is anatomies[-1]._data
+    assert Anatomy.get_cache_stats() == {
+        "project_hits": 4,
+        "project_misses": 1,
+        "data_hits": 4,
+        "data_misses": 1,
+    }
+
+    # Data are read-only but copies are mutable
+    with pytest.raises(TypeError):
+        anatomies[0]._data["roots"]["work"] = None
+    roots = anatomies[0]["roots"]
+    roots["work"]["linux"] = "/tmp"
+    assert anatomies[1]["roots"]["work"]["linux"] == "/mnt/work"
+
+
+def test_project_change_refreshes_cache(project_doc, monkeypatch):
+    doc, queries = project_doc
+    Anatomy(PROJECT_NAME)
+
+    # Cached document is validated after validation interval
+    monkeypatch.setattr(
+        anatomy_module.ProjectCacheItem, "validation_interval", 0)
+    Anatomy(PROJECT_NAME)
+    assert queries == [None, ["last_modified"]]
+
+    doc["last_modified"] = datetime.datetime(2023, 1, 2)
+    doc["config"]["roots"]["work"]["linux"] = "/mnt/new_work"
+    anatomy = Anatomy(PROJECT_NAME)
+    assert queries == [None, ["last_modified"], ["last_modified"], None]
+    assert anatomy["roots"]["work"]["linux"] == "/mnt/new_work"
+
+
+def test_direct_change_refreshes_cache_after_lifetime(
+    project_doc, monkeypatch
+):
+    doc, queries = project_doc
+    Anatomy(PROJECT_NAME)
+
+    # Change made directly in database does not update modification time
+    doc["config"]["roots"]["work"]["linux"] = "/mnt/new_work"
+    lifetime = anatomy_module.ProjectCacheItem.default_lifetime
+    now = anatomy_module.time.time()
+    monkeypatch.setattr(
+        anatomy_module.time, "time", lambda: now + lifetime + 1)
+
+    anatomy = Anatomy(PROJECT_NAME)
+    assert queries == [None, None]
+    assert anatomy["roots"]["work"]["linux"] == "/mnt/new_work"
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Test suite for filtering of scene containers."""
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client.entity_cache import invalidate_entity_cache
+from openpype.pipeline.load import utils
+from openpype.tests.containers_filter_performance import SyntheticProject
+
+PROJECT_NAME = "test_project"
+
+
+@pytest.fixture
+def project(monkeypatch):
+    synthetic_project = SyntheticProject(subsets_count=1000, versions_count=3)
+    for attr_name in (
+        "get_representations",
+        "get_versions",
+        "get_last_versions",
+        "get_newest_version_id",
+    ):
+        monkeypatch.setattr(
+            utils, attr_name, getattr(synthetic_project, attr_name))
+    utils.clear_containers_filter_cache()
+    yield synthetic_project
+    utils.clear_containers_filter_cache()
+
+
+def test_filter_synthetic_containers(project):
+    containers = project.create_containers(10000)
+    containers.append({"objectName": "invalid", "representation": ""})
+    containers.append({
+        "objectName": "missing",
+        "representation": "60a5f7e0e8b4a1b2c3d4e5f6"
+    })
+
+    result = utils.filter_containers(containers, PROJECT_NAME)
+    assert project.queries == 4
+    # Only last of 3 versions of each subset is latest
+    assert len(result.latest) == 3333
+    assert len(result.outdated) == 6667
+    assert [item["objectName"] for item in result.invalid] == ["invalid"]
+    assert [item["objectName"] for item in result.not_found] == ["missing"]
+
+    # Second filtering of same representations is cached, only newest
+    #   version is queried
+    cached_result = utils.filter_containers(containers, PROJECT_NAME)
+    assert project.queries == 5
+    assert cached_result == result
+
+
+def test_change_invalidates_cache(project):
+    containers = project.create_containers(100)
+    utils.filter_containers(containers, PROJECT_NAME)
+    invalidate_entity_cache(PROJECT_NAME, [])
+    utils.filter_containers(containers, PROJECT_NAME)
+    assert project.queries == 8
+
+    utils.filter_containers(containers, PROJECT_NAME, use_cache=False)
+    assert project.queries == 12
+
+
+def test_new_version_invalidates_cache(project):
+    # Container of last of 3 versions of first subset
+    containers = project.create_containers(3)[2:]
+    result = utils.filter_containers(containers, PROJECT_NAME)
+    assert len(result.latest) == 1
+
+    # Version published by other process
+    repre_doc = project.repre_docs[ObjectId(containers[0]["representation"])]
+    version_doc = project.version_docs[repre_doc["parent"]]
+    project.add_version(version_doc["parent"])
+
+    result = utils.filter_containers(containers, PROJECT_NAME)
+    assert len(result.outdated) == 1
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Test suite for lazy discovery of plugins."""
+import os
+
+import pytest
+
+from openpype.pipeline import plugin_discover
+from openpype.pipeline.plugin_discover import (
+    PluginDiscoverContext,
+    create_plugins_manifest,
+)
+
+# Paths of plugin files imported by tests
+IMPORTED = []
+
+
+class BasePlugin(object):
+    families = []
+    enabled = True
+
+    def __init__(self, context):
+        self.context = context
+
+    @classmethod
+    def is_compatible(cls, family):
+        return cls.enabled and family in cls.families
+
+
+PLUGIN_CONTENT = '''from {module} import BasePlugin, IMPORTED
+
+IMPORTED.append(__file__)
+
+
+class ModelPlugin(BasePlugin):
+    """Process models."""
+    families = ["model"]
+    label = "Model"
+
+    def process(self):
+        return "processed " + self.context
+
+
+class RigPlugin(ModelPlugin):
+    families = ["rig"]
+
+    @classmethod
+    def is_compatible(cls, family):
+        return family == "rig"
+'''
+
+
+@pytest.fixture
+def plugins_dir(tmp_path):
+    dirpath = tmp_path / "plugins"
+    dirpath.mkdir()
+    (dirpath / "model_plugin.py").write_text(
+        PLUGIN_CONTENT.format(module=__name__)
+    )
+    IMPORTED[:] = []
+    yield dirpath
+    IMPORTED[:] = []
+
+
+def _discover(dirpath):
+    context = PluginDiscoverContext()
+    context.register_plugin_path(BasePlugin, str(dirpath))
+    return context.discover(BasePlugin, lazy=True)
+
+
+def test_lazy_plugins_are_imported_on_use(plugins_dir):
+    plugins = {plugin.__name__: plugin for plugin in _discover(plugins_dir)}
+    assert set(plugins) == {"ModelPlugin", "RigPlugin"}
+    plugin = plugins["ModelPlugin"]
+    assert issubclass(plugin, BasePlugin)
+    assert issubclass(plugins["RigPlugin"], plugin)
+    assert plugin.__doc__ == "Process models."
+    assert plugin.label == "Model"
+    assert plugin.is_compatible("model")
+    assert hasattr(plugin, "process")
+    # Settings are applied to lazy class
+    plugins["RigPlugin"].enabled = False
+    assert not IMPORTED
+
+    # Method defined in file imports it
+    assert plugins["RigPlugin"].is_compatible("rig")
+    assert len(IMPORTED) == 1
+
+    obj = plugin("context")
+    assert isinstance(obj, plugin)
+    assert obj.process() == "processed context"
+    assert type(obj).enabled is True
+    assert plugins["RigPlugin"]("context").enabled is False
+    assert len(IMPORTED) == 1
+
+
+def test_changes_before_import_are_kept(plugins_dir):
+    plugin = {
+        plugin.__name__: plugin
+        for plugin in _discover(plugins_dir)
+    }["ModelPlugin"]
+    plugin.families.append("look")
+    plugin.label = "Changed"
+
+    obj = plugin("context")
+    assert type(obj).families == ["model", "look"]
+    assert type(obj).label == "Changed"
+
+    # Attributes of imported class are used
+    type(obj).label = "Imported"
+    assert plugin.label == "Imported"
+
+
+def test_changed_class_is_imported(plugins_dir):
+    path = plugins_dir / "model_plugin.py"
+    path.write_text(path.read_text() + '\nModelPlugin.families = ["look"]\n')
+
+    plugins = _discover(plugins_dir)
+    assert len(IMPORTED) == 1
+    plugin = {plugin.__name__: plugin for plugin in plugins}["ModelPlugin"]
+    assert plugin.families == ["look"]
+
+
+def test_precomputed_manifest(plugins_dir, monkeypatch):
+    manifest_path = create_plugins_manifest(str(plugins_dir))
+    assert os.path.exists(manifest_path)
+    assert not IMPORTED
+
+    def _describe(content):
+        raise AssertionError("Manifest was not used")
+
+    monkeypatch.setattr(plugin_discover, "describe_plugins_file", _describe)
+    plugins = _discover(plugins_dir)
+    assert len(plugins) == 2
+    assert not IMPORTED
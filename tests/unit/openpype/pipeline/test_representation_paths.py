@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Test suite for resolving of representation paths."""
+import os
+
+import pytest
+
+from openpype.pipeline.load import utils
+
+
+class FakeDbcon(object):
+    Session = {"AVALON_USER": "user", "AVALON_TASK": "modeling"}
+
+    def active_project(self):
+        return "test_project"
+
+
+@pytest.fixture
+def repre_docs(tmp_path, monkeypatch):
+    published = tmp_path / "test_project" / "sh010" / "v001"
+    published.mkdir(parents=True)
+    (published / "model.abc").write_bytes(b"")
+
+    project_doc = {
+        "name": "test_project",
+        "data": {"code": "test"},
+        "config": {"template": {
+            "publish": "{root}/{project[name]}/{asset}/v{version:0>3}/{subset}.{representation}"  # noqa: E501
+        }},
+    }
+    asset_doc = {"name": "sh010", "data": {"parents": []}}
+    subset_doc = {"name": "model"}
+    version_doc = {"name": 1}
+    parents = (version_doc, subset_doc, asset_doc, project_doc)
+
+    queries = []
+
+    def _get_representations_parents(project_name, representations):
+        queries.append([repre["_id"] for repre in representations])
+        return {repre["_id"]: parents for repre in representations}
+
+    monkeypatch.setattr(
+        utils, "get_representations_parents", _get_representations_parents)
+    monkeypatch.setattr(
+        utils,
+        "get_representation_parents",
+        lambda project_name, repre: _get_representations_parents(
+            project_name, [repre])[repre["_id"]]
+    )
+    docs = [
+        {
+            "_id": "template",
+            "name": "abc",
+            "data": {
+                "template": "{root}/{project[name]}/{asset}/v001/model.abc"
+            },
+            "context": {"project": {"name": "test_project"}, "asset": "sh010"},
+        },
+        {"_id": "config", "name": "abc", "data": {}},
+        {"_id": "missing", "name": "ma", "data": {}},
+    ]
+    return docs, queries, str(tmp_path)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_paths_match_single_resolution(repre_docs, max_workers):
+    docs, queries, root = repre_docs
+    dbcon = FakeDbcon()
+    paths = utils.get_representations_paths(
+        docs, root=root, dbcon=dbcon, max_workers=max_workers
+    )
+    # Parents are queried once for all representations without template
+    assert queries == [["config", "missing"]]
+
+    expected_path = os.path.join(root, "test_project", "sh010", "v001")
+    assert paths["template"] == os.path.join(expected_path, "model.abc")
+    assert paths["config"] == os.path.join(expected_path, "model.abc")
+    for doc in docs:
+        assert paths[doc["_id"]] == utils.get_representation_path(
+            doc, root=root, dbcon=dbcon
+        )
+
+
+def test_paths_exist_without_concurrent_futures(tmp_path, monkeypatch):
+    # Python 2 hosts don't have 'concurrent.futures'
+    monkeypatch.setattr(utils, "ThreadPoolExecutor", None)
+    existing = tmp_path / "model.abc"
+    existing.write_bytes(b"")
+    missing = str(tmp_path / "missing.abc")
+
+    assert utils._paths_exist([str(existing), missing], max_workers=8) == {
+        str(existing): True,
+        missing: False,
+    }
@@ -27,3 +27,45 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def _output_item(input_args, video_filters, output_path):
+    return {
+        "args_parts": {
+            "input_args": input_args,
+            "video_filters": video_filters,
+            "audio_filters": [],
+            "output_args": ["-y", output_path],
+            "with_audio_inputs": False,
+            "with_source_audio": not output_path.endswith(".png"),
+        }
+    }
+
+
+def test_single_pass_outputs():
+    plugin = ExtractReview()
+    plugin.ffmpeg_path = "ffmpeg"
+    input_args = ["-i", "input.mov"]
+    items = [
+        _output_item(input_args, ["scale=1920:1080"], "out_h264.mp4"),
+        _output_item(input_args, [], "out.png"),
+        _output_item(["-ss", "1", "-i", "input.mov"], [], "out_trim.mp4"),
+    ]
+
+    groups = plugin._group_output_items(items)
+    assert [len(group) for group in groups] == [1, 1, 1]
+
+    plugin.single_pass_outputs = True
+    groups = plugin._group_output_items(items)
+    assert [len(group) for group in groups] == [2, 1]
+
+    ret = plugin.single_pass_full_args(
+        input_args, [item["args_parts"] for item in groups[0]]
+    )
+    assert ret == [
+        "ffmpeg", "-i", "input.mov",
+        "-filter_complex",
+        '"[0:v]split=2[s0][s1];[s0]scale=1920:1080[v0];[s1]null[v1]"',
+        "-map", '"[v0]"', "-map", "0:a?", "-y", "out_h264.mp4",
+        "-map", '"[v1]"', "-y", "out.png",
+    ]
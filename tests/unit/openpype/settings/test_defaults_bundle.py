@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Test suite for bundle of default settings."""
+import os
+import json
+
+import pytest
+
+from openpype.settings import lib
+
+
+@pytest.fixture
+def defaults_dir(tmp_path, monkeypatch):
+    defaults_dir = tmp_path / "defaults"
+    (defaults_dir / "project_settings").mkdir(parents=True)
+    (defaults_dir / "project_settings" / "global.json").write_text(
+        json.dumps({"publish": {"enabled": True}})
+    )
+    (defaults_dir / "system_settings").mkdir()
+    (defaults_dir / "system_settings" / "general.json").write_text(
+        json.dumps({"studio_name": ""})
+    )
+    monkeypatch.setattr(lib, "DEFAULTS_DIR", str(defaults_dir))
+    monkeypatch.setattr(lib, "DEFAULTS_BUNDLE_DIR", str(tmp_path / "cache"))
+    return defaults_dir
+
+
+def test_defaults_loaded_from_bundle(defaults_dir, monkeypatch):
+    expected = lib.load_jsons_from_dir(str(defaults_dir))
+    assert lib.load_openpype_default_settings() == expected
+    bundle_path = lib._get_defaults_bundle_path()
+    assert os.path.dirname(bundle_path) == lib.DEFAULTS_BUNDLE_DIR
+    assert os.path.exists(bundle_path)
+    assert not os.path.exists(str(defaults_dir.parent / "defaults.bundle"))
+
+    def _load_jsons_from_dir(*args, **kwargs):
+        raise AssertionError("Defaults were not loaded from bundle")
+
+    with monkeypatch.context() as context:
+        context.setattr(lib, "load_jsons_from_dir", _load_jsons_from_dir)
+        assert lib.load_openpype_default_settings() == expected
+
+
+def test_outdated_bundle_is_recreated(defaults_dir):
+    lib.load_openpype_default_settings()
+
+    (defaults_dir / "system_settings" / "general.json").write_text(
+        json.dumps({"studio_name": "Studio name"})
+    )
+    defaults = lib.load_openpype_default_settings()
+    assert defaults["system_settings"]["general"]["studio_name"] == (
+        "Studio name"
+    )
+
+
+def test_corrupted_bundle_is_ignored(defaults_dir):
+    os.makedirs(lib.DEFAULTS_BUNDLE_DIR)
+    with open(lib._get_defaults_bundle_path(), "wb") as stream:
+        stream.write(b"corrupted")
+
+    defaults = lib.load_openpype_default_settings()
+    assert defaults["project_settings"]["global"]["publish"]["enabled"]
+
+
+def test_fingerprint_ignores_subsecond_mtime(defaults_dir):
+    fingerprint = lib._get_defaults_fingerprint(str(defaults_dir))
+    path = str(defaults_dir / "system_settings" / "general.json")
+    mtime = int(os.stat(path).st_mtime)
+    os.utime(path, (mtime + 0.25, mtime + 0.25))
+    assert lib._get_defaults_fingerprint(str(defaults_dir)) == fingerprint
+
+    os.utime(path, (mtime + 1, mtime + 1))
+    assert lib._get_defaults_fingerprint(str(defaults_dir)) != fingerprint
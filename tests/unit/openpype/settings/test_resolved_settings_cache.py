@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cache of resolved settings."""
+import pytest
+
+from openpype.settings import lib
+
+
+class FakeSettingsHandler(object):
+    def __init__(self):
+        self.token = "token"
+        self.calls = 0
+
+    def get_change_token(self):
+        return self.token
+
+    def get_studio_system_settings_overrides(self, return_version):
+        self.calls += 1
+        return {"general": {"studio_name": "Studio"}}
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    fake_handler = FakeSettingsHandler()
+    monkeypatch.setattr(lib, "_SETTINGS_HANDLER", fake_handler)
+    monkeypatch.setattr(
+        lib,
+        "get_default_settings",
+        lambda: {lib.SYSTEM_SETTINGS_KEY: {"general": {"studio_name": ""}}}
+    )
+    lib.clear_resolved_settings_cache()
+    yield fake_handler
+    lib.clear_resolved_settings_cache()
+
+
+def test_settings_are_resolved_once(handler):
+    for _ in range(5):
+        settings = lib.get_system_settings(exclude_locals=True)
+        assert settings == {"general": {"studio_name": "Studio"}}
+        # Returned values are copies
+        settings["general"]["studio_name"] = "Changed"
+
+    assert handler.calls == 1
+
+
+def test_change_token_invalidates_cache(handler):
+    lib.get_system_settings(exclude_locals=True)
+    handler.token = "new_token"
+    lib.get_system_settings(exclude_locals=True)
+    lib.get_system_settings(exclude_locals=True)
+
+    assert handler.calls == 2
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Test suite for batching of calls to Adobe extensions."""
+import pytest
+
+from openpype.tools.adobe_webserver.batch import BatchCallError, StubBatch
+
+
+class FakeServer(object):
+    def call(self, func):
+        return func
+
+
+class FakeClient(object):
+    def __init__(self, batch_supported=True):
+        self.batch_supported = batch_supported
+        self.messages = []
+
+    def call(self, method, **params):
+        self.messages.append(method)
+        if method != "Host.batch":
+            return self._process(method, params)
+
+        if not self.batch_supported:
+            raise ValueError("Route not found")
+        results = []
+        for call in params["calls"]:
+            try:
+                results.append(
+                    {"result": self._process(call["method"], call["params"])}
+                )
+            except ValueError as exc:
+                results.append({"error": str(exc)})
+        return results
+
+    def _process(self, method, params):
+        if method == "Host.fail":
+            raise ValueError("failed")
+        return params.get("value")
+
+
+@pytest.fixture(autouse=True)
+def clear_unsupported_routes():
+    StubBatch._unsupported_routes.clear()
+    yield
+    StubBatch._unsupported_routes.clear()
+
+
+def test_calls_are_sent_together():
+    client = FakeClient()
+    batch = StubBatch(FakeServer(), client, "Host.batch")
+    calls = [batch.add("Host.set", value=idx) for idx in range(5)]
+    assert client.messages == []
+
+    batch.flush()
+    assert client.messages == ["Host.batch"]
+    assert batch.results == list(range(5))
+    assert [call.result for call in calls] == list(range(5))
+
+    # Nothing is sent when there are no pending calls
+    batch.flush()
+    assert client.messages == ["Host.batch"]
+
+
+def test_failed_calls_raise_error():
+    batch = StubBatch(FakeServer(), FakeClient(), "Host.batch")
+    batch.add("Host.set", value=1)
+    batch.add("Host.fail")
+    batch.add("Host.set", value=2)
+
+    with pytest.raises(BatchCallError) as exc_info:
+        batch.flush()
+
+    assert [call.method for call in exc_info.value.failed_calls] == [
+        "Host.fail"]
+    assert batch.results == [1, None, 2]
+
+
+def test_fallback_without_batch_route():
+    client = FakeClient(batch_supported=False)
+    batch = StubBatch(FakeServer(), client, "Host.batch")
+    batch.add("Host.set", value=1)
+    batch.add("Host.set", value=2)
+    batch.flush()
+
+    assert batch.results == [1, 2]
+    assert client.messages == ["Host.batch", "Host.set", "Host.set"]
+
+    # Unsupported route is remembered
+    batch = StubBatch(FakeServer(), client, "Host.batch")
+    batch.add("Host.set", value=3)
+    batch.add("Host.set", value=4)
+    batch.flush()
+    assert client.messages[3:] == ["Host.set", "Host.set"]